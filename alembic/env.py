@@ -12,6 +12,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from app.core.config import settings
 from app.db.session import Base
 import app.models.food_nutrition 
+import app.models.food_nutrition_change
 
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,31 @@
+"""Add content_hash to food_nutritions
+
+Revision ID: 5d2a8f4c1b7e
+Revises: ceceac37d0f1
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a8f4c1b7e'
+down_revision: Union[str, None] = 'ceceac37d0f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ## 기존 행은 NULL로 남겨두고, 다음 upsert 적재 시 변경된 행으로 간주되어 해시가 채워집니다.
+    with op.batch_alter_table('food_nutritions') as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('food_nutritions') as batch_op:
+        batch_op.drop_column('content_hash')
@@ -0,0 +1,33 @@
+"""Add composite and covering indexes to food_nutritions
+
+Revision ID: 8b3e1f6a9c2d
+Revises: 5d2a8f4c1b7e
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b3e1f6a9c2d'
+down_revision: Union[str, None] = '5d2a8f4c1b7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ## research_year + maker_name 필터 목록/건수 조회 (SQLite 보조 인덱스는 rowid(id)를 포함하므로 id 순 정렬도 인덱스로 처리)
+    op.create_index('ix_food_nutritions_research_year_maker_name', 'food_nutritions', ['research_year', 'maker_name'], unique=False)
+    ## 적재 스크립트의 변경 감지 조회(food_cd -> id, content_hash)를 테이블 접근 없이 처리하는 커버링 인덱스
+    op.create_index('ix_food_nutritions_food_cd_content_hash', 'food_nutritions', ['food_cd', 'content_hash'], unique=False)
+    ## 쿼리 플래너가 인덱스 선택도를 알 수 있도록 통계 갱신
+    op.execute('ANALYZE food_nutritions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_food_nutritions_food_cd_content_hash', table_name='food_nutritions')
+    op.drop_index('ix_food_nutritions_research_year_maker_name', table_name='food_nutritions')
@@ -0,0 +1,37 @@
+"""Create food_nutrition_changes table for the change feed
+
+Revision ID: c4f7a2d9e1b3
+Revises: 8b3e1f6a9c2d
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f7a2d9e1b3'
+down_revision: Union[str, None] = '8b3e1f6a9c2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ## 변경 피드(GET /food-nutritions/changes)용 로그. seq는 AUTOINCREMENT로 재사용되지 않음
+    op.create_table('food_nutrition_changes',
+    sa.Column('seq', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('food_nutrition_id', sa.Integer(), nullable=False),
+    sa.Column('food_cd', sa.String(length=50), nullable=False),
+    sa.Column('operation', sa.String(length=10), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('seq'),
+    sqlite_autoincrement=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('food_nutrition_changes')
@@ -0,0 +1,58 @@
+"""Add per-100g and per-100kcal normalized nutrient columns to food_nutritions
+
+Revision ID: e9a3b5c7d2f4
+Revises: c4f7a2d9e1b3
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a3b5c7d2f4'
+down_revision: Union[str, None] = 'c4f7a2d9e1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+## 마이그레이션은 작성 시점의 스키마를 고정하기 위해 app 모듈을 import하지 않고 필드 목록을 그대로 적음
+NUTRIENT_FIELDS = (
+    'calorie', 'carbohydrate', 'protein', 'province', 'sugars',
+    'salt', 'cholesterol', 'saturated_fatty_acids', 'trans_fat',
+)
+PER_100G_COLUMNS = {f'{field}_per_100g': (field, 'serving_size') for field in NUTRIENT_FIELDS}
+PER_100KCAL_COLUMNS = {f'{field}_per_100kcal': (field, 'calorie') for field in NUTRIENT_FIELDS if field != 'calorie'}
+
+
+def _normalized_sql(source: str, base: str) -> str:
+    ## app.core.nutrition_calculator.normalize_nutrient_values와 같은 계산 ("1g 미만"(-1.0)은 0, 기준값이 없거나 0 이하면 NULL)
+    return f'CASE WHEN {base} > 0 THEN CASE WHEN {source} = -1.0 THEN 0.0 ELSE {source} * 100.0 / {base} END END'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('food_nutritions') as batch_op:
+        for column in (*PER_100G_COLUMNS, *PER_100KCAL_COLUMNS):
+            batch_op.add_column(sa.Column(column, sa.Float(), nullable=True))
+    ## range/sort에 쓰이므로 정규화 컬럼마다 인덱스 생성 (전체 스캔 + 임시 B-tree 정렬 방지)
+    for column in (*PER_100G_COLUMNS, *PER_100KCAL_COLUMNS):
+        op.create_index(f'ix_food_nutritions_{column}', 'food_nutritions', [column], unique=False)
+
+    ## 기존 행 백필
+    assignments = ', '.join(
+        f'{column} = {_normalized_sql(source, base)}'
+        for column, (source, base) in {**PER_100G_COLUMNS, **PER_100KCAL_COLUMNS}.items()
+    )
+    op.execute(f'UPDATE food_nutritions SET {assignments}')
+    op.execute('ANALYZE food_nutritions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in (*PER_100G_COLUMNS, *PER_100KCAL_COLUMNS):
+        op.drop_index(f'ix_food_nutritions_{column}', table_name='food_nutritions')
+    with op.batch_alter_table('food_nutritions') as batch_op:
+        for column in (*PER_100G_COLUMNS, *PER_100KCAL_COLUMNS):
+            batch_op.drop_column(column)
@@ -1,81 +1,249 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+from pydantic_core import to_json
 
 
 from app.schemas.food_nutrition import (
     FoodNutrition,
     FoodNutritionCreate,
     FoodNutritionUpdate,
-    FoodNutritionSearchResponse
+    FoodNutritionUpsert,
+    FoodNutritionSearchResponse,
+    FoodNutritionSearchProfileResponse,
+    FoodNutritionSearchParams,
+    FoodNutritionBatchSearchResult,
+    FoodNutritionCountResponse,
+    FoodNutritionChangeFeedResponse,
+    FoodNutritionBulkUpdate,
+    FoodNutritionBulkOperationResponse,
+    FOOD_NUTRITION_FIELDS,
+    NutritionCalculationRequest,
+    NutritionCalculationResponse,
+    parse_fields_param,
+    parse_sort_param,
+    parse_range_params,
+    get_partial_food_nutrition_schema,
+    get_partial_food_nutrition_list_adapter
 )
 
 from app.repositories import food_nutrition_repository
-from app.search import get_es_client, search_food_nutritions_in_es 
+from app.search import (
+    get_es_client,
+    is_es_ready,
+    search_food_nutritions_page_in_es,
+    count_food_nutritions_in_es,
+    profile_food_nutritions_search_in_es,
+    msearch_food_nutritions_in_es,
+    ESOverloadedError,
+    SEARCH_BACKEND_SQLITE,
+    plan_search_backend,
+    search_backend_counter
+)
 from elasticsearch import Elasticsearch
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.core.deadline import DeadlineExceededError
+from app.core.nutrition_calculator import NUTRIENT_FIELDS, NutritionCalculationError, calculate_meals
+from app.db.session import get_db, get_read_db
 
 router = APIRouter()
 
+def get_ready_es_client() -> Elasticsearch:
+    ## 백그라운드 초기화가 끝나기 전에는 연결을 기다리지 않고 바로 503 반환
+    if not is_es_ready():
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="검색 서비스가 아직 준비되지 않았습니다. 잠시 후 다시 시도해주세요.")
+    try:
+        return get_es_client()
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="검색 서비스에 연결할 수 없습니다. 잠시 후 다시 시도해주세요.")
+
+def get_optional_es_client() -> Optional[Elasticsearch]:
+    ## 검색 라우터가 SQLite로 보내는 요청은 ES 상태와 무관하게 처리되어야 하므로 503 대신 None 반환
+    if not is_es_ready():
+        return None
+    try:
+        return get_es_client()
+    except Exception:
+        return None
+
+def get_requested_fields(
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (콤마 구분, 예: id,food_name,calorie). 생략 시 전체 필드")
+) -> Optional[Tuple[str, ...]]:
+    try:
+        return parse_fields_param(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+def get_requested_sort(
+    sort: Optional[str] = Query(
+        None, description="정렬할 정규화 영양성분 (예: salt_per_100g 오름차순, -protein_per_100kcal 내림차순). 값이 없는 항목은 제외"
+    )
+) -> Optional[Tuple[str, bool]]:
+    try:
+        return parse_sort_param(sort)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+def get_requested_ranges(
+    range_params: Optional[List[str]] = Query(
+        None, alias="range", description="정규화 영양성분 범위 조건 `필드:최솟값:최댓값` (경계 생략 가능, 여러 번 지정하면 AND. 예: salt_per_100g::120)"
+    )
+) -> Tuple[Tuple[str, Optional[float], Optional[float]], ...]:
+    try:
+        return parse_range_params(range_params)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+def _partial_list_response(rows: List[Dict[str, Any]], fields: Tuple[str, ...]) -> Response:
+    ## 선택한 필드만 가진 동적 스키마로 직렬화 (전체 응답 스키마 검증을 거치지 않음)
+    adapter = get_partial_food_nutrition_list_adapter(fields)
+    return Response(content=adapter.dump_json(adapter.validate_python(rows)), media_type="application/json")
+
+def _rows_response(rows: Sequence[Tuple[Any, ...]], fields: Optional[Tuple[str, ...]]) -> Response:
+    ## Core SELECT 결과(Row)를 ORM/pydantic 객체 없이 바로 JSON으로 직렬화 (DB 컬럼 타입이 응답 스키마와 같음)
+    keys = fields or FOOD_NUTRITION_FIELDS
+    return Response(content=to_json([dict(zip(keys, row)) for row in rows]), media_type="application/json")
+
+def _resolve_track_total_hits(mode: Optional[str]) -> Union[bool, int]:
+    mode = mode or settings.ES_DEFAULT_TRACK_TOTAL_HITS
+    if mode == "exact":
+        return True
+    if mode == "capped":
+        return settings.ES_TRACK_TOTAL_HITS_CAP
+    return False
+
+def _search_food_nutritions_in_db(
+    db: Session,
+    research_year: Optional[str],
+    food_cd: Optional[str],
+    skip: int,
+    limit: int,
+    fields: Optional[Tuple[str, ...]],
+    track_total_hits: Optional[str],
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = (),
+    sort: Optional[Tuple[str, bool]] = None
+) -> Response:
+    headers = {"X-Search-Backend": SEARCH_BACKEND_SQLITE}
+    filters = {"research_year": research_year, "food_cd": food_cd, "ranges": ranges, "sort": sort}
+    if _resolve_track_total_hits(track_total_hits) is not False:
+        ## SQLite는 count(*)가 저렴하므로 capped 요청도 정확한 건수를 반환
+        count = food_nutrition_repository.count_food_nutritions(db=db, **filters)
+        headers.update({"X-Total-Count": str(count), "X-Total-Count-Relation": "eq"})
+    rows = food_nutrition_repository.get_food_nutrition_rows(db=db, skip=skip, limit=limit, fields=fields, **filters)
+    rows_response = _rows_response(rows, fields)
+    rows_response.headers.update(headers)
+    return rows_response
+
 @router.post("/", response_model=FoodNutrition, status_code=status.HTTP_201_CREATED, summary="새로운 음식 영양 정보 생성")
-async def create_new_food_nutrition(
+def create_new_food_nutrition(
     food_nutrition_in: FoodNutritionCreate,
     db: Session = Depends(get_db)
 ):
-    db_food_nutrition_with_food_cd = food_nutrition_repository.get_food_nutrition_by_food_cd(db, food_cd=food_nutrition_in.food_cd)
-    if db_food_nutrition_with_food_cd:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"FoodNutrition with food_cd '{food_nutrition_in.food_cd}' already exists."
-        )
-    created_food_nutrition = food_nutrition_repository.create_food_nutrition(db=db, food_nutrition=food_nutrition_in)
+    try:
+        created_food_nutrition = food_nutrition_repository.create_food_nutrition(db=db, food_nutrition=food_nutrition_in)
+    except food_nutrition_repository.DuplicateFoodCdError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     return created_food_nutrition
 
+@router.get("/count", response_model=FoodNutritionCountResponse, summary="음식 영양 정보 건수 조회")
+def count_all_food_nutritions(
+    research_year: Optional[str] = Query(None, description="조사년도 (정확히 일치)"),
+    maker_name: Optional[str] = Query(None, description="지역/제조사 (정확히 일치)"),
+    food_code: Optional[str] = Query(None, description="식품코드"),
+    ranges: Tuple[Tuple[str, Optional[float], Optional[float]], ...] = Depends(get_requested_ranges),
+    db: Session = Depends(get_read_db)
+):
+    """목록 조회(`GET /`)와 같은 필터로 SQLite에서 `SELECT count(*)`만 수행합니다."""
+    count = food_nutrition_repository.count_food_nutritions(
+        db=db, research_year=research_year, maker_name=maker_name, food_cd=food_code, ranges=ranges
+    )
+    return {"count": count}
+
+@router.get("/changes", response_model=FoodNutritionChangeFeedResponse, summary="음식 영양 정보 변경 피드 조회")
+def read_food_nutrition_changes(
+    since: int = Query(0, ge=0, description="이 seq 이후의 변경만 반환 (처음 동기화는 0)"),
+    limit: int = Query(100, ge=1, le=1000, description="반환할 최대 변경 수"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    생성/수정/삭제를 기록한 변경 로그를 seq 순서대로 반환합니다.
+    - `upsert`는 현재 행 전체(`data`)를, `delete`는 tombstone(`id`, `food_cd`)만 포함합니다.
+    - 응답의 `next_since`를 다음 요청의 `since`로 넘기고, `has_more`가 false가 될 때까지 반복하면 미러가 최신 상태가 됩니다.
+    """
+    return food_nutrition_repository.get_food_nutrition_changes(db=db, since=since, limit=limit)
+
 @router.get("/{food_nutrition_id}", response_model=FoodNutrition, summary="특정 음식 영양 정보 상세 조회")
-async def read_single_food_nutrition(
+def read_single_food_nutrition(
     food_nutrition_id: int,
-    db: Session = Depends(get_db)
+    fields: Optional[Tuple[str, ...]] = Depends(get_requested_fields),
+    db: Session = Depends(get_read_db)
 ):
-    db_food_nutrition = food_nutrition_repository.get_food_nutrition(db=db, food_nutrition_id=food_nutrition_id)
+    if fields:
+        row = food_nutrition_repository.get_food_nutrition_columns(db=db, food_nutrition_id=food_nutrition_id, fields=fields)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"FoodNutrition with id {food_nutrition_id} not found")
+        partial_schema = get_partial_food_nutrition_schema(fields)
+        return Response(content=partial_schema.model_validate(row).model_dump_json(), media_type="application/json")
+
+    db_food_nutrition = food_nutrition_repository.get_food_nutrition_coalesced(db=db, food_nutrition_id=food_nutrition_id)
     if db_food_nutrition is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"FoodNutrition with id {food_nutrition_id} not found")
     return db_food_nutrition
 
 @router.get("/", response_model=List[FoodNutrition], summary="음식 영양 정보 목록 조회")
-async def read_all_food_nutritions(
+def read_all_food_nutritions(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    research_year: Optional[str] = Query(None, description="조사년도 (정확히 일치)"),
+    maker_name: Optional[str] = Query(None, description="지역/제조사 (정확히 일치)"),
+    food_code: Optional[str] = Query(None, description="식품코드"),
+    fields: Optional[Tuple[str, ...]] = Depends(get_requested_fields),
+    sort: Optional[Tuple[str, bool]] = Depends(get_requested_sort),
+    ranges: Tuple[Tuple[str, Optional[float], Optional[float]], ...] = Depends(get_requested_ranges),
+    db: Session = Depends(get_read_db)
 ):
-    food_nutritions = food_nutrition_repository.get_food_nutritions(db=db, skip=skip, limit=limit)
-    return food_nutritions
+    """
+    음식 영양 정보 목록을 id 순으로 반환합니다.
+    - `range`로 100g당/100kcal당 영양성분 범위를, `sort`로 그 값의 정렬 순서를 지정할 수 있습니다 (컬럼 인덱스 사용).
+    """
+    rows = food_nutrition_repository.get_food_nutrition_rows(
+        db=db, skip=skip, limit=limit, research_year=research_year, maker_name=maker_name, food_cd=food_code,
+        fields=fields, sort=sort, ranges=ranges
+    )
+    return _rows_response(rows, fields)
 
 @router.put("/{food_nutrition_id}", response_model=FoodNutrition, summary="특정 음식 영양 정보 수정")
-async def update_existing_food_nutrition(
+def update_existing_food_nutrition(
     food_nutrition_id: int,
     food_nutrition_in: FoodNutritionUpdate,
     db: Session = Depends(get_db)
 ):
-    db_food_nutrition = food_nutrition_repository.get_food_nutrition(db, food_nutrition_id=food_nutrition_id)
-    if db_food_nutrition is None:
+    try:
+        updated_food_nutrition = food_nutrition_repository.update_food_nutrition(
+            db=db, food_nutrition_id=food_nutrition_id, food_nutrition_update=food_nutrition_in
+        )
+    except food_nutrition_repository.DuplicateFoodCdError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if updated_food_nutrition is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"FoodNutrition with id {food_nutrition_id} not found to update")
-
-    if food_nutrition_in.food_cd and food_nutrition_in.food_cd != db_food_nutrition.food_cd:
-        existing_food_cd = food_nutrition_repository.get_food_nutrition_by_food_cd(db, food_cd=food_nutrition_in.food_cd)
-        if existing_food_cd and existing_food_cd.id != food_nutrition_id : 
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"FoodNutrition with food_cd '{food_nutrition_in.food_cd}' already exists."
-            )
-
-    updated_food_nutrition = food_nutrition_repository.update_food_nutrition(
-        db=db, food_nutrition_id=food_nutrition_id, food_nutrition_update=food_nutrition_in
-    )
     return updated_food_nutrition
 
+@router.put("/by-code/{food_cd}", response_model=FoodNutrition, summary="식품코드 기준 음식 영양 정보 생성 또는 교체 (upsert)")
+def upsert_food_nutrition_by_food_cd(
+    food_cd: str,
+    food_nutrition_in: FoodNutritionUpsert,
+    db: Session = Depends(get_db)
+):
+    """
+    `INSERT ... ON CONFLICT(food_cd) DO UPDATE ... RETURNING` 한 문장으로 처리합니다.
+    - 식품코드가 없으면 생성하고, 있으면 본문의 값으로 모든 필드를 교체합니다 (생략한 필드는 null).
+    """
+    return food_nutrition_repository.upsert_food_nutrition_by_food_cd(db=db, food_cd=food_cd, food_nutrition=food_nutrition_in)
+
 @router.delete("/{food_nutrition_id}", response_model=FoodNutrition, summary="특정 음식 영양 정보 삭제")
-async def delete_single_food_nutrition(
+def delete_single_food_nutrition(
     food_nutrition_id: int,
     db: Session = Depends(get_db)
 ):
@@ -88,37 +256,279 @@ async def delete_single_food_nutrition(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"FoodNutrition with id {food_nutrition_id} not found to delete")
     return deleted_food_nutrition
 
+@router.patch("/", response_model=FoodNutritionBulkOperationResponse, summary="필터 조건으로 음식 영양 정보 일괄 수정")
+def bulk_update_food_nutritions(
+    food_nutrition_in: FoodNutritionBulkUpdate,
+    research_year: Optional[str] = Query(None, description="조사년도 (정확히 일치)"),
+    maker_name: Optional[str] = Query(None, description="지역/제조사 (정확히 일치)"),
+    ref_name: Optional[str] = Query(None, description="자료출처 (정확히 일치)"),
+    food_code: Optional[str] = Query(None, description="식품코드"),
+    db: Session = Depends(get_db)
+):
+    """
+    필터에 맞는 모든 행을 하나의 UPDATE 문으로 수정하고 Elasticsearch에는 `_update_by_query` 한 번으로 반영합니다.
+    - 필터는 하나 이상 지정해야 합니다. `food_cd`, `food_name`은 일괄 수정할 수 없습니다.
+    """
+    updates = food_nutrition_in.model_dump(exclude_unset=True)
+    if not updates:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="수정할 필드가 없습니다.")
+    try:
+        return food_nutrition_repository.bulk_update_food_nutritions(
+            db=db, updates=updates, research_year=research_year, maker_name=maker_name, ref_name=ref_name, food_cd=food_code
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.delete("/", response_model=FoodNutritionBulkOperationResponse, summary="필터 조건으로 음식 영양 정보 일괄 삭제")
+def bulk_delete_food_nutritions(
+    research_year: Optional[str] = Query(None, description="조사년도 (정확히 일치)"),
+    maker_name: Optional[str] = Query(None, description="지역/제조사 (정확히 일치)"),
+    ref_name: Optional[str] = Query(None, description="자료출처 (정확히 일치)"),
+    food_code: Optional[str] = Query(None, description="식품코드"),
+    db: Session = Depends(get_db)
+):
+    """필터에 맞는 모든 행을 하나의 DELETE 문으로 삭제하고 Elasticsearch에는 `_delete_by_query` 한 번으로 반영합니다 (필터 필수)."""
+    try:
+        return food_nutrition_repository.bulk_delete_food_nutritions(
+            db=db, research_year=research_year, maker_name=maker_name, ref_name=ref_name, food_cd=food_code
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 
-@router.get("/search/", response_model=List[FoodNutritionSearchResponse], summary="음식 영양 정보 검색")
-async def search_food_nutritions_via_es(
+@router.get("/search/", response_model=Union[List[FoodNutritionSearchResponse], FoodNutritionSearchProfileResponse], summary="음식 영양 정보 검색")
+def search_food_nutritions_via_es(
+    response: Response,
     food_name: Optional[str] = Query(None, description="검색할 식품 이름 (부분 일치)"),
     research_year: Optional[str] = Query(None, description="조사년도 (YYYY)"),
     maker_name: Optional[str] = Query(None, description="지역/제조사 (부분 일치)"),
     food_code: Optional[str] = Query(None, description="식품코드"),
     skip: int = Query(0, ge=0, description="건너뛸 결과 수"),
     limit: int = Query(10, ge=1, le=100, description="반환할 최대 결과 수"),
-    es: Elasticsearch = Depends(get_es_client)
+    profile: bool = Query(False, description="true이면 결과와 함께 ES took(ms)과 profile 상세 정보를 반환"),
+    track_total_hits: Optional[Literal["exact", "capped", "off"]] = Query(
+        None, description="전체 건수 계산 방식 (exact, capped, off). 계산 시 X-Total-Count 헤더로 반환"
+    ),
+    mode: Literal["standard", "chosung", "fuzzy"] = Query(
+        "standard", description="식품 이름 검색 모드 (standard, chosung: 초성 검색, fuzzy: 자모 오타 허용)"
+    ),
+    fields: Optional[Tuple[str, ...]] = Depends(get_requested_fields),
+    sort: Optional[Tuple[str, bool]] = Depends(get_requested_sort),
+    ranges: Tuple[Tuple[str, Optional[float], Optional[float]], ...] = Depends(get_requested_ranges),
+    db: Session = Depends(get_read_db),
+    es: Optional[Elasticsearch] = Depends(get_optional_es_client)
 ):
     """
-    주어진 조건에 따라 Elasticsearch에서 음식 영양 정보를 검색합니다.
+    주어진 조건에 따라 음식 영양 정보를 검색합니다.
     - 모든 검색 조건은 AND로 조합됩니다.
+    - `food_code`, `research_year`처럼 정확히 일치하는 조건만 있으면 SQLite 인덱스로, 그 외에는 Elasticsearch로 처리하며 `X-Search-Backend` 헤더로 알려줍니다.
     - `food_name`과 `maker_name`은 부분 일치 검색을 지원합니다.
     - `research_year`와 `food_code`는 정확히 일치하는 값을 찾습니다.
+    - `mode=chosung`이면 `ㄱㅊㅉㄱ` 같은 초성 검색어로, `mode=fuzzy`이면 자모 단위 오타를 허용해 `food_name`을 찾습니다.
+    - `profile=true`이면 `{results, took, profile}` 형태로 응답합니다.
+    - `fields`를 지정하면 ES `_source`와 응답 모두 해당 필드만 포함합니다.
+    - `track_total_hits`가 `exact` 또는 `capped`이면 `X-Total-Count`, `X-Total-Count-Relation`(eq/gte) 헤더에 전체 건수를 담습니다.
+    - `range`(예: `salt_per_100g::120`)와 `sort`(예: `-protein_per_100g`)는 미리 계산한 100g당/100kcal당 값에 적용되며, `sort`를 지정하면 관련도 대신 그 값 순으로 정렬합니다.
     """
+    backend = plan_search_backend(
+        food_name=food_name, research_year=research_year, maker_name=maker_name, food_cd=food_code, profile=profile
+    )
+    search_backend_counter.record(backend)
+    if backend == SEARCH_BACKEND_SQLITE:
+        return _search_food_nutritions_in_db(
+            db=db, research_year=research_year, food_cd=food_code,
+            skip=skip, limit=limit, fields=fields, track_total_hits=track_total_hits, ranges=ranges, sort=sort
+        )
+
+    if es is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="검색 서비스가 아직 준비되지 않았습니다. 잠시 후 다시 시도해주세요.")
+    search_params = {
+        "es_client": es,
+        "food_name": food_name,
+        "research_year": research_year,
+        "maker_name": maker_name,
+        "food_cd": food_code,
+        "skip": skip,
+        "limit": limit,
+        "source_fields": fields,
+        "mode": mode,
+        "ranges": ranges,
+        "sort": sort,
+    }
+    total_headers: Dict[str, str] = {"X-Search-Backend": backend}
+    try:
+        if profile:
+            results = profile_food_nutritions_search_in_es(**search_params)
+        else:
+            page = search_food_nutritions_page_in_es(**search_params, track_total_hits=_resolve_track_total_hits(track_total_hits))
+            results = page["results"]
+            if page["total"] is not None:
+                total_headers.update({"X-Total-Count": str(page["total"]), "X-Total-Count-Relation": page["total_relation"]})
+    except ESOverloadedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="검색 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except DeadlineExceededError:
+        raise
+    except ConnectionError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="검색 서비스에 연결할 수 없습니다. 잠시 후 다시 시도해주세요.")
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="검색 중 오류가 발생했습니다.")
+
+    if not fields:
+        response.headers.update(total_headers)
+        return results
+    if profile:
+        adapter = get_partial_food_nutrition_list_adapter(fields)
+        partial_results = adapter.dump_python(adapter.validate_python(results["results"]), mode="json")
+        return JSONResponse(content={**results, "results": partial_results})
+    partial_response = _partial_list_response(results, fields)
+    partial_response.headers.update(total_headers)
+    return partial_response
 
+
+@router.get("/search/count", response_model=FoodNutritionCountResponse, summary="음식 영양 정보 검색 건수 조회")
+def count_food_nutritions_via_es(
+    food_name: Optional[str] = Query(None, description="검색할 식품 이름 (부분 일치)"),
+    research_year: Optional[str] = Query(None, description="조사년도 (YYYY)"),
+    maker_name: Optional[str] = Query(None, description="지역/제조사 (부분 일치)"),
+    food_code: Optional[str] = Query(None, description="식품코드"),
+    mode: Literal["standard", "chosung", "fuzzy"] = Query("standard", description="식품 이름 검색 모드"),
+    ranges: Tuple[Tuple[str, Optional[float], Optional[float]], ...] = Depends(get_requested_ranges),
+    es: Elasticsearch = Depends(get_ready_es_client)
+):
+    """`GET /search/`와 같은 조건으로 Elasticsearch `_count`만 수행해 문서를 가져오지 않고 건수를 반환합니다."""
     try:
-        results = search_food_nutritions_in_es(
+        count = count_food_nutritions_in_es(
             es_client=es,
             food_name=food_name,
             research_year=research_year,
             maker_name=maker_name,
             food_cd=food_code,
-            skip=skip,
-            limit=limit
+            mode=mode,
+            ranges=ranges
         )
-        return results
-    except ConnectionError:
+    except ESOverloadedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="검색 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    if count is None:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="검색 서비스에 연결할 수 없습니다. 잠시 후 다시 시도해주세요.")
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="검색 중 오류가 발생했습니다.")
+    return {"count": count}
+
+
+@router.post("/search/batch", response_model=List[FoodNutritionBatchSearchResult], summary="음식 영양 정보 배치 검색")
+def batch_search_food_nutritions_via_es(
+    searches: List[FoodNutritionSearchParams],
+    es: Elasticsearch = Depends(get_ready_es_client)
+):
+    """
+    여러 검색 조건을 한 번의 Elasticsearch `_msearch` 요청으로 처리합니다.
+    - 각 항목은 `GET /search/`와 같은 검색 조건(`fields`, `track_total_hits`, `range`, `sort` 포함)을 가집니다.
+    - 결과는 요청 순서대로 반환되며, 특정 검색의 오류는 해당 항목의 `error`에만 기록됩니다.
+    - `track_total_hits`를 지정한 항목은 헤더 대신 `total`, `total_relation`으로 전체 건수를 반환합니다.
+    """
+    if len(searches) > settings.ES_MSEARCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.ES_MSEARCH_MAX_QUERIES}개의 검색만 요청할 수 있습니다."
+        )
+    ## 항목별 검색 조건 검증은 FoodNutritionSearchParams에서 끝났으므로 여기서는 변환만 함
+    search_fields = [parse_fields_param(search.fields) for search in searches]
+    try:
+        batch_results = msearch_food_nutritions_in_es(
+            es_client=es,
+            searches=[
+                {
+                    "food_name": search.food_name,
+                    "research_year": search.research_year,
+                    "maker_name": search.maker_name,
+                    "food_cd": search.food_code,
+                    "skip": search.skip,
+                    "limit": search.limit,
+                    "mode": search.mode,
+                    "source_fields": fields,
+                    "track_total_hits": _resolve_track_total_hits(search.track_total_hits),
+                    "ranges": parse_range_params(search.range),
+                    "sort": parse_sort_param(search.sort),
+                }
+                for search, fields in zip(searches, search_fields)
+            ]
+        )
+    except ESOverloadedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="검색 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+    if not any(search_fields):
+        return batch_results
+    ## fields를 지정한 항목은 선택한 필드만 가진 스키마로 직렬화 (전체 응답 스키마 검증을 거치지 않음)
+    content = []
+    for fields, batch_result in zip(search_fields, batch_results):
+        if fields:
+            adapter = get_partial_food_nutrition_list_adapter(fields)
+            results = adapter.dump_python(adapter.validate_python(batch_result["results"]), mode="json")
+            content.append({**FoodNutritionBatchSearchResult().model_dump(), **batch_result, "results": results})
+        else:
+            content.append(FoodNutritionBatchSearchResult.model_validate(batch_result).model_dump(mode="json"))
+    return JSONResponse(content=content)
+
+
+@router.post("/calculate", response_model=NutritionCalculationResponse, summary="식단 영양 정보 계산")
+def calculate_meal_nutritions(
+    calculation_in: NutritionCalculationRequest,
+    db: Session = Depends(get_read_db)
+):
+    """
+    식단별로 `{id 또는 food_cd, grams}` 목록을 받아 섭취량 기준 영양성분과 식단 합계를 계산합니다.
+    - 영양성분은 `값 * grams / serving_size`로 환산합니다.
+    - 여러 식단을 한 번에 보낼 수 있으며, 필요한 식품은 한 번의 쿼리로 조회합니다.
+    - 원본 값이 "1g 미만"(`-1.0`)인 성분은 0으로 계산하고 `less_than_1g`에 표시합니다.
+    """
+    items = [item for meal in calculation_in.meals for item in meal.items]
+    if len(items) > settings.NUTRITION_CALCULATION_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.NUTRITION_CALCULATION_MAX_ITEMS}개의 항목만 계산할 수 있습니다."
+        )
 
+    foods = food_nutrition_repository.get_food_nutritions_by_ids_or_food_cds(
+        db=db,
+        fields=("id", "food_cd", "food_name", "serving_size", *NUTRIENT_FIELDS),
+        ids=[item.id for item in items if item.id is not None],
+        food_cds=[item.food_cd for item in items if item.food_cd is not None]
+    )
+    index_by_id = {food["id"]: i for i, food in enumerate(foods)}
+    index_by_food_cd = {food["food_cd"]: i for i, food in enumerate(foods)}
+
+    missing = [
+        f"id={item.id}" if item.id is not None else f"food_cd={item.food_cd}"
+        for item in items
+        if (index_by_id.get(item.id) if item.id is not None else index_by_food_cd.get(item.food_cd)) is None
+    ]
+    if missing:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"FoodNutrition not found: {', '.join(dict.fromkeys(missing))}")
+
+    meals = [
+        {
+            "name": meal.name,
+            "items": [
+                {
+                    "food_index": index_by_id[item.id] if item.id is not None else index_by_food_cd[item.food_cd],
+                    "grams": item.grams,
+                }
+                for item in meal.items
+            ],
+        }
+        for meal in calculation_in.meals
+    ]
+    try:
+        return {"meals": calculate_meals(foods, meals)}
+    except NutritionCalculationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
+from typing import Literal
+
+from app.imports import (
+    ImportUploadTooLargeError,
+    spool_upload,
+    submit_import_job,
+    get_import_job_status
+)
+from app.schemas.import_job import ImportJobStatus
+
+router = APIRouter()
+
+@router.post("/", response_model=ImportJobStatus, status_code=status.HTTP_202_ACCEPTED, summary="원본 파일 업로드 및 적재 작업 생성")
+def create_import_job(
+    file: UploadFile = File(..., description="적재할 원본 파일 (csv, xlsx, xls, parquet)"),
+    mode: Literal["insert", "upsert"] = Form("insert", description="insert: 새 식품코드만 추가, upsert: 내용이 바뀐 기존 행도 수정")
+):
+    """
+    업로드한 파일을 디스크에 저장한 뒤 별도 워커 프로세스에서 `scripts/load_data.py`와 같은 파이프라인으로 적재합니다.
+    - 바로 `202 Accepted`와 작업 상태를 반환하며, 진행 상황은 `GET /api/v1/imports/{job_id}`로 확인합니다.
+    """
+    try:
+        job = spool_upload(file.filename or "", file.file, mode)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ImportUploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    finally:
+        file.file.close()
+
+    submit_import_job(job["job_id"])
+    return get_import_job_status(job["job_id"])
+
+@router.get("/{job_id}", response_model=ImportJobStatus, summary="적재 작업 진행 상황 조회")
+def read_import_job(job_id: str):
+    """처리한 행 수, 처리 속도(rows/s), 오류, 현재 단계의 예상 남은 시간(ETA)을 반환합니다."""
+    job = get_import_job_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Import job {job_id} not found")
+    return job
@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic_core import to_json
+
+from app.schemas.food_nutrition import FoodNutrition, FoodNutritionCountResponse, FoodNutritionSearchResponse
+from app.api.v1.endpoints.food_nutritions import get_requested_fields
+from app.snapshot import FoodNutritionReadSnapshot, get_read_snapshot
+
+## READ_SNAPSHOT_PATH가 설정된 읽기 전용 모드에서 /api/v1/food-nutritions 대신 등록되는 라우터
+## 쓰기 엔드포인트가 없으므로 POST/PUT/PATCH/DELETE 요청은 405를 받음
+router = APIRouter()
+
+SEARCH_BACKEND_SNAPSHOT = "snapshot"
+
+def _snapshot_rows_response(rows: List[Dict[str, Any]], headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(content=to_json(rows), media_type="application/json", headers=headers)
+
+@router.get("/count", response_model=FoodNutritionCountResponse, summary="음식 영양 정보 건수 조회 (스냅샷)")
+def count_snapshot_food_nutritions(
+    research_year: Optional[str] = Query(None, description="조사년도 (정확히 일치)"),
+    maker_name: Optional[str] = Query(None, description="지역/제조사 (정확히 일치)"),
+    food_code: Optional[str] = Query(None, description="식품코드"),
+    snapshot: FoodNutritionReadSnapshot = Depends(get_read_snapshot)
+):
+    _, total = snapshot.page(skip=0, limit=0, research_year=research_year, maker_name=maker_name, food_cd=food_code)
+    return {"count": total}
+
+@router.get("/{food_nutrition_id}", response_model=FoodNutrition, summary="특정 음식 영양 정보 상세 조회 (스냅샷)")
+def read_snapshot_food_nutrition(
+    food_nutrition_id: int,
+    fields: Optional[Tuple[str, ...]] = Depends(get_requested_fields),
+    snapshot: FoodNutritionReadSnapshot = Depends(get_read_snapshot)
+):
+    position = snapshot.position_for_id(food_nutrition_id)
+    if position is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"FoodNutrition with id {food_nutrition_id} not found")
+    return Response(content=to_json(snapshot.rows([position], fields)[0]), media_type="application/json")
+
+@router.get("/", response_model=List[FoodNutrition], summary="음식 영양 정보 목록 조회 (스냅샷)")
+def read_snapshot_food_nutritions(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=0),
+    research_year: Optional[str] = Query(None, description="조사년도 (정확히 일치)"),
+    maker_name: Optional[str] = Query(None, description="지역/제조사 (정확히 일치)"),
+    food_code: Optional[str] = Query(None, description="식품코드"),
+    fields: Optional[Tuple[str, ...]] = Depends(get_requested_fields),
+    snapshot: FoodNutritionReadSnapshot = Depends(get_read_snapshot)
+):
+    positions, _ = snapshot.page(skip=skip, limit=limit, research_year=research_year, maker_name=maker_name, food_cd=food_code)
+    return _snapshot_rows_response(snapshot.rows(positions, fields))
+
+@router.get("/search/", response_model=List[FoodNutritionSearchResponse], summary="음식 영양 정보 검색 (스냅샷)")
+def search_snapshot_food_nutritions(
+    food_name: Optional[str] = Query(None, description="검색할 식품 이름 (공백으로 나눈 검색어를 모두 포함, 대소문자 무시)"),
+    research_year: Optional[str] = Query(None, description="조사년도 (YYYY)"),
+    maker_name: Optional[str] = Query(None, description="지역/제조사 (정확히 일치)"),
+    food_code: Optional[str] = Query(None, description="식품코드"),
+    skip: int = Query(0, ge=0, description="건너뛸 결과 수"),
+    limit: int = Query(10, ge=1, le=100, description="반환할 최대 결과 수"),
+    fields: Optional[Tuple[str, ...]] = Depends(get_requested_fields),
+    snapshot: FoodNutritionReadSnapshot = Depends(get_read_snapshot)
+):
+    """
+    Elasticsearch 없이 스냅샷의 식품 이름 바이트열을 직접 훑어 검색합니다.
+    - `food_name`은 부분 일치(AND), 나머지 조건은 정확히 일치하는 값을 찾으며 결과는 id 오름차순입니다.
+    - 초성/오타 허용 검색과 관련도 정렬은 지원하지 않습니다.
+    - 전체 건수는 항상 `X-Total-Count` 헤더로 반환합니다.
+    """
+    positions, total = snapshot.page(
+        skip=skip, limit=limit, food_name=food_name, research_year=research_year, maker_name=maker_name, food_cd=food_code
+    )
+    headers = {"X-Search-Backend": SEARCH_BACKEND_SNAPSHOT, "X-Total-Count": str(total), "X-Total-Count-Relation": "eq"}
+    return _snapshot_rows_response(snapshot.rows(positions, fields), headers)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic.config import ConfigDict
-from typing import List
+from typing import Dict, List, Optional
 import os
 
 class Settings(BaseSettings):
@@ -9,7 +9,92 @@ class Settings(BaseSettings):
     APP_DESCRIPTION: str = "API for food nutrition data"
     
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./db_files/food_nutrition_api.db")
+    ## DB 커넥션 풀 설정 (파일 기반 DB에 적용, SQLite 메모리 DB는 단일 커넥션 풀 사용)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    ## 커넥션 재생성 주기(초), -1이면 재생성하지 않음
+    DB_POOL_RECYCLE_SECONDS: int = -1
+    DB_POOL_PRE_PING: bool = False
+    ## SQLite 잠금 대기 시간(busy timeout) 기본값. 요청 deadline이 더 짧으면 남은 시간으로 줄임
+    DB_BUSY_TIMEOUT_SECONDS: float = 5.0
     ES_HOST: str = os.getenv("ES_HOST", "http://localhost:9200")
+    ES_TIMEOUT: int = 30
+    ## 일괄 수정/삭제의 _update_by_query/_delete_by_query 완료까지 기다릴 시간 (ES_TIMEOUT보다 오래 걸릴 수 있음)
+    ES_BULK_BY_QUERY_TIMEOUT_SECONDS: float = 300.0
+
+    ## 앱 시작 시 백그라운드 Elasticsearch 초기화 재시도 간격 (지수 백오프)
+    ES_BOOTSTRAP_INITIAL_BACKOFF_SECONDS: float = 1.0
+    ES_BOOTSTRAP_MAX_BACKOFF_SECONDS: float = 30.0
+    ## True이면 Elasticsearch가 준비되지 않았을 때 /readyz가 503을 반환
+    READINESS_REQUIRES_ES: bool = False
+
+    ## Elasticsearch 호출 동시성 제한 (초과 요청은 대기열에서 기다리다가 가득 차거나 시간 초과 시 503)
+    ES_MAX_CONCURRENT_REQUESTS: int = 8
+    ES_MAX_QUEUED_REQUESTS: int = 32
+    ES_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    ES_RETRY_AFTER_SECONDS: int = 1
+    ## 배치 검색(_msearch) 한 번에 허용하는 최대 검색 수
+    ES_MSEARCH_MAX_QUERIES: int = 50
+    ## 검색 전체 건수 계산 방식 기본값 (exact: 정확히, capped: ES_TRACK_TOTAL_HITS_CAP까지만, off: 계산 안 함)
+    ES_DEFAULT_TRACK_TOTAL_HITS: str = "off"
+    ES_TRACK_TOTAL_HITS_CAP: int = 10000
+    ## mode=fuzzy 검색에서 일치해야 하는 자모 trigram 비율
+    ES_FUZZY_MINIMUM_SHOULD_MATCH: str = "70%"
+
+    ## 동일한 조회/검색 요청이 동시에 들어오면 하나의 백엔드 호출로 합침
+    SINGLE_FLIGHT_ENABLED: bool = True
+
+    ## food_code, research_year 같은 정확히 일치 조건만 있는 검색은 ES 대신 SQLite 인덱스로 처리
+    SEARCH_ROUTER_ENABLED: bool = True
+
+    ## 식단 영양 계산 API 한 번에 계산할 수 있는 최대 항목 수 (모든 식단 합계)
+    NUTRITION_CALCULATION_MAX_ITEMS: int = 1000
+
+    ## 파일 업로드 적재(import) 작업: 업로드 파일과 진행 상태를 저장할 디렉터리, 워커 프로세스 수, 최대 업로드 크기
+    IMPORT_SPOOL_DIR: str = "data/imports"
+    ## SQLite는 쓰기가 직렬화되므로 기본 1개 워커
+    IMPORT_MAX_WORKERS: int = 1
+    IMPORT_MAX_UPLOAD_BYTES: int = 200 * 1024 * 1024
+
+    ## 지정하면 SQLite/Elasticsearch 없이 읽기 전용 스냅샷 파일(scripts/build_read_snapshot.py로 생성)로 조회/검색 API만 제공
+    READ_SNAPSHOT_PATH: Optional[str] = None
+
+    ## 느린 쿼리 로그 (app.slow_query 로거로 기록)
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SQL_SLOW_QUERY_THRESHOLD_MS: float = 100.0
+    SQL_EXPLAIN_SLOW_QUERIES: bool = True
+    ES_SLOW_QUERY_THRESHOLD_MS: float = 300.0
+    ## DEBUG 레벨에서 ES 검색 쿼리 본문을 기록할 비율 (0.0 ~ 1.0)
+    ES_QUERY_LOG_SAMPLE_RATE: float = 0.01
+
+    ## 프로세스 내 tracing (요청 → repository → SQL → ES 구간별 소요 시간). 기본 비활성화 (필요할 때만 켬)
+    TRACING_ENABLED: bool = False
+    ## trace를 기록할 요청 비율 (0.0 ~ 1.0)
+    TRACING_SAMPLE_RATE: float = 0.1
+    ## /debug/traces에서 조회할 수 있도록 메모리에 보관할 최근 trace 수
+    TRACING_RING_BUFFER_SIZE: int = 200
+    ## 지정하면 trace를 JSONL 파일에도 추가
+    TRACING_JSONL_PATH: Optional[str] = None
+    TRACING_MAX_SPANS_PER_TRACE: int = 500
+    TRACING_EXCLUDED_PATH_PREFIXES: List[str] = ["/debug/traces", "/livez", "/readyz", "/health", "/metrics"]
+    ## /debug/traces는 인증 없이 SQL 문과 내부 처리 시간을 노출하므로 명시적으로 켠 경우에만 조회 가능 (그 외 404)
+    TRACING_DEBUG_ENDPOINT_ENABLED: bool = False
+
+    ## 요청별 처리 시간 예산(deadline). 남은 시간이 SQL 문(busy timeout, 실행 중단)과 ES 요청(request_timeout, 검색 timeout)에 적용되고 초과 시 504
+    REQUEST_DEADLINE_ENABLED: bool = True
+    REQUEST_DEADLINE_DEFAULT_SECONDS: float = 10.0
+    ## 경로 접두사별 예산 (가장 긴 접두사 우선, 0 이하이면 deadline 없음). "METHOD /경로" 형식은 해당 메서드에만, "$"로 끝나면 정확히 같은 경로에만 적용
+    REQUEST_DEADLINE_ROUTE_SECONDS: Dict[str, float] = {
+        "/api/v1/food-nutritions/search": 5.0,
+        ## 일괄 수정/삭제는 SQLite 커밋 후 _update_by_query/_delete_by_query를 끝까지 기다려야 하므로 제외
+        "PATCH /api/v1/food-nutritions/$": 0.0,
+        "DELETE /api/v1/food-nutritions/$": 0.0,
+        "/livez": 0.0,
+        "/health": 0.0,
+    }
+    ## 클라이언트가 남은 시간(초)을 알려주는 헤더. 경로 예산보다 짧을 때만 적용
+    REQUEST_DEADLINE_HEADER: Optional[str] = "x-request-timeout"
     
     @property
     def ELASTICSEARCH_HOSTS(self) -> List[str]:
@@ -0,0 +1,104 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+import logging
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+## 절대 시각(time.monotonic 기준). threadpool에서 실행되는 동기 엔드포인트에도 컨텍스트와 함께 전달됨
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """요청의 처리 시간 예산을 모두 사용해 더 이상 SQL/ES 작업을 시작하지 않을 때 발생합니다."""
+    def __init__(self, message: str = "요청 처리 시간 예산을 초과했습니다."):
+        super().__init__(message)
+
+
+def remaining_time() -> Optional[float]:
+    """현재 요청의 남은 시간(초). deadline이 없으면 None, 이미 지났으면 0 이하."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_expired() -> bool:
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def check_deadline() -> None:
+    if deadline_expired():
+        raise DeadlineExceededError()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """블록 안에서 deadline을 설정합니다. 바깥 deadline이 더 짧으면 그대로 유지합니다."""
+    if seconds is None or seconds <= 0:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _route_match_length(route: str, method: Optional[str], path: str) -> int:
+    ## "PATCH /api/..."처럼 메서드를 붙인 키는 해당 메서드에만 적용되고, "$"로 끝나는 키는 경로가 정확히 같을 때만 적용
+    ## 같은 길이면 정확히 일치 > 메서드 지정 > 접두사 순으로 우선
+    route_method, _, route_path = route.rpartition(" ")
+    if route_method and route_method.upper() != (method or "").upper():
+        return -1
+    exact = route_path.endswith("$")
+    if exact:
+        route_path = route_path[:-1]
+        if path != route_path:
+            return -1
+    elif not path.startswith(route_path):
+        return -1
+    return len(route_path) * 4 + (2 if exact else 0) + (1 if route_method else 0)
+
+
+def resolve_request_budget(path: str, header_value: Optional[str] = None, method: Optional[str] = None) -> Optional[float]:
+    """경로 접두사 설정(없으면 기본값)과 헤더 값 중 짧은 쪽을 예산(초)으로 반환합니다. 예산이 없으면 None."""
+    matches = {route: _route_match_length(route, method, path) for route in settings.REQUEST_DEADLINE_ROUTE_SECONDS}
+    matches = {route: length for route, length in matches.items() if length >= 0}
+    budget = settings.REQUEST_DEADLINE_ROUTE_SECONDS[max(matches, key=matches.get)] if matches else settings.REQUEST_DEADLINE_DEFAULT_SECONDS
+    if budget <= 0:
+        return None
+    if header_value:
+        try:
+            requested = float(header_value)
+        except ValueError:
+            logger.warning(f"잘못된 deadline 헤더 값을 무시합니다: {header_value!r}")
+        else:
+            ## 헤더로는 예산을 줄이기만 할 수 있음 (경로 설정보다 오래 붙잡지 않도록)
+            if requested > 0:
+                budget = min(budget, requested)
+    return budget
+
+
+class DeadlineMiddleware:
+    """HTTP 요청마다 경로별 처리 시간 예산으로 deadline을 설정하는 ASGI 미들웨어."""
+    def __init__(self, app: Any):
+        self.app = app
+        self._header = settings.REQUEST_DEADLINE_HEADER.lower().encode("latin-1") if settings.REQUEST_DEADLINE_HEADER else None
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or not settings.REQUEST_DEADLINE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        header_value = None
+        if self._header is not None:
+            header_value = next((value.decode("latin-1") for key, value in scope["headers"] if key == self._header), None)
+        with deadline_scope(resolve_request_budget(scope["path"], header_value, scope.get("method"))):
+            await self.app(scope, receive, send)
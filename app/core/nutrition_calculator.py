@@ -0,0 +1,132 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+## 1회 제공량당 값으로 저장된 영양성분 (serving_size 기준)
+NUTRIENT_FIELDS: Tuple[str, ...] = (
+    "calorie", "carbohydrate", "protein", "province", "sugars",
+    "salt", "cholesterol", "saturated_fatty_acids", "trans_fat",
+)
+
+## 원본 데이터의 "1g 미만" 표기는 -1.0으로 저장됨 (scripts/load_data.py 참고)
+LESS_THAN_1G_VALUE = -1.0
+
+
+class NutritionCalculationError(ValueError):
+    """계산할 수 없는 항목(예: 1회 제공량이 없는 식품)이 포함된 경우 발생합니다."""
+
+
+def _to_optional_float(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def _nutrients_dict(values: np.ndarray) -> Dict[str, Optional[float]]:
+    return {field: _to_optional_float(value) for field, value in zip(NUTRIENT_FIELDS, values)}
+
+
+def _less_than_1g_fields(mask: np.ndarray) -> List[str]:
+    return [field for field, flagged in zip(NUTRIENT_FIELDS, mask) if flagged]
+
+
+def calculate_meals(
+    foods: Sequence[Dict[str, Any]],
+    meals: Sequence[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """식단별 항목의 영양성분을 섭취량(g)에 맞게 환산하고 식단 합계를 계산합니다.
+
+    foods는 한 번의 조회로 가져온 식품 행(id, food_cd, food_name, serving_size, 영양성분)이고,
+    meals는 {name, items: [{food_index, grams}]} 목록입니다. food_index는 foods의 위치입니다.
+    모든 식단의 항목을 하나의 배열로 모아 `값 * grams / serving_size`를 한 번에 계산합니다.
+
+    - 값이 없는(NULL) 성분은 None으로 두고 합계에서 제외합니다. 모든 항목이 None이면 합계도 None입니다.
+    - "1g 미만"(-1.0) 성분은 0으로 계산하고 less_than_1g에 표시해 합계가 하한값임을 알립니다.
+    """
+    food_values = np.array(
+        [[np.nan if food[field] is None else food[field] for field in NUTRIENT_FIELDS] for food in foods],
+        dtype=float
+    ).reshape(len(foods), len(NUTRIENT_FIELDS))
+    serving_sizes = np.array([np.nan if food["serving_size"] is None else food["serving_size"] for food in foods], dtype=float)
+
+    food_index = np.array([item["food_index"] for meal in meals for item in meal["items"]], dtype=int)
+    grams = np.array([item["grams"] for meal in meals for item in meal["items"]], dtype=float)
+    meal_index = np.repeat(np.arange(len(meals)), [len(meal["items"]) for meal in meals])
+
+    item_serving_sizes = serving_sizes[food_index]
+    invalid = ~(item_serving_sizes > 0)
+    if invalid.any():
+        invalid_foods = sorted({foods[i]["food_cd"] for i in food_index[invalid]})
+        raise NutritionCalculationError(f"1회 제공량이 없어 환산할 수 없는 식품: {', '.join(invalid_foods)}")
+
+    values = food_values[food_index]
+    less_than_1g = values == LESS_THAN_1G_VALUE
+    known = ~np.isnan(values)
+    scaled = np.where(less_than_1g, 0.0, values) * (grams / item_serving_sizes)[:, np.newaxis]
+
+    ## 식단별 합계: 성분마다 식단 번호로 묶어 합산 (값이 없는 성분은 0으로 더하고 known 개수로 None 여부 판단)
+    totals = np.zeros((len(meals), len(NUTRIENT_FIELDS)))
+    known_counts = np.zeros((len(meals), len(NUTRIENT_FIELDS)), dtype=int)
+    total_less_than_1g = np.zeros((len(meals), len(NUTRIENT_FIELDS)), dtype=bool)
+    np.add.at(totals, meal_index, np.where(known, scaled, 0.0))
+    np.add.at(known_counts, meal_index, known.astype(int))
+    np.logical_or.at(total_less_than_1g, meal_index, less_than_1g)
+    totals[known_counts == 0] = np.nan
+
+    results = []
+    position = 0
+    for meal_position, meal in enumerate(meals):
+        items = []
+        for item in meal["items"]:
+            food = foods[item["food_index"]]
+            items.append({
+                "id": food["id"],
+                "food_cd": food["food_cd"],
+                "food_name": food["food_name"],
+                "grams": item["grams"],
+                "serving_size": food["serving_size"],
+                "nutrients": _nutrients_dict(scaled[position]),
+                "less_than_1g": _less_than_1g_fields(less_than_1g[position]),
+            })
+            position += 1
+        results.append({
+            "name": meal.get("name"),
+            "items": items,
+            "total": _nutrients_dict(totals[meal_position]),
+            "less_than_1g": _less_than_1g_fields(total_less_than_1g[meal_position]),
+        })
+    return results
+
+
+## 1회 제공량이 식품마다 달라 영양성분끼리 비교할 수 있도록 쓰기 시점에 미리 계산해 저장하는 정규화 필드
+PER_100G_FIELDS: Tuple[str, ...] = tuple(f"{field}_per_100g" for field in NUTRIENT_FIELDS)
+PER_100KCAL_FIELDS: Tuple[str, ...] = tuple(f"{field}_per_100kcal" for field in NUTRIENT_FIELDS if field != "calorie")
+NORMALIZED_NUTRIENT_FIELDS: Tuple[str, ...] = PER_100G_FIELDS + PER_100KCAL_FIELDS
+
+## 정규화 필드마다 (원본 성분, 기준 필드): 값 * 100 / 기준값
+NORMALIZED_NUTRIENT_SOURCES: Dict[str, Tuple[str, str]] = {
+    **{f"{field}_per_100g": (field, "serving_size") for field in NUTRIENT_FIELDS},
+    **{f"{field}_per_100kcal": (field, "calorie") for field in NUTRIENT_FIELDS if field != "calorie"},
+}
+
+
+def normalize_nutrient_values(values: np.ndarray, bases: np.ndarray) -> np.ndarray:
+    """`값 * 100 / 기준값`을 배열 단위로 계산합니다 (NaN은 값 없음).
+
+    - 기준값(1회 제공량 또는 열량)이 없거나 0 이하이면 NaN입니다.
+    - "1g 미만"(-1.0) 값은 0으로 계산합니다.
+    - SQL 백필(alembic)과 같은 값이 나오도록 반올림하지 않습니다.
+    """
+    values = np.asarray(values, dtype=float)
+    bases = np.asarray(bases, dtype=float)
+    valid_bases = np.where(bases > 0, bases, np.nan)
+    return np.where(values == LESS_THAN_1G_VALUE, 0.0, values) * 100.0 / valid_bases
+
+
+def compute_normalized_nutrients(data: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """한 식품 행(serving_size와 영양성분)의 100g당/100kcal당 값을 계산합니다."""
+    def as_float(value: Any) -> float:
+        return np.nan if value is None else float(value)
+
+    normalized = {}
+    for field, (source, base) in NORMALIZED_NUTRIENT_SOURCES.items():
+        value = normalize_nutrient_values(as_float(data.get(source)), as_float(data.get(base)))
+        normalized[field] = None if np.isnan(value) else float(value)
+    return normalized
@@ -0,0 +1,79 @@
+from typing import Any, Callable, Dict, Hashable, Optional
+import threading
+
+from app.core.deadline import DeadlineExceededError, check_deadline, remaining_time
+
+
+class _InFlightCall:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """같은 key로 동시에 들어온 호출을 하나의 실제 호출로 합치고 결과(또는 예외)를 공유합니다.
+
+    동기 함수(threadpool에서 실행되는 엔드포인트, repository, ES 호출)를 대상으로 합니다.
+    결과 객체는 모든 대기 요청이 함께 사용하므로 호출자는 결과를 수정하면 안 됩니다.
+    대기 요청은 자신의 deadline까지만 기다리며, leader가 자신의 deadline 초과로 실패하면
+    그 예외를 공유받지 않고 다시 시도합니다 (다른 호출을 기다리거나 직접 실행).
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self._requests = 0
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            self._requests += 1
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                is_leader = call is None
+                if is_leader:
+                    call = _InFlightCall()
+                    self._calls[key] = call
+                    self._executions += 1
+                else:
+                    self._coalesced += 1
+
+            if is_leader:
+                break
+
+            timeout = remaining_time()
+            if not call.event.wait(timeout=max(timeout, 0.0) if timeout is not None else None):
+                raise DeadlineExceededError()
+            if isinstance(call.error, DeadlineExceededError):
+                ## leader의 deadline이 더 짧았던 것뿐이므로 내 남은 시간으로 다시 시도
+                check_deadline()
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests_total": self._requests,
+                "executions_total": self._executions,
+                "coalesced_total": self._coalesced,
+                "in_flight_keys": len(self._calls),
+                "coalescing_ratio": round(self._coalesced / self._requests, 4) if self._requests else 0.0,
+            }
@@ -0,0 +1,276 @@
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+import functools
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TRACE_ID_HEADER = "x-trace-id"
+
+
+class Span:
+    """trace 안의 한 구간 (엔드포인트, repository 호출, SQL 문, ES 요청)."""
+    __slots__ = ("span_id", "parent_id", "name", "kind", "attributes", "status", "start_time", "_started_at", "duration_ms")
+
+    def __init__(self, name: str, kind: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.status = "ok"
+        self.start_time = time.time()
+        self._started_at = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if error is not None:
+            self.status = "error"
+            self.attributes["error"] = f"{type(error).__name__}: {error}"
+        self.duration_ms = round((time.perf_counter() - self._started_at) * 1000, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class Trace:
+    """요청 하나에서 만들어진 span 목록. threadpool 스레드에서도 같은 객체에 span을 추가합니다."""
+    __slots__ = ("trace_id", "spans", "dropped_spans", "_lock")
+
+    def __init__(self):
+        self.trace_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> bool:
+        ## 대량 적재처럼 SQL이 많은 요청에서 trace가 끝없이 커지지 않도록 최대 span 수를 제한
+        with self._lock:
+            if len(self.spans) >= settings.TRACING_MAX_SPANS_PER_TRACE:
+                self.dropped_spans += 1
+                return False
+            self.spans.append(span)
+            return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        root = self.spans[0]
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            "start_time": root.start_time,
+            "duration_ms": root.duration_ms,
+            "status": root.status,
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+class RingBufferExporter:
+    """최근 trace를 메모리에 보관합니다 (/debug/traces에서 조회)."""
+    def __init__(self, max_traces: int):
+        self._traces: Deque[Dict[str, Any]] = deque(maxlen=max_traces)
+        self._lock = threading.Lock()
+
+    def export(self, trace: Dict[str, Any]) -> None:
+        with self._lock:
+            self._traces.append(trace)
+
+    def traces(self, limit: int = 20, min_duration_ms: float = 0.0) -> List[Dict[str, Any]]:
+        """최신 trace부터 반환합니다."""
+        with self._lock:
+            snapshot = list(self._traces)
+        matched = [trace for trace in reversed(snapshot) if (trace["duration_ms"] or 0) >= min_duration_ms]
+        return matched[:limit]
+
+    def get(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return next((trace for trace in self._traces if trace["trace_id"] == trace_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+class JsonlFileExporter:
+    """trace를 한 줄에 하나씩 JSON으로 파일에 추가합니다."""
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, trace: Dict[str, Any]) -> None:
+        line = json.dumps(trace, ensure_ascii=False, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+trace_ring_buffer = RingBufferExporter(settings.TRACING_RING_BUFFER_SIZE)
+_exporters: List[Any] = [trace_ring_buffer]
+if settings.TRACING_JSONL_PATH:
+    _exporters.append(JsonlFileExporter(settings.TRACING_JSONL_PATH))
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def add_trace_exporter(exporter: Any) -> None:
+    """`export(trace_dict)` 메서드를 가진 exporter를 등록합니다."""
+    _exporters.append(exporter)
+
+
+def remove_trace_exporter(exporter: Any) -> None:
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+def _export(trace: Trace) -> None:
+    trace_dict = trace.to_dict()
+    for exporter in list(_exporters):
+        try:
+            exporter.export(trace_dict)
+        except Exception as e:
+            logger.warning(f"trace 내보내기 실패 ({type(exporter).__name__}): {e}")
+
+
+def current_trace_id() -> Optional[str]:
+    trace = _current_trace.get()
+    return trace.trace_id if trace is not None else None
+
+
+@contextmanager
+def start_trace(name: str, kind: str = "http", **attributes: Any) -> Iterator[Optional[Span]]:
+    """샘플링된 경우에만 새 trace와 루트 span을 만들고, 끝나면 등록된 exporter로 내보냅니다."""
+    if not settings.TRACING_ENABLED or random.random() >= settings.TRACING_SAMPLE_RATE:
+        yield None
+        return
+
+    trace = Trace()
+    root = Span(name, kind, None, attributes)
+    trace.add(root)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(root)
+    error: Optional[BaseException] = None
+    try:
+        yield root
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        root.end(error)
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        _export(trace)
+
+
+def begin_span(name: str, kind: str = "internal", **attributes: Any) -> Optional[Span]:
+    """현재 trace에 하위 span을 추가합니다. SQLAlchemy 이벤트처럼 시작/종료가 분리된 곳에서 사용합니다.
+
+    현재 span으로 설정하지 않으므로 하위 span이 없는 구간(SQL 문 등)에만 사용하고, `end_span`으로 종료합니다.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return None
+    parent = _current_span.get()
+    span = Span(name, kind, parent.span_id if parent is not None else None, attributes)
+    return span if trace.add(span) else None
+
+
+def end_span(span: Optional[Span], error: Optional[BaseException] = None) -> None:
+    if span is not None:
+        span.end(error)
+
+
+@contextmanager
+def start_span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Optional[Span]]:
+    """현재 trace가 있으면 하위 span을 만들고 블록 안에서 현재 span으로 설정합니다. trace가 없으면 아무것도 하지 않습니다."""
+    span = begin_span(name, kind, **attributes)
+    if span is None:
+        yield None
+        return
+
+    token = _current_span.set(span)
+    error: Optional[BaseException] = None
+    try:
+        yield span
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end(error)
+
+
+def traced(name: Optional[str] = None, kind: str = "internal") -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """동기 함수 호출을 span으로 감싸는 데코레이터 (이름 기본값: 함수 이름)."""
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current_trace.get() is None:
+                return fn(*args, **kwargs)
+            with start_span(span_name, kind):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TracingMiddleware:
+    """HTTP 요청마다 루트 span을 만드는 ASGI 미들웨어. 샘플링된 요청은 응답에 X-Trace-Id 헤더를 추가합니다."""
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(tuple(settings.TRACING_EXCLUDED_PATH_PREFIXES)):
+            await self.app(scope, receive, send)
+            return
+
+        with start_trace(f"{scope['method']} {scope['path']}", kind="http", method=scope["method"], path=scope["path"]) as root:
+            if root is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_trace_id(message: Dict[str, Any]) -> None:
+                if message["type"] == "http.response.start":
+                    root.set_attribute("status_code", message["status"])
+                    if message["status"] >= 500:
+                        root.status = "error"
+                    headers = list(message.get("headers", []))
+                    headers.append((TRACE_ID_HEADER.encode("latin-1"), current_trace_id().encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                ## 라우팅이 끝난 뒤에는 경로 템플릿(예: /api/v1/food-nutritions/{food_nutrition_id})으로 이름을 바꿔 집계하기 쉽게 함
+                route = scope.get("route")
+                if route is not None and getattr(route, "path", None):
+                    root.name = f"{scope['method']} {route.path}"
+                    root.set_attribute("route", route.path)
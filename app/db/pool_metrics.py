@@ -0,0 +1,55 @@
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from typing import Any, Dict
+import threading
+import time
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool에 커넥션 체크아웃 대기 시간과 타임아웃 횟수 측정을 추가합니다."""
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._checkouts = 0
+        self._checkout_wait_total = 0.0
+        self._checkout_wait_max = 0.0
+        self._checkout_timeouts = 0
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            with self._metrics_lock:
+                self._checkout_timeouts += 1
+            raise
+        waited = time.perf_counter() - started_at
+        with self._metrics_lock:
+            self._checkouts += 1
+            self._checkout_wait_total += waited
+            self._checkout_wait_max = max(self._checkout_wait_max, waited)
+        return connection
+
+    def stats(self) -> Dict[str, Any]:
+        with self._metrics_lock:
+            checkouts = self._checkouts
+            return {
+                "pool_size": self.size(),
+                "checked_out": self.checkedout(),
+                "checked_in": self.checkedin(),
+                ## overflow()는 pool_size만큼 음수에서 시작하므로 실제 사용 중인 초과 커넥션 수로 변환
+                "overflow_in_use": max(self.overflow(), 0),
+                "max_overflow": self._max_overflow,
+                "checkouts_total": checkouts,
+                "checkout_timeouts_total": self._checkout_timeouts,
+                "checkout_wait_ms_avg": round(self._checkout_wait_total / checkouts * 1000, 3) if checkouts else 0.0,
+                "checkout_wait_ms_max": round(self._checkout_wait_max * 1000, 3),
+            }
+
+
+def get_pool_stats(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return {"pool_class": type(pool).__name__, **pool.stats()}
+    return {"pool_class": type(pool).__name__, "status": pool.status()}
@@ -1,13 +1,44 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
-from app.core.config import settings 
+from typing import Any, Dict
+from app.core.config import settings
+from app.db.pool_metrics import InstrumentedQueuePool
+from app.db.slow_query_log import install_slow_query_log
+from app.db.sql_tracing import install_sql_tracing
+from app.db.sql_deadline import install_sql_deadline
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if url.get_backend_name() == "sqlite":
+        ## 풀의 커넥션은 한 번에 한 스레드만 체크아웃하지만 요청마다 다른 스레드에서 사용하므로 SQLite 스레드 검사는 끔
+        options["connect_args"] = {"check_same_thread": False, "timeout": settings.DB_BUSY_TIMEOUT_SECONDS}
+        if url.database in (None, "", ":memory:"):
+            ## 메모리 DB는 커넥션마다 다른 DB가 되므로 SQLAlchemy 기본 풀(SingletonThreadPool)을 유지
+            return options
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+    return options
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
+install_slow_query_log(engine)
+install_sql_tracing(engine)
+install_sql_deadline(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+## 조회 전용 세션: flush/commit 후 만료 처리가 필요 없고, 변경 사항을 flush하려 하면 오류
+ReadOnlySessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+@event.listens_for(ReadOnlySessionLocal, "before_flush")
+def _reject_read_only_flush(session, flush_context, instances):
+    if session.new or session.dirty or session.deleted:
+        raise RuntimeError("조회 전용 세션에서는 데이터를 변경할 수 없습니다.")
 
 Base = declarative_base()
 
@@ -16,4 +47,11 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_read_db():
+    db = ReadOnlySessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,62 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import Any, List, Optional
+import logging
+import time
+
+from app.core.config import settings
+
+slow_query_logger = logging.getLogger("app.slow_query")
+
+_QUERY_START_TIMES_KEY = "slow_query_log_start_times"
+
+
+def _explain_query_plan(conn, statement: str, parameters: Any) -> Optional[List[str]]:
+    ## SQLAlchemy 이벤트가 다시 호출되지 않도록 DBAPI 커서로 직접 실행
+    if conn.dialect.name != "sqlite" or not statement.lstrip().upper().startswith("SELECT"):
+        return None
+    try:
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+            return [row[-1] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception as e:
+        return [f"EXPLAIN QUERY PLAN 실패: {e}"]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_QUERY_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get(_QUERY_START_TIMES_KEY)
+    if not start_times:
+        return
+    elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+    if not settings.SLOW_QUERY_LOG_ENABLED or elapsed_ms < settings.SQL_SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    message = f"느린 SQL 쿼리: elapsed={elapsed_ms:.1f}ms, statement={statement}"
+    if not executemany:
+        message += f", parameters={parameters}"
+        if settings.SQL_EXPLAIN_SLOW_QUERIES:
+            query_plan = _explain_query_plan(conn, statement, parameters)
+            if query_plan:
+                message += f", query_plan={query_plan}"
+    slow_query_logger.warning(message)
+
+
+def _handle_error(exception_context):
+    ## 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각을 여기서 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_QUERY_START_TIMES_KEY):
+        conn.info[_QUERY_START_TIMES_KEY].pop()
+
+
+def install_slow_query_log(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,51 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.deadline import DeadlineExceededError, deadline_expired, remaining_time
+
+## SQLite VM 명령을 이 횟수만큼 실행할 때마다 deadline을 확인 (초과 시 실행 중인 문을 중단)
+SQL_DEADLINE_CHECK_INTERVAL_OPS = 1000
+
+_PROGRESS_HANDLER_KEY = "sql_deadline_progress_handler"
+_BUSY_TIMEOUT_KEY = "sql_deadline_busy_timeout_ms"
+
+
+def _progress_handler() -> int:
+    ## SQLite가 문을 실행하는 스레드에서 호출되므로 그 요청의 deadline을 그대로 읽음 (0이 아니면 SQLITE_INTERRUPT)
+    return 1 if deadline_expired() else 0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError()
+
+    dbapi_connection = conn.connection.dbapi_connection
+    if not conn.info.get(_PROGRESS_HANDLER_KEY):
+        dbapi_connection.set_progress_handler(_progress_handler, SQL_DEADLINE_CHECK_INTERVAL_OPS)
+        conn.info[_PROGRESS_HANDLER_KEY] = True
+
+    ## 잠금 대기는 progress handler로 중단되지 않으므로 남은 시간이 기본 busy timeout보다 짧을 때만 줄임
+    default_ms = int(settings.DB_BUSY_TIMEOUT_SECONDS * 1000)
+    busy_timeout_ms = default_ms if remaining is None else max(1, min(default_ms, int(remaining * 1000)))
+    if conn.info.get(_BUSY_TIMEOUT_KEY, default_ms) != busy_timeout_ms:
+        dbapi_connection.execute(f"PRAGMA busy_timeout = {busy_timeout_ms}")
+        conn.info[_BUSY_TIMEOUT_KEY] = busy_timeout_ms
+
+
+def _handle_error(exception_context):
+    ## deadline 때문에 중단된 문(interrupted, database is locked)은 DB 오류 대신 DeadlineExceededError로 알림
+    if isinstance(exception_context.original_exception, DeadlineExceededError):
+        return
+    if deadline_expired():
+        raise DeadlineExceededError() from exception_context.original_exception
+
+
+def install_sql_deadline(engine: Engine) -> None:
+    """SQLite 엔진에 요청 deadline을 적용합니다 (다른 DB 드라이버는 progress handler가 없어 적용하지 않음)."""
+    if engine.dialect.name != "sqlite":
+        return
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,42 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.tracing import begin_span, end_span
+
+## span에 기록할 SQL 문 최대 길이 (파라미터 값은 기록하지 않음)
+SQL_STATEMENT_MAX_LENGTH = 1000
+
+_TRACE_SPANS_KEY = "sql_tracing_spans"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    ## trace가 없는 호출(스크립트, 샘플링 제외 요청)도 after/handle_error와 짝을 맞추기 위해 None을 쌓음
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = begin_span(
+        f"sql {operation}", kind="sql",
+        statement=statement[:SQL_STATEMENT_MAX_LENGTH], executemany=executemany
+    )
+    conn.info.setdefault(_TRACE_SPANS_KEY, []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans = conn.info.get(_TRACE_SPANS_KEY)
+    if not spans:
+        return
+    span = spans.pop()
+    if span is not None and cursor.rowcount >= 0:
+        span.set_attribute("rowcount", cursor.rowcount)
+    end_span(span)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_TRACE_SPANS_KEY):
+        end_span(conn.info[_TRACE_SPANS_KEY].pop(), exception_context.original_exception)
+
+
+def install_sql_tracing(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
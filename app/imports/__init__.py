@@ -0,0 +1,9 @@
+from .jobs import (
+    IMPORT_SOURCE_EXTENSIONS,
+    ImportUploadTooLargeError,
+    spool_upload,
+    submit_import_job,
+    run_import_job,
+    get_import_job_status,
+    shutdown_import_executor
+)
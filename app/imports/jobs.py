@@ -0,0 +1,229 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Optional
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+IMPORT_SOURCE_EXTENSIONS = (".csv", ".xlsx", ".xls", ".parquet")
+IMPORT_STATUS_FILE_NAME = "status.json"
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+
+
+class ImportUploadTooLargeError(Exception):
+    """업로드 파일이 IMPORT_MAX_UPLOAD_BYTES를 넘을 때 발생합니다."""
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_import_executor() -> ProcessPoolExecutor:
+    ## 이벤트 루프와 API 워커를 막지 않도록 별도 프로세스에서 적재 (spawn: 부모의 DB/ES 커넥션을 물려받지 않음)
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.IMPORT_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executor
+
+
+def shutdown_import_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _job_dir(job_id: str, spool_dir: Optional[str] = None) -> str:
+    return os.path.join(spool_dir or settings.IMPORT_SPOOL_DIR, job_id)
+
+
+def _status_path(job_id: str, spool_dir: Optional[str] = None) -> str:
+    return os.path.join(_job_dir(job_id, spool_dir), IMPORT_STATUS_FILE_NAME)
+
+
+def _write_status(status_path: str, status: Dict[str, Any]) -> None:
+    ## API 프로세스가 읽는 도중 반쯤 쓰인 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{status_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(status, f, ensure_ascii=False)
+    os.replace(tmp_path, status_path)
+
+
+def _read_status(status_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(status_path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _remove_source_file(status: Dict[str, Any]) -> None:
+    ## 끝난 작업은 작은 상태 파일만 남기고 업로드 원본(최대 IMPORT_MAX_UPLOAD_BYTES)은 삭제
+    try:
+        os.remove(status["source_path"])
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Import 작업 {status['job_id']}의 업로드 파일 삭제 실패: {e}")
+
+
+def spool_upload(file_name: str, source: BinaryIO, mode: str, spool_dir: Optional[str] = None) -> Dict[str, Any]:
+    """업로드 파일을 작업 디렉터리에 복사하고 queued 상태의 작업을 만듭니다."""
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension not in IMPORT_SOURCE_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_name} ({', '.join(IMPORT_SOURCE_EXTENSIONS)} 지원)")
+
+    job_id = uuid.uuid4().hex
+    job_dir = _job_dir(job_id, spool_dir)
+    os.makedirs(job_dir)
+    source_path = os.path.join(job_dir, f"source{extension}")
+    copied = 0
+    try:
+        with open(source_path, "wb") as target:
+            for chunk in iter(lambda: source.read(UPLOAD_COPY_CHUNK_SIZE), b""):
+                copied += len(chunk)
+                if copied > settings.IMPORT_MAX_UPLOAD_BYTES:
+                    raise ImportUploadTooLargeError(f"업로드 파일은 최대 {settings.IMPORT_MAX_UPLOAD_BYTES}바이트까지 허용됩니다.")
+                target.write(chunk)
+    except Exception:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        raise
+
+    status = {
+        "job_id": job_id,
+        "file_name": file_name,
+        "file_size": copied,
+        "source_path": source_path,
+        "mode": mode,
+        "status": JOB_STATUS_QUEUED,
+        "stage": JOB_STATUS_QUEUED,
+        "rows_total": None,
+        "rows_processed": 0,
+        "rows_skipped": 0,
+        "es_total": None,
+        "es_indexed": 0,
+        "es_errors": 0,
+        "invalid_numeric": {},
+        "errors": [],
+        "summary": None,
+        "created_at": time.time(),
+        "started_at": None,
+        "stage_started_at": None,
+        "finished_at": None,
+    }
+    _write_status(_status_path(job_id, spool_dir), status)
+    return status
+
+
+def run_import_job(job_id: str, spool_dir: Optional[str] = None) -> Optional[Dict[str, int]]:
+    """워커 프로세스에서 실행됩니다. 적재 스크립트 파이프라인을 그대로 사용하고 진행 상황을 상태 파일에 기록합니다."""
+    from scripts.load_data import load_excel_to_db_and_es
+
+    status_path = _status_path(job_id, spool_dir)
+    status = _read_status(status_path)
+    started_at = time.time()
+    status.update(status=JOB_STATUS_RUNNING, started_at=started_at, stage_started_at=started_at)
+    _write_status(status_path, status)
+
+    def on_progress(update: Dict[str, Any]) -> None:
+        error = update.pop("error", None)
+        if error:
+            status["errors"].append(error)
+        if update.get("stage", status["stage"]) != status["stage"]:
+            status["stage_started_at"] = time.time()
+        status.update(update)
+        _write_status(status_path, status)
+
+    try:
+        summary = load_excel_to_db_and_es(
+            source_path=status["source_path"], use_snapshot=False, mode=status["mode"], progress_callback=on_progress
+        )
+    except Exception as e:
+        logger.exception(f"Import 작업 {job_id} 실행 중 오류 발생")
+        status["errors"].append(f"적재 중 오류 발생: {e}")
+        summary = None
+    finally:
+        _remove_source_file(status)
+
+    status.update(
+        status=JOB_STATUS_COMPLETED if summary is not None else JOB_STATUS_FAILED,
+        stage=JOB_STATUS_COMPLETED if summary is not None else JOB_STATUS_FAILED,
+        summary=summary,
+        finished_at=time.time(),
+    )
+    _write_status(status_path, status)
+    return summary
+
+
+def _mark_crashed_job(job_id: str, spool_dir: Optional[str], future: Future) -> None:
+    ## 워커 프로세스가 비정상 종료되어 상태 파일을 마무리하지 못한 경우
+    error = future.exception() if not future.cancelled() else None
+    if error is None and not future.cancelled():
+        return
+    status_path = _status_path(job_id, spool_dir)
+    status = _read_status(status_path)
+    if status is None or status["status"] in (JOB_STATUS_COMPLETED, JOB_STATUS_FAILED):
+        return
+    _remove_source_file(status)
+    status["errors"].append(f"작업 프로세스 오류: {error}" if error else "작업이 취소되었습니다.")
+    status.update(status=JOB_STATUS_FAILED, stage=JOB_STATUS_FAILED, finished_at=time.time())
+    _write_status(status_path, status)
+
+
+def submit_import_job(job_id: str, spool_dir: Optional[str] = None) -> Future:
+    future = get_import_executor().submit(run_import_job, job_id, spool_dir)
+    future.add_done_callback(lambda f: _mark_crashed_job(job_id, spool_dir, f))
+    return future
+
+
+def get_import_job_status(job_id: str, spool_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """작업 상태에 경과 시간, 처리 속도(rows/s), 현재 단계의 남은 시간(ETA)을 더해 반환합니다."""
+    if not job_id.isalnum():
+        return None
+    status = _read_status(_status_path(job_id, spool_dir))
+    if status is None:
+        return None
+
+    now = status["finished_at"] or time.time()
+    elapsed = now - status["started_at"] if status["started_at"] is not None else None
+
+    ## 속도와 ETA는 현재 단계 기준: ES 인덱싱 단계는 인덱싱 건수, 그 외에는 SQLite 처리 건수
+    ## 작업이 끝난 뒤에는 전체 경과 시간 대비 SQLite 처리 건수로 평균 속도를 보여줌
+    if status["status"] == JOB_STATUS_RUNNING and status["stage"] == "indexing_es":
+        processed, total = status["es_indexed"] + status["es_errors"], status["es_total"]
+    else:
+        processed, total = status["rows_processed"], status["rows_total"]
+    if status["status"] == JOB_STATUS_RUNNING and status["stage_started_at"] is not None:
+        stage_elapsed = now - status["stage_started_at"]
+    else:
+        stage_elapsed = elapsed
+    throughput = processed / stage_elapsed if stage_elapsed and processed else None
+    eta = None
+    if status["status"] == JOB_STATUS_RUNNING and throughput and total is not None:
+        eta = max(total - processed, 0) / throughput
+
+    public_status = {key: value for key, value in status.items() if key != "source_path"}
+    return {
+        **public_status,
+        "elapsed_seconds": round(elapsed, 3) if elapsed is not None else None,
+        "throughput_rows_per_second": round(throughput, 1) if throughput else None,
+        "eta_seconds": round(eta, 1) if eta is not None else None,
+    }
@@ -1,16 +1,31 @@
-from fastapi import FastAPI
-from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager, suppress
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+import asyncio
 import logging
 
 from app.core.config import settings
+from app.core.tracing import TracingMiddleware, trace_ring_buffer
+from app.core.deadline import DeadlineExceededError, DeadlineMiddleware
 from app.api.v1.endpoints import food_nutritions as food_nutritions_router
+from app.api.v1.endpoints import imports as imports_router
+from app.api.v1.endpoints import snapshot_food_nutritions as snapshot_food_nutritions_router
+from app.db.session import engine, get_read_db
+from app.db.pool_metrics import get_pool_stats
+from app.imports import shutdown_import_executor
 from app.search import (
-    get_es_client,
     ping_es,
-    create_index_if_not_exists,
-    FOOD_NUTRITIONS_INDEX_NAME,
-    FOOD_NUTRITIONS_MAPPINGS
+    is_es_ready,
+    bootstrap_es_with_retry,
+    get_es_bootstrap_status,
+    es_admission_controller,
+    search_single_flight,
+    search_backend_counter
 )
+from app.repositories.food_nutrition_repository import read_single_flight
+from app.snapshot import get_read_snapshot, close_read_snapshot
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -18,19 +33,25 @@ logging.basicConfig(level=logging.INFO)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("FastAPI 애플리케이션 시작 중...")
-    try:
-        es_client = get_es_client()
-        create_index_if_not_exists(
-            es_client=es_client,
-            index_name=FOOD_NUTRITIONS_INDEX_NAME,
-            mappings_body=FOOD_NUTRITIONS_MAPPINGS
-        )
-    except Exception as e:
-        logger.error(f"애플리케이션 시작 중 Elasticsearch 관련 설정 오류 발생: {e}")
+    if settings.READ_SNAPSHOT_PATH:
+        ## 읽기 전용 스냅샷 모드: SQLite/Elasticsearch를 사용하지 않으므로 ES 초기화도 하지 않음
+        snapshot_info = get_read_snapshot().info()
+        logger.info(f"읽기 전용 스냅샷 모드로 시작합니다: {snapshot_info['path']} ({snapshot_info['row_count']}건, 버전 {snapshot_info['content_version']})")
+        yield
+        logger.info("FastAPI 애플리케이션 종료 중...")
+        close_read_snapshot()
+        return
+
+    ## Elasticsearch 초기화는 백그라운드에서 재시도하고, SQLite 기반 엔드포인트는 바로 요청을 받음
+    es_bootstrap_task = asyncio.create_task(bootstrap_es_with_retry())
     
     yield
     
     logger.info("FastAPI 애플리케이션 종료 중...")
+    es_bootstrap_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await es_bootstrap_task
+    shutdown_import_executor()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -38,6 +59,14 @@ app = FastAPI(
     description=settings.APP_DESCRIPTION,
     lifespan=lifespan
 )
+app.add_middleware(DeadlineMiddleware)
+app.add_middleware(TracingMiddleware)
+
+@app.exception_handler(DeadlineExceededError)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceededError):
+    ## 처리 시간 예산을 넘긴 요청은 남은 SQL/ES 작업을 중단하고 504로 응답
+    logger.warning(f"요청 deadline 초과: {request.method} {request.url.path}")
+    return JSONResponse(status_code=status.HTTP_504_GATEWAY_TIMEOUT, content={"detail": str(exc)})
 
 @app.get("/", tags=["Root"])
 async def read_root():
@@ -47,7 +76,8 @@ async def read_root():
 async def health_check():
     es_ping_ok = False
     try:
-        es_ping_ok = ping_es() 
+        ## 초기화 전에는 ping을 위해 클라이언트를 새로 만들지 않음 (연결 대기로 응답이 지연되지 않도록)
+        es_ping_ok = is_es_ready() and ping_es()
     except Exception:
         pass
     es_status = "connected" if es_ping_ok else "disconnected"
@@ -58,8 +88,100 @@ async def health_check():
         "elasticsearch_status": es_status
     }
 
-app.include_router(
-    food_nutritions_router.router,
-    prefix="/api/v1/food-nutritions",
-    tags=["FoodNutritions API"]
-)
\ No newline at end of file
+@app.get("/livez", tags=["Health Check"])
+async def liveness_probe():
+    return {"status": "ok"}
+
+def _readiness_from_snapshot() -> JSONResponse:
+    try:
+        snapshot_status = {"ready": True, **get_read_snapshot().info(), "error": None}
+    except Exception as e:
+        snapshot_status = {"ready": False, "path": settings.READ_SNAPSHOT_PATH, "error": str(e)}
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if snapshot_status["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": "ready" if snapshot_status["ready"] else "not_ready",
+            "dependencies": {"read_snapshot": snapshot_status},
+        },
+    )
+
+@app.get("/readyz", tags=["Health Check"])
+def readiness_probe(db: Session = Depends(get_read_db)):
+    if settings.READ_SNAPSHOT_PATH:
+        return _readiness_from_snapshot()
+
+    sqlite_ready = True
+    sqlite_error = None
+    try:
+        db.execute(text("SELECT 1"))
+    except Exception as e:
+        sqlite_ready = False
+        sqlite_error = str(e)
+
+    es_status = get_es_bootstrap_status()
+    is_ready = sqlite_ready and (es_status["ready"] or not settings.READINESS_REQUIRES_ES)
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if is_ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": "ready" if is_ready else "not_ready",
+            "dependencies": {
+                "sqlite": {"ready": sqlite_ready, "error": sqlite_error},
+                "elasticsearch": {**es_status, "required": settings.READINESS_REQUIRES_ES},
+            },
+        },
+    )
+
+@app.get("/metrics", tags=["Health Check"])
+async def read_metrics():
+    return {
+        "es_admission": es_admission_controller.stats(),
+        "single_flight": {
+            "es_search": search_single_flight.stats(),
+            "food_nutrition_read": read_single_flight.stats(),
+        },
+        "search_router": search_backend_counter.stats(),
+        "db_pool": get_pool_stats(engine),
+    }
+
+def _ensure_debug_traces_enabled():
+    if not settings.TRACING_DEBUG_ENDPOINT_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+@app.get("/debug/traces", tags=["Debug"], dependencies=[Depends(_ensure_debug_traces_enabled)])
+async def read_recent_traces(
+    limit: int = Query(20, ge=1, le=200, description="반환할 최대 trace 수 (최신순)"),
+    min_duration_ms: float = Query(0.0, ge=0, description="이 시간(ms) 이상 걸린 요청만 반환")
+):
+    """샘플링된 최근 요청의 span(엔드포인트, repository, SQL, ES)별 소요 시간을 반환합니다."""
+    return {
+        "sample_rate": settings.TRACING_SAMPLE_RATE if settings.TRACING_ENABLED else 0.0,
+        "traces": trace_ring_buffer.traces(limit=limit, min_duration_ms=min_duration_ms),
+    }
+
+@app.get("/debug/traces/{trace_id}", tags=["Debug"], dependencies=[Depends(_ensure_debug_traces_enabled)])
+async def read_trace(trace_id: str):
+    trace = trace_ring_buffer.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Trace {trace_id} not found")
+    return trace
+
+if settings.READ_SNAPSHOT_PATH:
+    ## 읽기 전용 스냅샷 모드에서는 조회/검색 엔드포인트만 제공하고 적재 API는 등록하지 않음
+    app.include_router(
+        snapshot_food_nutritions_router.router,
+        prefix="/api/v1/food-nutritions",
+        tags=["FoodNutritions API (read snapshot)"]
+    )
+else:
+    app.include_router(
+        food_nutritions_router.router,
+        prefix="/api/v1/food-nutritions",
+        tags=["FoodNutritions API"]
+    )
+
+    app.include_router(
+        imports_router.router,
+        prefix="/api/v1/imports",
+        tags=["Imports API"]
+    )
\ No newline at end of file
@@ -1 +1,2 @@
-from .food_nutrition import FoodNutrition
\ No newline at end of file
+from .food_nutrition import FoodNutrition
+from .food_nutrition_change import FoodNutritionChange
\ No newline at end of file
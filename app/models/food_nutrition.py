@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Index, Integer, String, Float
 from app.db.session import Base 
 
 class FoodNutrition(Base):
     __tablename__ = "food_nutritions"
+    ## 복합/커버링 인덱스 (alembic 8b3e1f6a9c2d와 동일하게 유지)
+    __table_args__ = (
+        Index("ix_food_nutritions_research_year_maker_name", "research_year", "maker_name"),
+        Index("ix_food_nutritions_food_cd_content_hash", "food_cd", "content_hash"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)          ## 1. 번호
     food_cd = Column(String(50), unique=True, index=True, nullable=False)           ## 2. 식품코드
@@ -22,5 +27,28 @@ class FoodNutrition(Base):
     saturated_fatty_acids = Column(Float)                                           ## 16. 포화지방산(g)(1회제공량당)
     trans_fat = Column(Float)                                                       ## 17. 트랜스지방(g)(1회제공량당)
 
+    content_hash = Column(String(16))                                               ## 변경 감지용 내용 해시
+
+    ## 100g당 값 (쓰기 시점에 serving_size로 환산해 저장, 필터/정렬용 인덱스)
+    calorie_per_100g = Column(Float, index=True)
+    carbohydrate_per_100g = Column(Float, index=True)
+    protein_per_100g = Column(Float, index=True)
+    province_per_100g = Column(Float, index=True)
+    sugars_per_100g = Column(Float, index=True)
+    salt_per_100g = Column(Float, index=True)
+    cholesterol_per_100g = Column(Float, index=True)
+    saturated_fatty_acids_per_100g = Column(Float, index=True)
+    trans_fat_per_100g = Column(Float, index=True)
+
+    ## 100kcal당 값 (영양 밀도, 쓰기 시점에 calorie로 환산해 저장)
+    carbohydrate_per_100kcal = Column(Float, index=True)
+    protein_per_100kcal = Column(Float, index=True)
+    province_per_100kcal = Column(Float, index=True)
+    sugars_per_100kcal = Column(Float, index=True)
+    salt_per_100kcal = Column(Float, index=True)
+    cholesterol_per_100kcal = Column(Float, index=True)
+    saturated_fatty_acids_per_100kcal = Column(Float, index=True)
+    trans_fat_per_100kcal = Column(Float, index=True)
+
     def __repr__(self):
         return f"<FoodNutrition(id={self.id}, food_name='{self.food_name}', food_cd='{self.food_cd}')>"
\ No newline at end of file
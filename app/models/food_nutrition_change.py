@@ -0,0 +1,17 @@
+from sqlalchemy import Column, DateTime, Integer, String, func
+from app.db.session import Base
+
+## 변경 피드 작업 종류 (upsert: 생성/수정, delete: 삭제 tombstone)
+CHANGE_OPERATION_UPSERT = "upsert"
+CHANGE_OPERATION_DELETE = "delete"
+
+class FoodNutritionChange(Base):
+    __tablename__ = "food_nutrition_changes"
+    ## AUTOINCREMENT: 삭제된 seq를 재사용하지 않아 변경 순서가 단조 증가함
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)                     ## 변경 순번
+    food_nutrition_id = Column(Integer, nullable=False)                             ## 변경된 food_nutritions.id (삭제 후에도 남도록 FK 없음)
+    food_cd = Column(String(50), nullable=False)                                    ## 변경 시점의 식품코드
+    operation = Column(String(10), nullable=False)                                  ## upsert / delete
+    changed_at = Column(DateTime, nullable=False, server_default=func.current_timestamp())  ## 변경 시각 (UTC)
@@ -1,21 +1,95 @@
+from sqlalchemy import Row, Select, case, delete, func, insert, literal, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Sequence, Tuple
+import hashlib
 import logging
 
+from app.core.config import settings
+from app.core.nutrition_calculator import LESS_THAN_1G_VALUE, NORMALIZED_NUTRIENT_FIELDS, NORMALIZED_NUTRIENT_SOURCES, compute_normalized_nutrients
+from app.core.single_flight import SingleFlight
+from app.core.tracing import traced
 from app.models.food_nutrition import FoodNutrition as FoodNutritionModel
-from app.schemas.food_nutrition import FoodNutritionCreate, FoodNutritionUpdate
+from app.models.food_nutrition_change import FoodNutritionChange as FoodNutritionChangeModel, CHANGE_OPERATION_UPSERT, CHANGE_OPERATION_DELETE
+from app.schemas.food_nutrition import FoodNutritionCreate, FoodNutritionUpdate, FoodNutritionUpsert, FOOD_NUTRITION_FIELDS
 
 from elasticsearch import Elasticsearch, exceptions as es_exceptions
-from app.search import get_es_client, FOOD_NUTRITIONS_INDEX_NAME
+from app.search import get_es_client, is_es_ready, FOOD_NUTRITIONS_INDEX_NAME, extract_chosung, decompose_jamo
 
 logger = logging.getLogger(__name__)
 
+read_single_flight = SingleFlight("food_nutrition_read")
+
+## 변경 감지 해시 계산에 사용하는 필드 (순서 고정)
+CONTENT_HASH_FIELDS = [
+    "food_cd", "food_name", "group_name", "research_year", "maker_name", "ref_name",
+    "serving_size", "calorie", "carbohydrate", "protein", "province", "sugars",
+    "salt", "cholesterol", "saturated_fatty_acids", "trans_fat",
+]
+CONTENT_HASH_SEPARATOR = "\x1f"
+CONTENT_HASH_NULL = "\\N"
+
+def hash_canonical_content(canonical: str) -> str:
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).hexdigest()
+
+def compute_content_hash(data: Dict[str, Any]) -> str:
+    """필드 값을 정규화한 문자열의 해시를 반환합니다. 로더의 벡터화된 해시 계산과 같은 결과를 내야 합니다."""
+    canonical_values = []
+    for field in CONTENT_HASH_FIELDS:
+        value = data.get(field)
+        if value is None:
+            canonical_values.append(CONTENT_HASH_NULL)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            canonical_values.append(str(float(value)))
+        else:
+            canonical_values.append(str(value))
+    return hash_canonical_content(CONTENT_HASH_SEPARATOR.join(canonical_values))
+
+def _content_hash_for_model(food_model: FoodNutritionModel) -> str:
+    return compute_content_hash({field: getattr(food_model, field) for field in CONTENT_HASH_FIELDS})
+
+CONTENT_HASH_SQL_FUNCTION = "food_content_hash"
+
+def _register_content_hash_function(db: Session) -> None:
+    ## UPDATE 문 안에서 행마다 content_hash를 다시 계산할 수 있도록 SQLite 사용자 함수로 등록
+    dbapi_connection = db.connection().connection.dbapi_connection
+    dbapi_connection.create_function(
+        CONTENT_HASH_SQL_FUNCTION, len(CONTENT_HASH_FIELDS),
+        lambda *values: compute_content_hash(dict(zip(CONTENT_HASH_FIELDS, values))),
+        deterministic=True
+    )
+
+def _content_hash_sql_expression(updates: Dict[str, Any]):
+    ## SET 절의 컬럼 참조는 수정 전 값이므로, 해시 계산에는 바뀌는 필드의 새 값을 직접 전달
+    table = FoodNutritionModel.__table__
+    hash_arguments = [literal(updates[field]) if field in updates else table.c[field] for field in CONTENT_HASH_FIELDS]
+    return getattr(func, CONTENT_HASH_SQL_FUNCTION)(*hash_arguments)
+
+def _normalized_nutrient_sql_expressions(updates: Dict[str, Any]) -> Dict[str, Any]:
+    ## 원본 성분이나 기준값(serving_size/calorie)이 바뀌는 정규화 컬럼만 같은 UPDATE 문에서 다시 계산
+    ## (계산식은 compute_normalized_nutrients 및 alembic e9a3b5c7d2f4 백필과 동일)
+    table = FoodNutritionModel.__table__
+    def value_of(field: str):
+        return literal(updates[field]) if field in updates else table.c[field]
+
+    expressions = {}
+    for field, (source, base) in NORMALIZED_NUTRIENT_SOURCES.items():
+        if source not in updates and base not in updates:
+            continue
+        source_value, base_value = value_of(source), value_of(base)
+        scaled = case((source_value == LESS_THAN_1G_VALUE, literal(0.0)), else_=source_value * 100.0)
+        expressions[field] = case((base_value > 0, scaled / base_value), else_=None)
+    return expressions
+
 def _get_es_doc_from_model(food_model: FoodNutritionModel) -> Dict[str, Any]:
     doc = {
         "id": food_model.id,
         "food_cd": food_model.food_cd,
         "group_name": food_model.group_name,
         "food_name": food_model.food_name,
+        "food_name_chosung": extract_chosung(food_model.food_name),
+        "food_name_jamo": decompose_jamo(food_model.food_name),
         "research_year": food_model.research_year,
         "maker_name": food_model.maker_name,
         "ref_name": food_model.ref_name,
@@ -29,82 +103,197 @@ def _get_es_doc_from_model(food_model: FoodNutritionModel) -> Dict[str, Any]:
         "cholesterol": food_model.cholesterol,
         "saturated_fatty_acids": food_model.saturated_fatty_acids,
         "trans_fat": food_model.trans_fat,
+        **{field: getattr(food_model, field) for field in NORMALIZED_NUTRIENT_FIELDS},
     }
     return {k: v for k, v in doc.items() if v is not None}
 
 
+class DuplicateFoodCdError(ValueError):
+    """food_cd UNIQUE 제약 조건 위반 (이미 다른 행이 같은 식품코드를 사용 중)."""
+    def __init__(self, food_cd: Optional[str]):
+        super().__init__(f"FoodNutrition with food_cd '{food_cd}' already exists.")
+        self.food_cd = food_cd
+
+def _record_change(db: Session, operation: str, food_nutrition_id: int, food_cd: str) -> None:
+    ## 쓰기와 같은 트랜잭션에서 변경 피드에 기록 (커밋 순서 = seq 순서)
+    db.execute(insert(FoodNutritionChangeModel.__table__).values(
+        food_nutrition_id=food_nutrition_id, food_cd=food_cd, operation=operation
+    ))
+
+def record_food_nutrition_changes(db: Session, operation: str, *conditions: Any) -> None:
+    """조건에 맞는 행들을 INSERT ... SELECT 한 문장으로 변경 피드에 기록합니다 (커밋은 호출한 쪽에서 수행)."""
+    table = FoodNutritionModel.__table__
+    db.execute(insert(FoodNutritionChangeModel.__table__).from_select(
+        ["food_nutrition_id", "food_cd", "operation"],
+        select(table.c.id, table.c.food_cd, literal(operation)).where(*conditions).order_by(table.c.id)
+    ))
+
+def _execute_write_returning(
+    db: Session, statement, food_cd: Optional[str], before_write: Optional[Callable[[], None]] = None
+) -> Optional[Row]:
+    ## 한 문장으로 쓰고 RETURNING으로 결과 행을 받음 (사전 조회/refresh SELECT 없이 제약 조건 위반으로 중복 판단)
+    ## before_write는 같은 트랜잭션에서 먼저 실행되므로 쓰기가 실패하면 함께 롤백됨
+    try:
+        if before_write is not None:
+            before_write()
+        row = db.execute(statement).first()
+        if row is not None:
+            _record_change(db, CHANGE_OPERATION_UPSERT, row.id, row.food_cd)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if "food_nutritions.food_cd" in str(e.orig):
+            raise DuplicateFoodCdError(food_cd) from e
+        raise
+    except Exception:
+        db.rollback()
+        raise
+    return row
+
+def _get_ready_es_client() -> Optional[Elasticsearch]:
+    ## 백그라운드 부트스트랩이 끝나기 전에는 쓰기마다 새 클라이언트를 만들어 ping(최대 ES_TIMEOUT)하지 않고 건너뜀
+    if not is_es_ready():
+        return None
+    return get_es_client()
+
+def _sync_food_nutrition_to_es(row: Row, action: str) -> None:
+    es_client = _get_ready_es_client()
+    if es_client is None:
+        logger.warning(f"ES Warning: Elasticsearch가 준비되지 않아 FoodNutrition ID {row.id} 즉시 동기화 {action} (을)를 건너뜁니다.")
+        return
+    try:
+        if es_client.ping():
+            es_client.index(
+                index=FOOD_NUTRITIONS_INDEX_NAME,
+                id=str(row.id),
+                body=_get_es_doc_from_model(row),
+                refresh="wait_for"
+            )
+            logger.info(f"Elasticsearch: FoodNutrition ID {row.id} {action} 완료 (즉시 동기화).")
+        else:
+            logger.warning(f"ES Connection Error: FoodNutrition ID {row.id} 즉시 동기화 {action} 실패 (ping 실패).")
+    except es_exceptions.ConnectionError as e:
+        logger.error(f"ES Connection Error: FoodNutrition ID {row.id} 즉시 동기화 {action} 중 연결 오류: {e}")
+    except Exception as e:
+        logger.error(f"ES Error: FoodNutrition ID {row.id} 즉시 동기화 {action} 중 오류: {e}")
+
+def _delete_food_nutrition_from_es(food_nutrition_id: str) -> None:
+    es_client = _get_ready_es_client()
+    if es_client is None:
+        logger.warning(f"ES Warning: Elasticsearch가 준비되지 않아 FoodNutrition ID {food_nutrition_id} 즉시 동기화 삭제를 건너뜁니다.")
+        return
+    try:
+        if es_client.ping():
+            es_client.delete(
+                index=FOOD_NUTRITIONS_INDEX_NAME,
+                id=food_nutrition_id,
+                refresh="wait_for"
+            )
+            logger.info(f"Elasticsearch: FoodNutrition ID {food_nutrition_id} 삭제 완료 (즉시 동기화).")
+        else:
+            logger.warning(f"ES Connection Error: FoodNutrition ID {food_nutrition_id} 즉시 동기화 삭제 실패 (ping 실패).")
+    except es_exceptions.NotFoundError:
+        logger.warning(f"ES Warning: FoodNutrition ID {food_nutrition_id} (은)는 Elasticsearch 인덱스에 존재하지 않아 삭제할 수 없습니다.")
+    except es_exceptions.ConnectionError as e:
+        logger.error(f"ES Connection Error: FoodNutrition ID {food_nutrition_id} 즉시 동기화 삭제 중 연결 오류: {e}")
+    except Exception as e:
+        logger.error(f"ES Error: FoodNutrition ID {food_nutrition_id} 즉시 동기화 삭제 중 오류: {e}")
+
+
+
+@traced(kind="repository")
 def create_food_nutrition(
     db: Session, 
     food_nutrition: FoodNutritionCreate, 
     sync_to_es: bool = True
-) -> FoodNutritionModel:
-    db_food_nutrition = FoodNutritionModel(**food_nutrition.model_dump())
-    db.add(db_food_nutrition)
-    db.commit()
-    db.refresh(db_food_nutrition)
+) -> Row:
+    """INSERT ... RETURNING 한 문장으로 생성합니다. food_cd가 이미 있으면 DuplicateFoodCdError가 발생합니다."""
+    food_nutrition_data = food_nutrition.model_dump()
+    table = FoodNutritionModel.__table__
+    statement = (
+        insert(table)
+        .values(
+            **food_nutrition_data,
+            **compute_normalized_nutrients(food_nutrition_data),
+            content_hash=compute_content_hash(food_nutrition_data)
+        )
+        .returning(*table.c)
+    )
+    db_food_nutrition = _execute_write_returning(db, statement, food_nutrition.food_cd)
     logger.info(f"SQLite: FoodNutrition ID {db_food_nutrition.id} ({db_food_nutrition.food_name}) 생성 완료.")
 
     if sync_to_es:
-        try:
-            es_client = get_es_client()
-            if es_client.ping():
-                doc_body = _get_es_doc_from_model(db_food_nutrition)
-                es_client.index(
-                    index=FOOD_NUTRITIONS_INDEX_NAME,
-                    id=str(db_food_nutrition.id),
-                    body=doc_body,
-                    refresh="wait_for"
-                )
-                logger.info(f"Elasticsearch: FoodNutrition ID {db_food_nutrition.id} 인덱싱 완료 (즉시 동기화).")
-            else:
-                logger.warning(f"ES Connection Error: FoodNutrition ID {db_food_nutrition.id} 즉시 동기화 실패 (ping 실패).")
-        except es_exceptions.ConnectionError as e:
-            logger.error(f"ES Connection Error: FoodNutrition ID {db_food_nutrition.id} 즉시 동기화 중 연결 오류: {e}")
-        except Exception as e:
-            logger.error(f"ES Error: FoodNutrition ID {db_food_nutrition.id} 즉시 동기화 중 오류: {e}")
-            
+        _sync_food_nutrition_to_es(db_food_nutrition, "인덱싱")
     return db_food_nutrition
 
 
+@traced(kind="repository")
 def update_food_nutrition(
     db: Session, 
     food_nutrition_id: int, 
     food_nutrition_update: FoodNutritionUpdate,
     sync_to_es: bool = True
-) -> Optional[FoodNutritionModel]:
-    db_food_nutrition = db.query(FoodNutritionModel).filter(FoodNutritionModel.id == food_nutrition_id).first()
-    if db_food_nutrition:
-        update_data = food_nutrition_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(db_food_nutrition, key, value)
-        db.add(db_food_nutrition)
-        db.commit()
-        db.refresh(db_food_nutrition)
-        logger.info(f"SQLite: FoodNutrition ID {db_food_nutrition.id} 업데이트 완료.")
+) -> Optional[Row]:
+    """UPDATE ... RETURNING 한 문장으로 수정합니다. 행이 없으면 None, food_cd가 겹치면 DuplicateFoodCdError가 발생합니다."""
+    update_data = food_nutrition_update.model_dump(exclude_unset=True)
+    table = FoodNutritionModel.__table__
+    _register_content_hash_function(db)
+    statement = (
+        update(table)
+        .where(table.c.id == food_nutrition_id)
+        .values(
+            **update_data,
+            **_normalized_nutrient_sql_expressions(update_data),
+            content_hash=_content_hash_sql_expression(update_data)
+        )
+        .returning(*table.c)
+    )
+    before_write = None
+    if "food_cd" in update_data:
+        ## 식품코드가 바뀌면 이전 (id, food_cd)의 tombstone을 먼저 남겨 변경 피드 소비자가 이전 코드를 지우도록 함
+        before_write = lambda: record_food_nutrition_changes(
+            db, CHANGE_OPERATION_DELETE, table.c.id == food_nutrition_id, table.c.food_cd != update_data["food_cd"]
+        )
+    db_food_nutrition = _execute_write_returning(db, statement, update_data.get("food_cd"), before_write)
+    if db_food_nutrition is None:
+        return None
+    logger.info(f"SQLite: FoodNutrition ID {db_food_nutrition.id} 업데이트 완료.")
 
-        if sync_to_es:
-            try:
-                es_client = get_es_client()
-                if es_client.ping():
-                    doc_body = _get_es_doc_from_model(db_food_nutrition)
-                    es_client.index(
-                        index=FOOD_NUTRITIONS_INDEX_NAME,
-                        id=str(db_food_nutrition.id),
-                        body=doc_body,
-                        refresh="wait_for"
-                    )
-                    logger.info(f"Elasticsearch: FoodNutrition ID {db_food_nutrition.id} 업데이트 완료 (즉시 동기화).")
-                else:
-                    logger.warning(f"ES Connection Error: FoodNutrition ID {db_food_nutrition.id} 즉시 동기화 업데이트 실패 (ping 실패).")
-            except es_exceptions.ConnectionError as e:
-                logger.error(f"ES Connection Error: FoodNutrition ID {db_food_nutrition.id} 즉시 동기화 업데이트 중 연결 오류: {e}")
-            except Exception as e:
-                logger.error(f"ES Error: FoodNutrition ID {db_food_nutrition.id} 즉시 동기화 업데이트 중 오류: {e}")
-            
-        return db_food_nutrition
-    return None
+    if sync_to_es:
+        _sync_food_nutrition_to_es(db_food_nutrition, "업데이트")
+    return db_food_nutrition
+
+
+@traced(kind="repository")
+def upsert_food_nutrition_by_food_cd(
+    db: Session,
+    food_cd: str,
+    food_nutrition: FoodNutritionUpsert,
+    sync_to_es: bool = True
+) -> Row:
+    """INSERT ... ON CONFLICT(food_cd) DO UPDATE ... RETURNING 한 문장으로 식품코드 기준 생성 또는 전체 수정합니다."""
+    food_nutrition_data = {**food_nutrition.model_dump(), "food_cd": food_cd}
+    table = FoodNutritionModel.__table__
+    normalized_nutrients = compute_normalized_nutrients(food_nutrition_data)
+    insert_statement = sqlite_insert(table).values(
+        **food_nutrition_data, **normalized_nutrients, content_hash=compute_content_hash(food_nutrition_data)
+    )
+    statement = insert_statement.on_conflict_do_update(
+        index_elements=[table.c.food_cd],
+        set_={
+            column: insert_statement.excluded[column]
+            for column in [*food_nutrition_data, *normalized_nutrients, "content_hash"] if column != "food_cd"
+        },
+    ).returning(*table.c)
+    db_food_nutrition = _execute_write_returning(db, statement, food_cd)
+    logger.info(f"SQLite: FoodNutrition ID {db_food_nutrition.id} (food_cd={food_cd}) upsert 완료.")
+
+    if sync_to_es:
+        _sync_food_nutrition_to_es(db_food_nutrition, "upsert")
+    return db_food_nutrition
 
 
+@traced(kind="repository")
 def delete_food_nutrition(
     db: Session, 
     food_nutrition_id: int,
@@ -113,40 +302,321 @@ def delete_food_nutrition(
     db_food_nutrition = db.query(FoodNutritionModel).filter(FoodNutritionModel.id == food_nutrition_id).first()
     if db_food_nutrition:
         deleted_item_id_str = str(db_food_nutrition.id)
+        _record_change(db, CHANGE_OPERATION_DELETE, db_food_nutrition.id, db_food_nutrition.food_cd)
         db.delete(db_food_nutrition)
         db.commit()
         logger.info(f"SQLite: FoodNutrition ID {deleted_item_id_str} 삭제 완료.")
 
         if sync_to_es:
-            try:
-                es_client = get_es_client()
-                if es_client.ping():
-                    es_client.delete(
-                        index=FOOD_NUTRITIONS_INDEX_NAME,
-                        id=deleted_item_id_str,
-                        refresh="wait_for"
-                    )
-                    logger.info(f"Elasticsearch: FoodNutrition ID {deleted_item_id_str} 삭제 완료 (즉시 동기화).")
-                else:
-                    logger.warning(f"ES Connection Error: FoodNutrition ID {deleted_item_id_str} 즉시 동기화 삭제 실패 (ping 실패).")
-            except es_exceptions.NotFoundError:
-                logger.warning(f"ES Warning: FoodNutrition ID {deleted_item_id_str} (은)는 Elasticsearch 인덱스에 존재하지 않아 삭제할 수 없습니다.")
-            except es_exceptions.ConnectionError as e:
-                logger.error(f"ES Connection Error: FoodNutrition ID {deleted_item_id_str} 즉시 동기화 삭제 중 연결 오류: {e}")
-            except Exception as e:
-                logger.error(f"ES Error: FoodNutrition ID {deleted_item_id_str} 즉시 동기화 삭제 중 오류: {e}")
+            _delete_food_nutrition_from_es(deleted_item_id_str)
 
         return db_food_nutrition
     logger.warning(f"SQLite: 삭제할 FoodNutrition ID {food_nutrition_id} (을)를 찾지 못했습니다.")
     return None
 
+## 일괄 수정 시 ES 문서에 변경 값을 반영하는 스크립트 (None은 필드 삭제: 인덱싱 시 None 필드를 제외하는 것과 동일)
+## params.normalized가 있으면 변경 후 값으로 정규화 필드를 다시 계산 (SQLite의 _normalized_nutrient_sql_expressions와 같은 계산)
+ES_BULK_UPDATE_SCRIPT = (
+    "for (entry in params.updates.entrySet()) {"
+    " if (entry.getValue() == null) { ctx._source.remove(entry.getKey()) }"
+    " else { ctx._source[entry.getKey()] = entry.getValue() } }"
+    " for (entry in params.normalized.entrySet()) {"
+    " def value = ctx._source[entry.getValue()[0]]; def base = ctx._source[entry.getValue()[1]];"
+    " if (value == null || base == null || base <= 0) { ctx._source.remove(entry.getKey()) }"
+    " else { ctx._source[entry.getKey()] = (value == params.less_than_1g ? 0.0 : value * 100.0) / base } }"
+)
+def _bulk_filter_conditions(
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    ref_name: Optional[str] = None,
+    food_cd: Optional[str] = None
+) -> List[Any]:
+    table = FoodNutritionModel.__table__
+    filters = {"research_year": research_year, "maker_name": maker_name, "ref_name": ref_name, "food_cd": food_cd}
+    conditions = [table.c[field] == value for field, value in filters.items() if value is not None]
+    if not conditions:
+        ## 실수로 전체 테이블을 수정/삭제하지 않도록 필터를 하나 이상 요구
+        raise ValueError("일괄 수정/삭제에는 필터(research_year, maker_name, ref_name, food_code)가 하나 이상 필요합니다.")
+    return conditions
+
+def _build_es_bulk_filter_query(
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    ref_name: Optional[str] = None,
+    food_cd: Optional[str] = None
+) -> Dict[str, Any]:
+    ## SQLite 필터와 같은 정확히 일치 조건 (text 필드는 keyword 서브필드로 비교)
+    terms = {"research_year": research_year, "maker_name.keyword": maker_name, "ref_name.keyword": ref_name, "food_cd": food_cd}
+    return {"query": {"bool": {"filter": [{"term": {field: value}} for field, value in terms.items() if value is not None]}}}
+
+def _sync_bulk_operation_to_es(operation: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    es_client = _get_ready_es_client()
+    if es_client is None:
+        logger.warning(f"ES Warning: Elasticsearch가 준비되지 않아 일괄 {operation} 동기화를 건너뜁니다.")
+        return {"es_affected": None, "es_synced": False, "es_error": "Elasticsearch가 준비되지 않았습니다."}
+    try:
+        if operation == "update":
+            response = es_client.update_by_query(
+                index=FOOD_NUTRITIONS_INDEX_NAME, body=body, conflicts="proceed", refresh=True, wait_for_completion=True,
+                request_timeout=settings.ES_BULK_BY_QUERY_TIMEOUT_SECONDS
+            )
+        else:
+            response = es_client.delete_by_query(
+                index=FOOD_NUTRITIONS_INDEX_NAME, body=body, conflicts="proceed", refresh=True, wait_for_completion=True,
+                request_timeout=settings.ES_BULK_BY_QUERY_TIMEOUT_SECONDS
+            )
+    except Exception as e:
+        logger.error(f"ES Error: 일괄 {operation} 동기화 중 오류: {e}")
+        return {"es_affected": None, "es_synced": False, "es_error": str(e)}
+
+    es_affected = response.get("updated" if operation == "update" else "deleted", 0)
+    failures = response.get("failures") or []
+    if failures:
+        logger.error(f"ES Error: 일괄 {operation} 중 {len(failures)}건 실패: {failures[:3]}")
+        return {"es_affected": es_affected, "es_synced": False, "es_error": f"{len(failures)}건 반영 실패"}
+    logger.info(f"Elasticsearch: 일괄 {operation} {es_affected}건 반영 완료.")
+    return {"es_affected": es_affected, "es_synced": True, "es_error": None}
+
+@traced(kind="repository")
+def bulk_update_food_nutritions(
+    db: Session,
+    updates: Dict[str, Any],
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    ref_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    sync_to_es: bool = True
+) -> Dict[str, Any]:
+    """필터에 맞는 행을 하나의 UPDATE 문(한 트랜잭션)으로 수정하고, ES에는 `_update_by_query` 한 번으로 반영합니다.
+
+    content_hash와 100g당/100kcal당 정규화 컬럼도 같은 UPDATE 문에서 행마다 다시 계산합니다.
+    """
+    if not updates:
+        raise ValueError("수정할 필드가 없습니다.")
+    filters = {"research_year": research_year, "maker_name": maker_name, "ref_name": ref_name, "food_cd": food_cd}
+    conditions = _bulk_filter_conditions(**filters)
+
+    _register_content_hash_function(db)
+    statement = (
+        update(FoodNutritionModel.__table__)
+        .where(*conditions)
+        .values(
+            **updates,
+            **_normalized_nutrient_sql_expressions(updates),
+            content_hash=_content_hash_sql_expression(updates)
+        )
+    )
+    try:
+        ## 필터 컬럼이 바뀌어도 대상 행을 놓치지 않도록 UPDATE 전에 같은 조건으로 변경 피드에 기록
+        record_food_nutrition_changes(db, CHANGE_OPERATION_UPSERT, *conditions)
+        affected = db.execute(statement).rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    logger.info(f"SQLite: 필터 {filters}에 맞는 FoodNutrition {affected}건 일괄 수정 완료.")
+
+    result: Dict[str, Any] = {"affected": affected, "es_affected": None, "es_synced": False, "es_error": None}
+    if sync_to_es and affected:
+        normalized = {
+            field: list(NORMALIZED_NUTRIENT_SOURCES[field]) for field in _normalized_nutrient_sql_expressions(updates)
+        }
+        script_params = {"updates": updates, "normalized": normalized, "less_than_1g": LESS_THAN_1G_VALUE}
+        body = {**_build_es_bulk_filter_query(**filters), "script": {"source": ES_BULK_UPDATE_SCRIPT, "lang": "painless", "params": script_params}}
+        result.update(_sync_bulk_operation_to_es("update", body))
+    elif not affected:
+        result["es_synced"] = True
+    return result
+
+@traced(kind="repository")
+def bulk_delete_food_nutritions(
+    db: Session,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    ref_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    sync_to_es: bool = True
+) -> Dict[str, Any]:
+    """필터에 맞는 행을 하나의 DELETE 문(한 트랜잭션)으로 삭제하고, ES에는 `_delete_by_query` 한 번으로 반영합니다."""
+    filters = {"research_year": research_year, "maker_name": maker_name, "ref_name": ref_name, "food_cd": food_cd}
+    conditions = _bulk_filter_conditions(**filters)
+    try:
+        record_food_nutrition_changes(db, CHANGE_OPERATION_DELETE, *conditions)
+        affected = db.execute(delete(FoodNutritionModel.__table__).where(*conditions)).rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    logger.info(f"SQLite: 필터 {filters}에 맞는 FoodNutrition {affected}건 일괄 삭제 완료.")
+
+    result: Dict[str, Any] = {"affected": affected, "es_affected": None, "es_synced": False, "es_error": None}
+    if sync_to_es and affected:
+        result.update(_sync_bulk_operation_to_es("delete", _build_es_bulk_filter_query(**filters)))
+    elif not affected:
+        result["es_synced"] = True
+    return result
+
+@traced(kind="repository")
 def get_food_nutrition(db: Session, food_nutrition_id: int) -> Optional[FoodNutritionModel]:
     return db.query(FoodNutritionModel).filter(FoodNutritionModel.id == food_nutrition_id).first()
 
+@traced(kind="repository")
+def get_food_nutrition_coalesced(db: Session, food_nutrition_id: int) -> Optional[FoodNutritionModel]:
+    """동시에 들어온 같은 ID 조회를 하나의 SELECT로 합칩니다.
+
+    반환된 객체는 먼저 들어온 요청의 세션에서 읽은 것이므로 읽기 전용(응답 직렬화)으로만 사용해야 합니다.
+    """
+    if not settings.SINGLE_FLIGHT_ENABLED:
+        return get_food_nutrition(db, food_nutrition_id)
+    return read_single_flight.do(food_nutrition_id, get_food_nutrition, db, food_nutrition_id)
+
+@traced(kind="repository")
 def get_food_nutrition_by_food_cd(db: Session, food_cd: str) -> Optional[FoodNutritionModel]:
     return db.query(FoodNutritionModel).filter(FoodNutritionModel.food_cd == food_cd).first()
 
+def _apply_list_filters(
+    query,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = (),
+    sort: Optional[Tuple[str, bool]] = None
+):
+    ## 목록/건수 조회 필터는 인덱스가 있는 컬럼의 정확히 일치 조건과 정규화 영양성분의 범위 조건만 지원
+    if research_year is not None:
+        query = query.filter(FoodNutritionModel.research_year == research_year)
+    if maker_name is not None:
+        query = query.filter(FoodNutritionModel.maker_name == maker_name)
+    if food_cd is not None:
+        query = query.filter(FoodNutritionModel.food_cd == food_cd)
+    table = FoodNutritionModel.__table__
+    for field, minimum, maximum in ranges:
+        if minimum is not None:
+            query = query.filter(table.c[field] >= minimum)
+        if maximum is not None:
+            query = query.filter(table.c[field] <= maximum)
+    if sort is not None:
+        ## 정렬 필드 값이 없는 행은 목록/건수에서 제외
+        query = query.filter(table.c[sort[0]].is_not(None))
+    return query
+
+def _apply_list_order(query, sort: Optional[Tuple[str, bool]] = None):
+    ## 정규화 영양성분 정렬은 (값, id) 순 (컬럼 인덱스가 rowid를 포함하므로 인덱스 순서대로 읽고 정렬하지 않음)
+    if sort is None:
+        return query.order_by(FoodNutritionModel.id)
+    field, descending = sort
+    column = FoodNutritionModel.__table__.c[field]
+    if descending:
+        return query.order_by(column.desc(), FoodNutritionModel.id.desc())
+    return query.order_by(column, FoodNutritionModel.id)
+
+@traced(kind="repository")
 def get_food_nutritions(
-    db: Session, skip: int = 0, limit: int = 100
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    sort: Optional[Tuple[str, bool]] = None,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = ()
 ) -> List[FoodNutritionModel]:
-    return db.query(FoodNutritionModel).offset(skip).limit(limit).all()
\ No newline at end of file
+    query = _apply_list_filters(db.query(FoodNutritionModel), research_year, maker_name, food_cd, ranges, sort)
+    return _apply_list_order(query, sort).offset(skip).limit(limit).all()
+
+@traced(kind="repository")
+def count_food_nutritions(
+    db: Session,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = (),
+    sort: Optional[Tuple[str, bool]] = None
+) -> int:
+    """목록 조회와 같은 조건의 건수를 반환합니다. sort를 넘기면 목록처럼 정렬 필드 값이 없는 행을 제외하고 셉니다."""
+    query = _apply_list_filters(db.query(func.count(FoodNutritionModel.id)), research_year, maker_name, food_cd, ranges, sort)
+    return query.scalar()
+
+def _select_read_columns(fields: Optional[Sequence[str]] = None) -> Select:
+    ## ORM 엔티티 대신 테이블 컬럼을 직접 SELECT (identity map, 속성 계측, 객체 생성 비용 없음)
+    table = FoodNutritionModel.__table__
+    return select(*(table.c[field] for field in (fields or FOOD_NUTRITION_FIELDS)))
+
+@traced(kind="repository")
+def get_food_nutrition_columns(db: Session, food_nutrition_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+    """요청한 컬럼만 SELECT해서 dict로 반환합니다 (ORM 객체를 만들지 않음)."""
+    row = db.execute(_select_read_columns(fields).where(FoodNutritionModel.id == food_nutrition_id)).first()
+    return dict(zip(fields, row)) if row is not None else None
+
+@traced(kind="repository")
+def get_food_nutrition_rows(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    sort: Optional[Tuple[str, bool]] = None,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = ()
+) -> List[Row]:
+    """목록 조회용 Core SELECT 경로입니다. ORM 객체 대신 필드 순서대로 값을 가진 Row(튜플)를 반환합니다.
+
+    fields를 생략하면 API 응답 필드(FOOD_NUTRITION_FIELDS) 전체를 조회합니다.
+    sort(정규화 영양성분, 내림차순 여부)를 지정하면 그 값이 없는 행은 결과에서 제외됩니다.
+    """
+    query = _apply_list_filters(_select_read_columns(fields), research_year, maker_name, food_cd, ranges, sort)
+    return db.execute(_apply_list_order(query, sort).offset(skip).limit(limit)).all()
+
+@traced(kind="repository")
+def get_food_nutritions_by_ids_or_food_cds(
+    db: Session,
+    fields: Sequence[str],
+    ids: Sequence[int] = (),
+    food_cds: Sequence[str] = ()
+) -> List[Dict[str, Any]]:
+    """id 또는 food_cd 목록에 해당하는 행을 한 번의 쿼리로 조회해 선택한 컬럼만 dict로 반환합니다."""
+    conditions = []
+    if ids:
+        conditions.append(FoodNutritionModel.id.in_(set(ids)))
+    if food_cds:
+        conditions.append(FoodNutritionModel.food_cd.in_(set(food_cds)))
+    if not conditions:
+        return []
+    rows = db.execute(_select_read_columns(fields).where(or_(*conditions))).all()
+    return [dict(zip(fields, row)) for row in rows]
+
+@traced(kind="repository")
+def get_food_nutrition_changes(db: Session, since: int = 0, limit: int = 100) -> Dict[str, Any]:
+    """seq가 since보다 큰 변경을 순서대로 최대 limit건 조회합니다.
+
+    upsert는 현재 행 전체를 함께 반환하고, delete는 tombstone(id, food_cd)만 반환합니다.
+    이후 삭제된 행의 upsert는 뒤따르는 tombstone으로 대체되므로 건너뛰지만 next_since는 그 seq까지 진행합니다.
+    """
+    changes = FoodNutritionChangeModel.__table__
+    table = FoodNutritionModel.__table__
+    ## id가 재사용된 다른 식품 행과 이어지지 않도록 food_cd도 함께 비교 (food_cd 수정은 이전 코드의 tombstone + 새 코드의 upsert로 기록됨)
+    query = (
+        select(changes.c.seq, changes.c.operation, changes.c.food_nutrition_id, changes.c.food_cd, changes.c.changed_at,
+               *(table.c[field] for field in FOOD_NUTRITION_FIELDS))
+        .select_from(changes.outerjoin(table, (table.c.id == changes.c.food_nutrition_id) & (table.c.food_cd == changes.c.food_cd)))
+        .where(changes.c.seq > since)
+        .order_by(changes.c.seq)
+        .limit(limit + 1)
+    )
+    rows = db.execute(query).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    entries = []
+    for seq, operation, food_nutrition_id, food_cd, changed_at, *values in rows:
+        data = None
+        if operation == CHANGE_OPERATION_UPSERT:
+            if values[0] is None:
+                continue
+            data = dict(zip(FOOD_NUTRITION_FIELDS, values))
+        entries.append({
+            "seq": seq, "operation": operation, "id": food_nutrition_id,
+            "food_cd": food_cd, "changed_at": changed_at, "data": data,
+        })
+    return {"changes": entries, "next_since": rows[-1].seq if rows else since, "has_more": has_more}
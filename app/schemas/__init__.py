@@ -2,7 +2,33 @@ from .food_nutrition import (
     FoodNutritionBase,
     FoodNutritionCreate,
     FoodNutritionUpdate,
+    FoodNutritionUpsert,
     FoodNutrition,
     FoodNutritionSearchResponse,
-    FoodNutritionInDBBase
-)
\ No newline at end of file
+    FoodNutritionSearchProfileResponse,
+    FoodNutritionSearchParams,
+    FoodNutritionBatchSearchResult,
+    FoodNutritionCountResponse,
+    FoodNutritionChange,
+    FoodNutritionChangeFeedResponse,
+    FoodNutritionBulkUpdate,
+    FoodNutritionBulkOperationResponse,
+    NutritionCalculationItem,
+    NutritionCalculationMeal,
+    NutritionCalculationRequest,
+    NutrientAmounts,
+    NutritionCalculationItemResult,
+    NutritionCalculationMealResult,
+    NutritionCalculationResponse,
+    FoodNutritionInDBBase,
+    FoodNutritionNormalizedNutrients,
+    FOOD_NUTRITION_FIELDS,
+    NORMALIZED_NUTRIENT_FIELDS,
+    SORTABLE_FOOD_NUTRITION_FIELDS,
+    parse_fields_param,
+    parse_sort_param,
+    parse_range_params,
+    get_partial_food_nutrition_schema,
+    get_partial_food_nutrition_list_adapter
+)
+from .import_job import ImportJobStatus
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List 
+from pydantic import BaseModel, Field, TypeAdapter, create_model, field_validator, model_validator
+from typing import Optional, List, Literal, Dict, Any, Tuple, Type
 from pydantic.config import ConfigDict
+from functools import lru_cache
+from datetime import datetime
 
 class FoodNutritionBase(BaseModel):
     food_cd: str = Field(..., json_schema_extra={'example': "01"}, description="식품코드드")
@@ -45,8 +47,47 @@ class FoodNutritionUpdate(BaseModel):
 
 
 
+## 식품코드 기준 upsert(PUT /by-code/{food_cd})는 경로의 식품코드로 생성하거나 모든 필드를 교체 (생략한 필드는 null)
+class FoodNutritionUpsert(BaseModel):
+    food_name: str = Field(..., json_schema_extra={'example': "example_food_name"}, description="식품이름")
+    group_name: Optional[str] = Field(None, json_schema_extra={'example': "example_group_name"}, description="식품군")
+    research_year: Optional[str] = Field(None, json_schema_extra={'example': "2025"}, description="조사년도")
+    maker_name: Optional[str] = Field(None, json_schema_extra={'example': "example_maker_name"}, description="지역/제조사")
+    ref_name: Optional[str] = Field(None, json_schema_extra={'example': "example_ref_name"}, description="자료출처")
+    serving_size: Optional[float] = Field(None, json_schema_extra={'example': 100.0}, description="1회 제공량")
+    calorie: Optional[float] = Field(None, json_schema_extra={'example': 30.5}, description="열량(kcal)(1회제공량당)")
+    carbohydrate: Optional[float] = Field(None, json_schema_extra={'example': 5.5}, description="탄수화물(g)(1회제공량당)")
+    protein: Optional[float] = Field(None, json_schema_extra={'example': 2.1}, description="단백질(g)(1회제공량당)")
+    province: Optional[float] = Field(None, json_schema_extra={'example': 0.5}, description="지방(g)(1회제공량당)")
+    sugars: Optional[float] = Field(None, json_schema_extra={'example': 1.0}, description="총당류(g)(1회제공량당)")
+    salt: Optional[float] = Field(None, json_schema_extra={'example': 700.0}, description="나트륨(mg)(1회제공량당)")
+    cholesterol: Optional[float] = Field(None, json_schema_extra={'example': 0.0}, description="콜레스테롤(mg)(1회제공량당)")
+    saturated_fatty_acids: Optional[float] = Field(None, json_schema_extra={'example': 0.1}, description="포화지방산(g)(1회제공량당)")
+    trans_fat: Optional[float] = Field(None, json_schema_extra={'example': 0.0}, description="트랜스지방(g)(1회제공량당)")
+
+
+## 쓰기 시점에 계산해 저장하는 정규화 영양성분 (응답 전용, 생성/수정 요청으로는 받지 않음)
+class FoodNutritionNormalizedNutrients(BaseModel):
+    calorie_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 30.5}, description="열량(kcal)(100g당)")
+    carbohydrate_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 5.5}, description="탄수화물(g)(100g당)")
+    protein_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 2.1}, description="단백질(g)(100g당)")
+    province_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 0.5}, description="지방(g)(100g당)")
+    sugars_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 1.0}, description="총당류(g)(100g당)")
+    salt_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 700.0}, description="나트륨(mg)(100g당)")
+    cholesterol_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 0.0}, description="콜레스테롤(mg)(100g당)")
+    saturated_fatty_acids_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 0.1}, description="포화지방산(g)(100g당)")
+    trans_fat_per_100g: Optional[float] = Field(None, json_schema_extra={'example': 0.0}, description="트랜스지방(g)(100g당)")
+    carbohydrate_per_100kcal: Optional[float] = Field(None, json_schema_extra={'example': 18.03}, description="탄수화물(g)(100kcal당)")
+    protein_per_100kcal: Optional[float] = Field(None, json_schema_extra={'example': 6.89}, description="단백질(g)(100kcal당)")
+    province_per_100kcal: Optional[float] = Field(None, json_schema_extra={'example': 1.64}, description="지방(g)(100kcal당)")
+    sugars_per_100kcal: Optional[float] = Field(None, json_schema_extra={'example': 3.28}, description="총당류(g)(100kcal당)")
+    salt_per_100kcal: Optional[float] = Field(None, json_schema_extra={'example': 2295.08}, description="나트륨(mg)(100kcal당)")
+    cholesterol_per_100kcal: Optional[float] = Field(None, json_schema_extra={'example': 0.0}, description="콜레스테롤(mg)(100kcal당)")
+    saturated_fatty_acids_per_100kcal: Optional[float] = Field(None, json_schema_extra={'example': 0.33}, description="포화지방산(g)(100kcal당)")
+    trans_fat_per_100kcal: Optional[float] = Field(None, json_schema_extra={'example': 0.0}, description="트랜스지방(g)(100kcal당)")
+
 ## DB에서 읽어온 데이터
-class FoodNutritionInDBBase(FoodNutritionBase):
+class FoodNutritionInDBBase(FoodNutritionNormalizedNutrients, FoodNutritionBase):
     id: int = Field(..., json_schema_extra={'example': 1}, description="Id")
     model_config = ConfigDict(from_attributes=True)
 
@@ -55,7 +96,7 @@ class FoodNutrition(FoodNutritionInDBBase):
     pass
 
 ## Search API 응답용 스키마
-class FoodNutritionSearchResponse(BaseModel):
+class FoodNutritionSearchResponse(FoodNutritionNormalizedNutrients):
     id: int
     food_cd: str
     group_name: Optional[str] = None
@@ -74,4 +115,206 @@ class FoodNutritionSearchResponse(BaseModel):
     saturated_fatty_acids: Optional[float] = None
     trans_fat: Optional[float] = None
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+## Search API 프로파일링(profile=true) 응답용 스키마
+class FoodNutritionSearchProfileResponse(BaseModel):
+    results: List[FoodNutritionSearchResponse]
+    took: Optional[int] = Field(None, description="Elasticsearch 검색 소요 시간(ms)")
+    profile: Optional[Dict[str, Any]] = Field(None, description="Elasticsearch profile API 결과")
+
+
+## Batch Search API 요청/응답용 스키마 (GET /search/와 같은 검색 조건)
+class FoodNutritionSearchParams(BaseModel):
+    food_name: Optional[str] = Field(None, description="검색할 식품 이름 (부분 일치)")
+    research_year: Optional[str] = Field(None, description="조사년도 (YYYY)")
+    maker_name: Optional[str] = Field(None, description="지역/제조사 (부분 일치)")
+    food_code: Optional[str] = Field(None, description="식품코드")
+    skip: int = Field(0, ge=0, description="건너뛸 결과 수")
+    limit: int = Field(10, ge=1, le=100, description="반환할 최대 결과 수")
+    mode: Literal["standard", "chosung", "fuzzy"] = Field("standard", description="식품 이름 검색 모드 (standard, chosung: 초성, fuzzy: 자모 오타 허용)")
+    fields: Optional[str] = Field(None, description="응답에 포함할 필드 (콤마 구분). 생략 시 전체 필드")
+    track_total_hits: Optional[Literal["exact", "capped", "off"]] = Field(None, description="전체 건수 계산 방식 (계산 시 total, total_relation에 반환)")
+    range: Optional[List[str]] = Field(None, description="정규화 영양성분 범위 조건 목록 (`필드:최솟값:최댓값`)")
+    sort: Optional[str] = Field(None, description="정렬할 정규화 영양성분 (`필드` 오름차순, `-필드` 내림차순)")
+
+    ## 지원하지 않는 검색 조건이 조용히 무시되지 않도록 알 수 없는 키는 422로 거절
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("fields")
+    @classmethod
+    def check_fields(cls, value: Optional[str]) -> Optional[str]:
+        parse_fields_param(value)
+        return value
+
+    @field_validator("range")
+    @classmethod
+    def check_range(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        parse_range_params(value)
+        return value
+
+    @field_validator("sort")
+    @classmethod
+    def check_sort(cls, value: Optional[str]) -> Optional[str]:
+        parse_sort_param(value)
+        return value
+
+class FoodNutritionBatchSearchResult(BaseModel):
+    results: List[FoodNutritionSearchResponse] = Field(default_factory=list)
+    total: Optional[int] = Field(None, description="전체 건수 (track_total_hits를 지정한 경우)")
+    total_relation: Optional[Literal["eq", "gte"]] = Field(None, description="전체 건수가 정확한지(eq) 하한값인지(gte)")
+    error: Optional[str] = Field(None, description="해당 검색에서 발생한 오류 (다른 검색에는 영향 없음)")
+
+## 필터 기반 일괄 수정(PATCH)용 스키마
+## food_cd(고유값)와 food_name(ES 초성/자모 검색 필드가 파생됨)은 일괄 수정 대상에서 제외
+class FoodNutritionBulkUpdate(BaseModel):
+    group_name: Optional[str] = Field(None, description="식품군")
+    research_year: Optional[str] = Field(None, description="조사년도")
+    maker_name: Optional[str] = Field(None, description="지역/제조사")
+    ref_name: Optional[str] = Field(None, json_schema_extra={'example': "식품의약품안전처"}, description="자료출처")
+    serving_size: Optional[float] = Field(None, description="1회 제공량")
+    calorie: Optional[float] = Field(None, description="열량(kcal)(1회제공량당)")
+    carbohydrate: Optional[float] = Field(None, description="탄수화물(g)(1회제공량당)")
+    protein: Optional[float] = Field(None, description="단백질(g)(1회제공량당)")
+    province: Optional[float] = Field(None, description="지방(g)(1회제공량당)")
+    sugars: Optional[float] = Field(None, description="총당류(g)(1회제공량당)")
+    salt: Optional[float] = Field(None, description="나트륨(mg)(1회제공량당)")
+    cholesterol: Optional[float] = Field(None, description="콜레스테롤(mg)(1회제공량당)")
+    saturated_fatty_acids: Optional[float] = Field(None, description="포화지방산(g)(1회제공량당)")
+    trans_fat: Optional[float] = Field(None, description="트랜스지방(g)(1회제공량당)")
+
+    model_config = ConfigDict(extra="forbid")
+
+## 필터 기반 일괄 수정/삭제 응답용 스키마
+class FoodNutritionBulkOperationResponse(BaseModel):
+    affected: int = Field(..., json_schema_extra={'example': 120}, description="SQLite에서 수정/삭제된 행 수")
+    es_affected: Optional[int] = Field(None, description="Elasticsearch에서 수정/삭제된 문서 수 (동기화하지 못한 경우 null)")
+    es_synced: bool = Field(..., description="Elasticsearch 반영 성공 여부")
+    es_error: Optional[str] = Field(None, description="Elasticsearch 반영 실패 사유")
+
+## 변경 피드 API 응답용 스키마
+class FoodNutritionChange(BaseModel):
+    seq: int = Field(..., json_schema_extra={'example': 1024}, description="단조 증가하는 변경 순번")
+    operation: Literal["upsert", "delete"] = Field(..., description="upsert: 생성/수정 (data에 현재 행), delete: 삭제 tombstone")
+    id: int = Field(..., description="변경된 음식 영양 정보 ID")
+    food_cd: str = Field(..., description="변경 시점의 식품코드")
+    changed_at: datetime = Field(..., description="변경 시각 (UTC)")
+    data: Optional[FoodNutrition] = Field(None, description="upsert의 현재 행 전체 (delete는 null)")
+
+class FoodNutritionChangeFeedResponse(BaseModel):
+    changes: List[FoodNutritionChange]
+    next_since: int = Field(..., description="다음 요청의 since 값 (변경이 없으면 요청한 since 그대로)")
+    has_more: bool = Field(..., description="next_since 이후 변경이 더 있는지 여부")
+
+## 건수 조회 API 응답용 스키마
+class FoodNutritionCountResponse(BaseModel):
+    count: int = Field(..., json_schema_extra={'example': 42}, description="조건에 맞는 항목 수")
+
+## 식단 영양 계산 API 요청/응답용 스키마
+class NutritionCalculationItem(BaseModel):
+    id: Optional[int] = Field(None, json_schema_extra={'example': 1}, description="음식 영양 정보 ID (food_cd와 둘 중 하나)")
+    food_cd: Optional[str] = Field(None, json_schema_extra={'example': "D000006"}, description="식품코드 (id와 둘 중 하나)")
+    grams: float = Field(..., gt=0, json_schema_extra={'example': 150.0}, description="섭취량(g)")
+
+    @model_validator(mode="after")
+    def check_food_reference(self):
+        if (self.id is None) == (self.food_cd is None):
+            raise ValueError("id와 food_cd 중 하나만 지정해야 합니다.")
+        return self
+
+class NutritionCalculationMeal(BaseModel):
+    name: Optional[str] = Field(None, json_schema_extra={'example': "아침"}, description="식단 이름")
+    items: List[NutritionCalculationItem] = Field(..., min_length=1)
+
+class NutritionCalculationRequest(BaseModel):
+    meals: List[NutritionCalculationMeal] = Field(..., min_length=1, description="계산할 식단 목록")
+
+class NutrientAmounts(BaseModel):
+    calorie: Optional[float] = Field(None, description="열량(kcal)")
+    carbohydrate: Optional[float] = Field(None, description="탄수화물(g)")
+    protein: Optional[float] = Field(None, description="단백질(g)")
+    province: Optional[float] = Field(None, description="지방(g)")
+    sugars: Optional[float] = Field(None, description="총당류(g)")
+    salt: Optional[float] = Field(None, description="나트륨(mg)")
+    cholesterol: Optional[float] = Field(None, description="콜레스테롤(mg)")
+    saturated_fatty_acids: Optional[float] = Field(None, description="포화지방산(g)")
+    trans_fat: Optional[float] = Field(None, description="트랜스지방(g)")
+
+class NutritionCalculationItemResult(BaseModel):
+    id: int
+    food_cd: str
+    food_name: str
+    grams: float
+    serving_size: Optional[float] = None
+    nutrients: NutrientAmounts = Field(..., description="섭취량 기준으로 환산한 영양성분")
+    less_than_1g: List[str] = Field(default_factory=list, description="원본 값이 '1g 미만'이라 0으로 계산한 성분")
+
+class NutritionCalculationMealResult(BaseModel):
+    name: Optional[str] = None
+    items: List[NutritionCalculationItemResult]
+    total: NutrientAmounts = Field(..., description="식단 합계 (값이 없는 성분은 제외)")
+    less_than_1g: List[str] = Field(default_factory=list, description="'1g 미만' 항목이 포함되어 합계가 하한값인 성분")
+
+class NutritionCalculationResponse(BaseModel):
+    meals: List[NutritionCalculationMealResult]
+
+## fields= 파라미터로 선택할 수 있는 응답 필드 (FoodNutrition 응답 스키마 기준)
+NORMALIZED_NUTRIENT_FIELDS: Tuple[str, ...] = tuple(FoodNutritionNormalizedNutrients.model_fields.keys())
+FOOD_NUTRITION_FIELDS: Tuple[str, ...] = tuple(["id", *FoodNutritionBase.model_fields.keys(), *NORMALIZED_NUTRIENT_FIELDS])
+
+def parse_fields_param(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """콤마로 구분된 fields 파라미터를 검증해 중복 없는 필드 튜플로 반환합니다. 알 수 없는 필드가 있으면 ValueError."""
+    if fields is None or not fields.strip():
+        return None
+    requested = tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    unknown = [field for field in requested if field not in FOOD_NUTRITION_FIELDS]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: {', '.join(FOOD_NUTRITION_FIELDS)})")
+    return requested
+
+## sort=/range= 파라미터로 쓸 수 있는 필드 (인덱스/doc_values가 있는 정규화 영양성분)
+SORTABLE_FOOD_NUTRITION_FIELDS: Tuple[str, ...] = NORMALIZED_NUTRIENT_FIELDS
+
+def _check_sortable_field(field: str) -> None:
+    if field not in SORTABLE_FOOD_NUTRITION_FIELDS:
+        raise ValueError(f"정렬/범위 조건에 사용할 수 없는 필드: {field} (사용 가능: {', '.join(SORTABLE_FOOD_NUTRITION_FIELDS)})")
+
+def parse_sort_param(sort: Optional[str]) -> Optional[Tuple[str, bool]]:
+    """`field`(오름차순) 또는 `-field`(내림차순) 형식의 sort 파라미터를 (필드, 내림차순 여부)로 반환합니다."""
+    if sort is None or not sort.strip():
+        return None
+    sort = sort.strip()
+    descending = sort.startswith("-")
+    field = sort[1:] if descending else sort
+    _check_sortable_field(field)
+    return field, descending
+
+def parse_range_params(ranges: Optional[List[str]]) -> Tuple[Tuple[str, Optional[float], Optional[float]], ...]:
+    """`field:min:max` 형식의 range 파라미터 목록을 (필드, 최솟값, 최댓값) 튜플로 반환합니다. 비워 둔 경계는 제한하지 않습니다."""
+    parsed = []
+    for value in ranges or []:
+        parts = value.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"range 형식이 올바르지 않습니다: {value} (예: salt_per_100g:0:120)")
+        field, bounds = parts[0].strip(), parts[1:]
+        _check_sortable_field(field)
+        try:
+            minimum, maximum = (float(bound) if bound.strip() else None for bound in bounds)
+        except ValueError:
+            raise ValueError(f"range 경계값은 숫자여야 합니다: {value}") from None
+        if minimum is None and maximum is None:
+            raise ValueError(f"range에는 최솟값과 최댓값 중 하나 이상이 필요합니다: {value}")
+        parsed.append((field, minimum, maximum))
+    return tuple(parsed)
+
+@lru_cache(maxsize=256)
+def get_partial_food_nutrition_schema(fields: Tuple[str, ...]) -> Type[BaseModel]:
+    field_definitions = {
+        field: (Optional[FoodNutrition.model_fields[field].annotation], None)
+        for field in fields
+    }
+    return create_model(f"FoodNutritionPartial_{'_'.join(fields)}", **field_definitions)
+
+@lru_cache(maxsize=256)
+def get_partial_food_nutrition_list_adapter(fields: Tuple[str, ...]) -> TypeAdapter:
+    return TypeAdapter(List[get_partial_food_nutrition_schema(fields)])
\ No newline at end of file
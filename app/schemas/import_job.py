@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+
+## 파일 업로드 적재(import) 작업 상태 응답용 스키마
+class ImportJobStatus(BaseModel):
+    job_id: str = Field(..., description="작업 ID")
+    file_name: str = Field(..., description="업로드한 파일 이름")
+    file_size: int = Field(..., description="업로드한 파일 크기(byte)")
+    mode: Literal["insert", "upsert"] = Field(..., description="적재 모드")
+    status: Literal["queued", "running", "completed", "failed"]
+    stage: str = Field(..., description="현재 단계 (queued, reading, transforming, writing_sqlite, indexing_es, completed, failed)")
+    rows_total: Optional[int] = Field(None, description="정제 후 유효한 행 수")
+    rows_processed: int = Field(0, description="SQLite 적재를 마친 행 수 (변경 없는 행 포함)")
+    rows_skipped: int = Field(0, description="필수값 누락/식품코드 중복으로 제외된 행 수")
+    es_total: Optional[int] = Field(None, description="Elasticsearch 인덱싱 대상 문서 수")
+    es_indexed: int = 0
+    es_errors: int = 0
+    invalid_numeric: Dict[str, int] = Field(default_factory=dict, description="숫자로 변환할 수 없어 NULL로 처리한 건수 (컬럼별)")
+    errors: List[str] = Field(default_factory=list)
+    summary: Optional[Dict[str, int]] = Field(None, description="완료 시 {inserted, updated, unchanged}")
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    elapsed_seconds: Optional[float] = None
+    throughput_rows_per_second: Optional[float] = Field(None, description="현재 단계의 처리 속도 (완료 후에는 전체 평균)")
+    eta_seconds: Optional[float] = Field(None, description="현재 단계의 예상 남은 시간")
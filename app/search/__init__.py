@@ -1,2 +1,36 @@
-from .es_client import get_es_client, ping_es, search_food_nutritions_in_es
-from .es_utils import FOOD_NUTRITIONS_INDEX_NAME, FOOD_NUTRITIONS_MAPPINGS, create_index_if_not_exists
\ No newline at end of file
+from .es_client import (
+    get_es_client,
+    ping_es,
+    search_food_nutritions_in_es,
+    search_food_nutritions_page_in_es,
+    count_food_nutritions_in_es,
+    build_food_nutritions_filter_query,
+    build_food_name_query,
+    profile_food_nutritions_search_in_es,
+    msearch_food_nutritions_in_es,
+    build_food_nutritions_query,
+    execute_es_search,
+    is_es_ready,
+    get_es_bootstrap_status,
+    bootstrap_es_with_retry,
+    es_admission_controller,
+    search_single_flight,
+    ESOverloadedError,
+    SEARCH_MODE_STANDARD,
+    SEARCH_MODE_CHOSUNG,
+    SEARCH_MODE_FUZZY
+)
+from .es_utils import (
+    FOOD_NUTRITIONS_INDEX_NAME,
+    FOOD_NUTRITIONS_MAPPINGS,
+    IndexMappingMismatchError,
+    create_index_if_not_exists
+)
+from .korean import extract_chosung, decompose_jamo
+from .query_router import (
+    SEARCH_BACKEND_SQLITE,
+    SEARCH_BACKEND_ES,
+    plan_search_backend,
+    search_backend_counter
+)
+
@@ -1,13 +1,165 @@
-from elasticsearch import Elasticsearch, ConnectionError, helpers 
-from typing import Optional, List, Dict, Any
+from elasticsearch import Elasticsearch, ConnectionError, Transport, helpers, exceptions as es_exceptions
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple, Union
+from contextlib import contextmanager
+import asyncio
+import json
 import logging
+import random
+import threading
+import time
 
 from app.core.config import settings
-from .es_utils import FOOD_NUTRITIONS_INDEX_NAME
+from app.core.single_flight import SingleFlight
+from app.core.tracing import start_span
+from app.core.deadline import DeadlineExceededError, deadline_expired, remaining_time
+from .es_utils import (
+    FOOD_NUTRITIONS_INDEX_NAME,
+    FOOD_NUTRITIONS_MAPPINGS,
+    FOOD_NAME_SEARCH_ONLY_FIELDS,
+    IndexMappingMismatchError,
+    create_index_if_not_exists
+)
+from .korean import extract_chosung, decompose_jamo
 
 logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.slow_query")
+
+## 식품 이름 검색 모드 (standard: 형태소 match, chosung: 초성, fuzzy: 자모 오타 허용)
+SEARCH_MODE_STANDARD = "standard"
+SEARCH_MODE_CHOSUNG = "chosung"
+SEARCH_MODE_FUZZY = "fuzzy"
+
+class ESOverloadedError(Exception):
+    """Elasticsearch 호출 대기열이 가득 찼거나 대기 시간이 초과되어 요청을 거절할 때 발생합니다."""
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ESConcurrencyLimiter:
+    """Elasticsearch 호출의 동시 실행 수를 제한하고, 초과 요청은 크기가 제한된 대기열에서 기다리게 합니다."""
+    def __init__(self, max_concurrency: int, max_queue: int, queue_timeout: float, retry_after: int):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore = threading.Semaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[None]:
+        if timeout is None:
+            timeout = self.queue_timeout
+            ## 요청 deadline이 대기열 대기 시간보다 짧으면 남은 시간만 기다림
+            remaining = remaining_time()
+            if remaining is not None:
+                if remaining <= 0:
+                    raise DeadlineExceededError()
+                timeout = min(timeout, remaining)
+        if not self._semaphore.acquire(blocking=False):
+            with self._lock:
+                if self._waiting >= self.max_queue:
+                    self._rejected_queue_full += 1
+                    raise ESOverloadedError("Elasticsearch 요청 대기열이 가득 찼습니다.", self.retry_after)
+                self._waiting += 1
+            try:
+                acquired = self._semaphore.acquire(timeout=timeout)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            if not acquired:
+                with self._lock:
+                    self._rejected_timeout += 1
+                raise ESOverloadedError("Elasticsearch 요청 대기 시간이 초과되었습니다.", self.retry_after)
+
+        with self._lock:
+            self._in_flight += 1
+            self._admitted += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queue_depth": self._waiting,
+                "admitted_total": self._admitted,
+                "rejected_queue_full_total": self._rejected_queue_full,
+                "rejected_timeout_total": self._rejected_timeout,
+            }
+
+
+es_admission_controller = ESConcurrencyLimiter(
+    max_concurrency=settings.ES_MAX_CONCURRENT_REQUESTS,
+    max_queue=settings.ES_MAX_QUEUED_REQUESTS,
+    queue_timeout=settings.ES_QUEUE_TIMEOUT_SECONDS,
+    retry_after=settings.ES_RETRY_AFTER_SECONDS,
+)
+
+search_single_flight = SingleFlight("es_search")
+
+SOURCE_ONLY_FILTER_PATH = ("hits.hits._source",)
+TOTAL_HITS_FILTER_PATH = ("hits.total",)
+
+def _es_operation_name(method: str, url: str) -> str:
+    ## 예: HEAD / -> ping, POST /food_nutritions/_search -> search, PUT /food_nutritions/_doc/1 -> index
+    segments = [segment for segment in url.split("?", 1)[0].split("/") if segment]
+    if not segments:
+        return "ping" if method == "HEAD" else "info"
+    api = next((segment for segment in reversed(segments) if segment.startswith("_")), None)
+    if api in ("_doc", "_create"):
+        return {"PUT": "index", "POST": "index", "DELETE": "delete"}.get(method, "get")
+    if api is not None:
+        return api.lstrip("_")
+    return f"{method.lower()}_index"
+
+def _apply_deadline_to_params(operation: str, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    ## 요청 deadline의 남은 시간을 클라이언트 request_timeout과 검색의 서버 측 timeout에 반영
+    remaining = remaining_time()
+    if remaining is None:
+        return params
+    if remaining <= 0:
+        raise DeadlineExceededError()
+    params = dict(params or {})
+    params["request_timeout"] = min(float(params.get("request_timeout", settings.ES_TIMEOUT)), remaining)
+    if operation == "search":
+        ## 서버 측에서도 남은 시간이 지나면 샤드 검색을 멈추고 그때까지의 결과(timed_out=true)를 반환
+        params.setdefault("timeout", f"{max(1, int(remaining * 1000))}ms")
+    return params
+
+class TracingTransport(Transport):
+    """모든 Elasticsearch 요청(search, index, delete, ping 등)을 현재 trace의 span으로 기록하고 요청 deadline을 적용합니다."""
+    def perform_request(self, method, url, headers=None, params=None, body=None):
+        operation = _es_operation_name(method, url)
+        params = _apply_deadline_to_params(operation, params)
+        with start_span(f"es {operation}", kind="elasticsearch", method=method, url=url) as span:
+            try:
+                response = super().perform_request(method, url, headers=headers, params=params, body=body)
+            except es_exceptions.ConnectionTimeout as e:
+                if deadline_expired():
+                    raise DeadlineExceededError() from e
+                raise
+            if span is not None and isinstance(response, dict) and "took" in response:
+                span.set_attribute("took_ms", response["took"])
+                if response.get("timed_out"):
+                    span.set_attribute("timed_out", True)
+            return response
 
 _es_client: Optional[Elasticsearch] = None
+_es_ready: bool = False
+_es_bootstrap_attempts: int = 0
+_es_last_error: Optional[str] = None
 
 def get_es_client() -> Elasticsearch:
     global _es_client
@@ -16,11 +168,15 @@ def get_es_client() -> Elasticsearch:
             logger.info(f"Elasticsearch 클라이언트 초기화 시도: {settings.ELASTICSEARCH_HOSTS}")
             client_options: Dict[str, Any] = {
                 "hosts": settings.ELASTICSEARCH_HOSTS,
-                "timeout": 30,
+                "timeout": settings.ES_TIMEOUT,
+                "transport_class": TracingTransport,
             }
-            _es_client = Elasticsearch(**client_options)
-            if not _es_client.ping():
-                raise ConnectionError("Elasticsearch 서버에 연결할 수 없습니다.")
+            ## ping에 성공한 클라이언트만 싱글톤으로 등록 (실패 시 다음 호출에서 다시 시도)
+            es_client = Elasticsearch(**client_options)
+            if not es_client.ping():
+                ## TransportError 계열은 (status_code, error, info) 인자가 있어야 str()이 동작함 (/readyz last_error, es_error로 노출됨)
+                raise ConnectionError("N/A", "Elasticsearch 서버에 연결할 수 없습니다.", "ping 응답 없음")
+            _es_client = es_client
             logger.info("Elasticsearch 클라이언트가 성공적으로 연결되었습니다.")
         except ConnectionError as e:
             logger.error(f"Elasticsearch 연결 실패: {e}")
@@ -31,6 +187,57 @@ def get_es_client() -> Elasticsearch:
     return _es_client
 
 
+def is_es_ready() -> bool:
+    return _es_ready
+
+def get_es_bootstrap_status() -> Dict[str, Any]:
+    return {
+        "ready": _es_ready,
+        "attempts": _es_bootstrap_attempts,
+        "last_error": _es_last_error,
+    }
+
+def _bootstrap_es_once() -> bool:
+    es_client = get_es_client()
+    return create_index_if_not_exists(
+        es_client=es_client,
+        index_name=FOOD_NUTRITIONS_INDEX_NAME,
+        mappings_body=FOOD_NUTRITIONS_MAPPINGS
+    )
+
+async def bootstrap_es_with_retry(
+    initial_backoff: Optional[float] = None,
+    max_backoff: Optional[float] = None
+) -> None:
+    """Elasticsearch 클라이언트 생성과 인덱스 생성을 성공할 때까지 지수 백오프로 재시도합니다.
+
+    앱 시작을 막지 않도록 lifespan에서 백그라운드 태스크로 실행합니다.
+    """
+    global _es_ready, _es_bootstrap_attempts, _es_last_error
+    backoff = initial_backoff if initial_backoff is not None else settings.ES_BOOTSTRAP_INITIAL_BACKOFF_SECONDS
+    max_backoff = max_backoff if max_backoff is not None else settings.ES_BOOTSTRAP_MAX_BACKOFF_SECONDS
+
+    while not _es_ready:
+        _es_bootstrap_attempts += 1
+        try:
+            if await asyncio.to_thread(_bootstrap_es_once):
+                _es_ready = True
+                _es_last_error = None
+                logger.info(f"Elasticsearch 초기화 완료 (시도 {_es_bootstrap_attempts}회).")
+                return
+            _es_last_error = f"인덱스 '{FOOD_NUTRITIONS_INDEX_NAME}' 확인/생성 실패"
+        except IndexMappingMismatchError as e:
+            ## 재시도해도 해결되지 않으므로 중단하고 /readyz의 last_error로 원인을 노출
+            _es_last_error = str(e)
+            logger.error(f"Elasticsearch 초기화 중단: {_es_last_error}")
+            return
+        except Exception as e:
+            _es_last_error = str(e)
+        logger.warning(f"Elasticsearch 초기화 실패 (시도 {_es_bootstrap_attempts}회): {_es_last_error}. {backoff:.1f}초 후 재시도합니다.")
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, max_backoff)
+
+
 def ping_es(es_client: Optional[Elasticsearch] = None) -> bool:
     client_to_use = es_client if es_client is not None else get_es_client()
     try:
@@ -49,16 +256,168 @@ def search_food_nutritions_in_es(
     maker_name: Optional[str] = None,
     food_cd: Optional[str] = None,
     skip: int = 0,
-    limit: int = 10
+    limit: int = 10,
+    source_fields: Optional[Sequence[str]] = None,
+    mode: str = SEARCH_MODE_STANDARD
 ) -> List[Dict[str, Any]]:
+    return search_food_nutritions_page_in_es(
+        es_client, food_name, research_year, maker_name, food_cd, skip, limit, source_fields, mode=mode
+    )["results"]
+
+def search_food_nutritions_page_in_es(
+    es_client: Elasticsearch,
+    food_name: Optional[str] = None,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10,
+    source_fields: Optional[Sequence[str]] = None,
+    track_total_hits: Union[bool, int] = False,
+    mode: str = SEARCH_MODE_STANDARD,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = (),
+    sort: Optional[Tuple[str, bool]] = None
+) -> Dict[str, Any]:
+    """검색 결과와 전체 건수를 {results, total, total_relation}으로 반환합니다.
+
+    track_total_hits가 False이면 전체 건수를 계산하지 않고(total=None), 정수이면 그 수까지만 정확히 셉니다(total_relation='gte').
+    """
+    search_args = (
+        es_client, food_name, research_year, maker_name, food_cd, skip, limit, source_fields, track_total_hits, mode, tuple(ranges), sort
+    )
+    if not settings.SINGLE_FLIGHT_ENABLED:
+        return _search_food_nutritions_page_in_es(*search_args)
+    ## 동일한 검색 조건의 동시 요청은 하나의 ES 호출 결과를 공유
+    key = (
+        food_name, research_year, maker_name, food_cd, skip, limit,
+        tuple(source_fields) if source_fields else None, track_total_hits, mode, tuple(ranges), sort
+    )
+    return search_single_flight.do(key, _search_food_nutritions_page_in_es, *search_args)
+
+def profile_food_nutritions_search_in_es(
+    es_client: Elasticsearch,
+    food_name: Optional[str] = None,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10,
+    source_fields: Optional[Sequence[str]] = None,
+    mode: str = SEARCH_MODE_STANDARD,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = (),
+    sort: Optional[Tuple[str, bool]] = None
+) -> Dict[str, Any]:
+    """검색 결과와 함께 ES의 took(ms)과 profile 상세 정보를 반환합니다. 요청 합치기(single-flight)는 적용하지 않습니다."""
+    query_body = build_food_nutritions_query(
+        food_name, research_year, maker_name, food_cd, skip, limit, source_fields, mode=mode, ranges=ranges, sort=sort
+    )
+    query_body["profile"] = True
+    response = _run_food_nutritions_search(es_client, query_body)
+    if response is None:
+        return {"results": [], "took": None, "profile": None}
+    return {
+        "results": [hit["_source"] for hit in response["hits"]["hits"]],
+        "took": response.get("took"),
+        "profile": response.get("profile"),
+    }
+
+def msearch_food_nutritions_in_es(es_client: Elasticsearch, searches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """여러 검색 조건을 한 번의 _msearch 요청으로 실행하고, 요청 순서대로 {results, total, total_relation, error}를 반환합니다.
+
+    각 검색의 오류는 해당 항목의 error에만 기록되고 다른 검색 결과에는 영향을 주지 않습니다.
+    """
+    if not searches:
+        return []
     if not es_client:
         logger.warning("Elasticsearch 클라이언트가 제공되지 않아 검색을 수행할 수 없습니다.")
-        return []
+        return [{"results": [], "error": "검색 서비스를 사용할 수 없습니다."} for _ in searches]
+
+    msearch_body: List[Dict[str, Any]] = []
+    for search in searches:
+        msearch_body.append({"index": FOOD_NUTRITIONS_INDEX_NAME})
+        msearch_body.append(build_food_nutritions_query(**search))
+
+    try:
+        with es_admission_controller.acquire():
+            started_at = time.perf_counter()
+            response = es_client.msearch(body=msearch_body)
+            elapsed_ms = (time.perf_counter() - started_at) * 1000
+    except (ESOverloadedError, DeadlineExceededError):
+        raise
+    except Exception as e:
+        logger.error(f"Elasticsearch 배치 검색(_msearch) 중 오류 발생: {e}")
+        return [{"results": [], "error": "검색 중 오류가 발생했습니다."} for _ in searches]
+
+    if settings.SLOW_QUERY_LOG_ENABLED and elapsed_ms >= settings.ES_SLOW_QUERY_THRESHOLD_MS:
+        slow_query_logger.warning(
+            f"느린 ES 배치 쿼리: index={FOOD_NUTRITIONS_INDEX_NAME}, searches={len(searches)}, elapsed={elapsed_ms:.1f}ms, "
+            f"body={json.dumps(msearch_body, ensure_ascii=False)}"
+        )
+
+    responses = response.get("responses") or []
+    if len(responses) != len(searches):
+        logger.error(f"Elasticsearch 배치 검색(_msearch) 응답 수가 요청 수와 다릅니다: 요청 {len(searches)}건, 응답 {len(responses)}건")
+
+    results = []
+    for index, search in enumerate(searches):
+        ## 응답이 모자라면 (부분/비정상 응답) 해당 검색만 오류로 채워 결과 순서를 요청과 맞춤
+        item = responses[index] if index < len(responses) else None
+        if not isinstance(item, dict) or ("error" not in item and "hits" not in item):
+            results.append({"results": [], "error": "검색 결과를 받지 못했습니다."})
+        elif "error" in item:
+            error = item["error"]
+            reason = error.get("reason", str(error)) if isinstance(error, dict) else str(error)
+            results.append({"results": [], "error": reason})
+        else:
+            total = item["hits"].get("total") if search.get("track_total_hits", False) is not False else None
+            results.append({
+                "results": [hit.get("_source", {}) for hit in item["hits"]["hits"]],
+                "total": total["value"] if total else None,
+                "total_relation": total["relation"] if total else None,
+                "error": None,
+            })
+    return results
 
+def build_food_name_query(food_name: str, mode: str = SEARCH_MODE_STANDARD) -> Dict[str, Any]:
+    """검색 모드에 맞는 식품 이름 조건을 만듭니다.
+
+    chosung/fuzzy는 색인 시 미리 계산한 필드를 term/n-gram으로 조회해 wildcard나 fuzzy 확장 비용이 없습니다.
+    """
+    if mode == SEARCH_MODE_CHOSUNG:
+        chosung = extract_chosung(food_name)
+        return {
+            "bool": {
+                "should": [
+                    {"term": {"food_name_chosung": {"value": chosung, "boost": 2.0}}},
+                    {"term": {"food_name_chosung.ngram": chosung}},
+                ],
+                "minimum_should_match": 1,
+            }
+        }
+    if mode == SEARCH_MODE_FUZZY:
+        return {
+            "match": {
+                "food_name_jamo": {
+                    "query": decompose_jamo(food_name),
+                    "minimum_should_match": settings.ES_FUZZY_MINIMUM_SHOULD_MATCH,
+                }
+            }
+        }
+    return {"match": {"food_name": food_name}}
+
+def build_food_nutritions_filter_query(
+    food_name: Optional[str] = None,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    mode: str = SEARCH_MODE_STANDARD,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = (),
+    sort: Optional[Tuple[str, bool]] = None
+) -> Dict[str, Any]:
     query_conditions = []
 
     if food_name:
-        query_conditions.append({"match": {"food_name": food_name}})
+        query_conditions.append(build_food_name_query(food_name, mode))
     
     if research_year:
         query_conditions.append({"term": {"research_year": research_year}})
@@ -69,34 +428,164 @@ def search_food_nutritions_in_es(
     if food_cd:
         query_conditions.append({"term": {"food_cd": food_cd}})
 
-    if not query_conditions:
-        query_body = {"query": {"match_all": {}}, "from": skip, "size": limit}
+    ## 정규화 영양성분 범위/정렬 조건은 점수 계산 없이 doc_values로 거르는 filter 절에 둠
+    ## (정렬 필드 값이 없는 문서는 SQLite 목록 조회와 같이 제외)
+    filter_conditions = []
+    for field, minimum, maximum in ranges:
+        bounds = {}
+        if minimum is not None:
+            bounds["gte"] = minimum
+        if maximum is not None:
+            bounds["lte"] = maximum
+        filter_conditions.append({"range": {field: bounds}})
+    if sort is not None:
+        filter_conditions.append({"exists": {"field": sort[0]}})
+
+    if not query_conditions and not filter_conditions:
+        return {"match_all": {}}
+    bool_query: Dict[str, Any] = {}
+    if query_conditions:
+        bool_query["must"] = query_conditions
+    if filter_conditions:
+        bool_query["filter"] = filter_conditions
+    return {"bool": bool_query}
+
+def build_food_nutritions_query(
+    food_name: Optional[str] = None,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10,
+    source_fields: Optional[Sequence[str]] = None,
+    track_total_hits: Union[bool, int] = False,
+    mode: str = SEARCH_MODE_STANDARD,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = (),
+    sort: Optional[Tuple[str, bool]] = None
+) -> Dict[str, Any]:
+    query_body = {
+        "query": build_food_nutritions_filter_query(food_name, research_year, maker_name, food_cd, mode, ranges, sort),
+        "from": skip,
+        "size": limit,
+        ## 전체 건수가 필요 없는 검색은 hit 수를 세지 않아 비용을 줄임
+        "track_total_hits": track_total_hits,
+    }
+    if sort is not None:
+        ## 관련도 대신 정규화 영양성분 값으로 정렬하고, 같은 값은 id 순으로 고정해 페이지 간 순서를 유지
+        field, descending = sort
+        order = "desc" if descending else "asc"
+        query_body["sort"] = [{field: {"order": order}}, {"id": {"order": order}}]
+    if source_fields:
+        query_body["_source"] = list(source_fields)
     else:
-        query_body = {
-            "query": {
-                "bool": {
-                    "must": query_conditions
-                }
-            },
-            "from": skip,
-            "size": limit 
-        }
-    
-    logger.info(f"Elasticsearch 검색 쿼리: {query_body}")
-    
+        query_body["_source"] = {"excludes": FOOD_NAME_SEARCH_ONLY_FIELDS}
+    return query_body
+
+def count_food_nutritions_in_es(
+    es_client: Elasticsearch,
+    food_name: Optional[str] = None,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    mode: str = SEARCH_MODE_STANDARD,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = ()
+) -> Optional[int]:
+    """ES _count로 검색 조건에 맞는 문서 수를 반환합니다. 오류 시 None."""
+    if not es_client:
+        logger.warning("Elasticsearch 클라이언트가 제공되지 않아 건수를 조회할 수 없습니다.")
+        return None
+    count_body = {"query": build_food_nutritions_filter_query(food_name, research_year, maker_name, food_cd, mode, ranges)}
     try:
-        response = es_client.search(
-            index=FOOD_NUTRITIONS_INDEX_NAME,
-            body=query_body
+        with es_admission_controller.acquire():
+            response = es_client.count(index=FOOD_NUTRITIONS_INDEX_NAME, body=count_body)
+        return response["count"]
+    except (ESOverloadedError, DeadlineExceededError):
+        raise
+    except es_exceptions.NotFoundError:
+        logger.info(f"인덱스 '{FOOD_NUTRITIONS_INDEX_NAME}'를 찾을 수 없습니다.")
+        return 0
+    except Exception as e:
+        logger.error(f"Elasticsearch 건수 조회 중 오류 발생: {e}")
+        return None
+
+def execute_es_search(
+    es_client: Elasticsearch,
+    query_body: Dict[str, Any],
+    index: str = FOOD_NUTRITIONS_INDEX_NAME,
+    filter_path: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """동시성 제한을 적용해 ES 검색을 실행하고, 임계값을 넘는 느린 쿼리는 쿼리 본문과 함께 기록합니다."""
+    if logger.isEnabledFor(logging.DEBUG) and random.random() < settings.ES_QUERY_LOG_SAMPLE_RATE:
+        logger.debug(f"Elasticsearch 검색 쿼리 (샘플링): {query_body}")
+
+    with es_admission_controller.acquire():
+        started_at = time.perf_counter()
+        if filter_path:
+            response = es_client.search(index=index, body=query_body, filter_path=list(filter_path))
+        else:
+            response = es_client.search(index=index, body=query_body)
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+
+    took_ms = response.get("took")
+    if settings.SLOW_QUERY_LOG_ENABLED and max(elapsed_ms, took_ms or 0) >= settings.ES_SLOW_QUERY_THRESHOLD_MS:
+        slow_query_logger.warning(
+            f"느린 ES 쿼리: index={index}, took={took_ms}ms, elapsed={elapsed_ms:.1f}ms, body={json.dumps(query_body, ensure_ascii=False)}"
         )
-        results = [hit["_source"] for hit in response["hits"]["hits"]]
-        return results
+    return response
+
+def _run_food_nutritions_search(
+    es_client: Elasticsearch,
+    query_body: Dict[str, Any],
+    filter_path: Optional[Sequence[str]] = None
+) -> Optional[Dict[str, Any]]:
+    if not es_client:
+        logger.warning("Elasticsearch 클라이언트가 제공되지 않아 검색을 수행할 수 없습니다.")
+        return None
+
+    try:
+        return execute_es_search(es_client, query_body, filter_path=filter_path)
+    except (ESOverloadedError, DeadlineExceededError):
+        ## 대기열 초과와 deadline 초과는 삼키지 않고 호출자에게 전달
+        raise
     except es_exceptions.NotFoundError:
         logger.info(f"인덱스 '{FOOD_NUTRITIONS_INDEX_NAME}'를 찾을 수 없습니다.")
-        return []
+        return None
     except es_exceptions.ConnectionError as e:
         logger.error(f"Elasticsearch 검색 중 연결 오류 발생: {e}")
-        return []
+        return None
     except Exception as e:
         logger.error(f"Elasticsearch 검색 중 알 수 없는 오류 발생: {e}")
-        return []
\ No newline at end of file
+        return None
+
+def _search_food_nutritions_page_in_es(
+    es_client: Elasticsearch,
+    food_name: Optional[str] = None,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10,
+    source_fields: Optional[Sequence[str]] = None,
+    track_total_hits: Union[bool, int] = False,
+    mode: str = SEARCH_MODE_STANDARD,
+    ranges: Sequence[Tuple[str, Optional[float], Optional[float]]] = (),
+    sort: Optional[Tuple[str, bool]] = None
+) -> Dict[str, Any]:
+    query_body = build_food_nutritions_query(
+        food_name, research_year, maker_name, food_cd, skip, limit, source_fields, track_total_hits, mode, ranges, sort
+    )
+    ## 필드를 지정한 경우 응답 본문도 _source만 남겨 전송/파싱 비용을 줄임 (결과가 없으면 빈 객체가 옴)
+    filter_path = None
+    if source_fields:
+        filter_path = SOURCE_ONLY_FILTER_PATH + (TOTAL_HITS_FILTER_PATH if track_total_hits is not False else ())
+    response = _run_food_nutritions_search(es_client, query_body, filter_path=filter_path)
+    if response is None:
+        return {"results": [], "total": None, "total_relation": None}
+
+    hits = response.get("hits", {})
+    total = hits.get("total") if track_total_hits is not False else None
+    return {
+        "results": [hit.get("_source", {}) for hit in hits.get("hits", [])],
+        "total": total["value"] if total else None,
+        "total_relation": total["relation"] if total else None,
+    }
@@ -1,18 +1,50 @@
 from elasticsearch import Elasticsearch, exceptions as es_exceptions
-from typing import Dict, Any
+from typing import Dict, Any, List
 import logging
 
+from app.core.nutrition_calculator import NORMALIZED_NUTRIENT_FIELDS
+
 logger = logging.getLogger(__name__)
 
 FOOD_NUTRITIONS_INDEX_NAME = "food_nutritions_idx"
 
+## 초성 부분 일치 검색용 n-gram 최대 길이 (이보다 긴 초성 검색어는 전체 일치만 가능)
+CHOSUNG_NGRAM_MAX_GRAM = 10
+
+## 색인 시 미리 계산해 두는 검색 전용 필드 (검색 결과 _source에서는 제외)
+FOOD_NAME_SEARCH_ONLY_FIELDS = ["food_name_chosung", "food_name_jamo"]
+
 FOOD_NUTRITIONS_MAPPINGS = {
+    "settings": {
+        "index": {"max_ngram_diff": CHOSUNG_NGRAM_MAX_GRAM - 1},
+        "analysis": {
+            "tokenizer": {
+                "chosung_ngram_tokenizer": {
+                    "type": "ngram", "min_gram": 1, "max_gram": CHOSUNG_NGRAM_MAX_GRAM, "token_chars": ["letter", "digit"]
+                },
+                "jamo_trigram_tokenizer": {
+                    "type": "ngram", "min_gram": 3, "max_gram": 3, "token_chars": ["letter", "digit"]
+                }
+            },
+            "analyzer": {
+                "chosung_ngram_analyzer": {"type": "custom", "tokenizer": "chosung_ngram_tokenizer"},
+                "jamo_trigram_analyzer": {"type": "custom", "tokenizer": "jamo_trigram_tokenizer"}
+            }
+        }
+    },
     "mappings": {
         "properties": {
             "id": {"type": "integer"},
             "food_cd": {"type": "keyword"},
             "group_name": {"type": "text", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}},
             "food_name": {"type": "text", "analyzer": "standard", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}},
+            ## 초성(ㄱㅊㅉㄱ) 검색: 전체 일치는 keyword, 부분 일치는 색인 시 만든 n-gram을 term으로 조회
+            "food_name_chosung": {
+                "type": "keyword",
+                "fields": {"ngram": {"type": "text", "analyzer": "chosung_ngram_analyzer", "search_analyzer": "keyword"}}
+            },
+            ## 자모 오타 검색: 자모 분해 문자열의 trigram 일치 비율로 조회
+            "food_name_jamo": {"type": "text", "analyzer": "jamo_trigram_analyzer"},
             "research_year": {"type": "keyword"},
             "maker_name": {"type": "text", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}},
             "ref_name": {"type": "text", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}},
@@ -25,19 +57,59 @@ FOOD_NUTRITIONS_MAPPINGS = {
             "salt": {"type": "float"},
             "cholesterol": {"type": "float"},
             "saturated_fatty_acids": {"type": "float"},
-            "trans_fat": {"type": "float"}
+            "trans_fat": {"type": "float"},
+            ## 쓰기 시점에 계산한 100g당/100kcal당 값 (doc_values로 범위 필터/정렬)
+            **{field: {"type": "float"} for field in NORMALIZED_NUTRIENT_FIELDS}
         }
     }
 }
 
-def create_index_if_not_exists(es_client: Elasticsearch, index_name: str, mappings_body: Dict[str, Any]):
+class IndexMappingMismatchError(Exception):
+    """기존 인덱스의 매핑/분석기가 현재 코드가 기대하는 것과 달라 인덱스를 다시 만들어야 할 때 발생합니다."""
+    pass
+
+
+def find_missing_index_definitions(es_client: Elasticsearch, index_name: str, mappings_body: Dict[str, Any]) -> List[str]:
+    """기존 인덱스에 없는 필드 매핑과 분석기 이름을 반환합니다 (모두 있으면 빈 리스트)."""
+    expected_properties = mappings_body.get("mappings", {}).get("properties", {})
+    expected_analyzers = mappings_body.get("settings", {}).get("analysis", {}).get("analyzer", {})
+
+    ## index_name이 alias일 수 있으므로 응답의 실제 인덱스 이름 대신 값만 사용
+    existing_properties: Dict[str, Any] = {}
+    for index_mapping in es_client.indices.get_mapping(index=index_name).values():
+        existing_properties.update(index_mapping.get("mappings", {}).get("properties", {}))
+    existing_analyzers: Dict[str, Any] = {}
+    for index_settings in es_client.indices.get_settings(index=index_name).values():
+        existing_analyzers.update(index_settings.get("settings", {}).get("index", {}).get("analysis", {}).get("analyzer", {}))
+
+    missing = [f"필드 '{name}'" for name in expected_properties if name not in existing_properties]
+    missing += [f"분석기 '{name}'" for name in expected_analyzers if name not in existing_analyzers]
+    return missing
+
+
+def create_index_if_not_exists(es_client: Elasticsearch, index_name: str, mappings_body: Dict[str, Any]) -> bool:
+    """인덱스가 없으면 생성합니다.
+
+    이미 있는 인덱스의 매핑은 바꾸지 않습니다. 필드나 분석기가 빠져 있으면 (이전 버전으로 만든 인덱스)
+    IndexMappingMismatchError를 발생시키므로 인덱스를 삭제한 뒤 적재 스크립트(insert 모드)로 다시 색인해야 합니다.
+    """
     try:
         if not es_client.indices.exists(index=index_name):
             es_client.indices.create(index=index_name, body=mappings_body)
             logger.info(f"Elasticsearch 인덱스 '{index_name}' (이)가 성공적으로 생성되었습니다.")
-        else:
-            logger.info(f"Elasticsearch 인덱스 '{index_name}' (은)는 이미 존재합니다.")
+            return True
+        missing = find_missing_index_definitions(es_client, index_name, mappings_body)
+        if missing:
+            raise IndexMappingMismatchError(
+                f"Elasticsearch 인덱스 '{index_name}'의 매핑이 현재 버전과 다릅니다 (누락: {', '.join(missing)}). "
+                f"인덱스를 삭제(DELETE /{index_name})한 뒤 서버를 재시작하고 적재 스크립트를 insert 모드로 다시 실행하세요."
+            )
+        logger.info(f"Elasticsearch 인덱스 '{index_name}' (은)는 이미 존재합니다.")
+        return True
+    except IndexMappingMismatchError:
+        raise
     except es_exceptions.ConnectionError as e:
         logger.error(f"Elasticsearch 연결 오류로 인덱스 '{index_name}' 확인/생성 실패: {e}")
     except Exception as e:
-        logger.error(f"Elasticsearch 인덱스 '{index_name}' 생성 중 알 수 없는 오류 발생: {e}")
\ No newline at end of file
+        logger.error(f"Elasticsearch 인덱스 '{index_name}' 생성 중 알 수 없는 오류 발생: {e}")
+    return False
\ No newline at end of file
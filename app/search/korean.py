@@ -0,0 +1,59 @@
+from typing import Optional
+
+## 한글 음절(가~힣)은 (초성 * 21 + 중성) * 28 + 종성 + 0xAC00 으로 구성됨
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+
+CHOSUNG_LIST = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+JUNGSUNG_LIST = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅘ", "ㅙ",
+    "ㅚ", "ㅛ", "ㅜ", "ㅝ", "ㅞ", "ㅟ", "ㅠ", "ㅡ", "ㅢ", "ㅣ",
+]
+JONGSUNG_LIST = [
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+
+
+def _is_hangul_syllable(char: str) -> bool:
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
+
+
+def extract_chosung(text: Optional[str]) -> Optional[str]:
+    """한글 음절을 초성으로 바꾸고 공백을 제거합니다. (예: '김치 찌개' -> 'ㄱㅊㅉㄱ')
+
+    이미 초성으로 입력된 검색어나 한글이 아닌 문자는 소문자로만 바꿔 그대로 둡니다.
+    """
+    if text is None:
+        return None
+    chars = []
+    for char in text:
+        if char.isspace():
+            continue
+        if _is_hangul_syllable(char):
+            chars.append(CHOSUNG_LIST[(ord(char) - HANGUL_SYLLABLE_START) // (21 * 28)])
+        else:
+            chars.append(char.lower())
+    return "".join(chars)
+
+
+def decompose_jamo(text: Optional[str]) -> Optional[str]:
+    """한글 음절을 초성/중성/종성 자모로 분해합니다. (예: '김치' -> 'ㄱㅣㅁㅊㅣ')
+
+    공백은 유지해 단어 경계를 보존하며, 자모 단위 오타는 분해된 문자열의 n-gram 대부분이 일치하게 됩니다.
+    """
+    if text is None:
+        return None
+    chars = []
+    for char in text:
+        if _is_hangul_syllable(char):
+            offset = ord(char) - HANGUL_SYLLABLE_START
+            chars.append(CHOSUNG_LIST[offset // (21 * 28)])
+            chars.append(JUNGSUNG_LIST[(offset % (21 * 28)) // 28])
+            chars.append(JONGSUNG_LIST[offset % 28])
+        else:
+            chars.append(char.lower())
+    return "".join(chars)
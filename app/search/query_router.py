@@ -0,0 +1,43 @@
+from typing import Any, Dict, Optional
+import threading
+
+from app.core.config import settings
+
+SEARCH_BACKEND_SQLITE = "sqlite"
+SEARCH_BACKEND_ES = "elasticsearch"
+
+
+class SearchBackendCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {SEARCH_BACKEND_SQLITE: 0, SEARCH_BACKEND_ES: 0}
+
+    def record(self, backend: str) -> None:
+        with self._lock:
+            self._counts[backend] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {f"{backend}_total": count for backend, count in self._counts.items()}
+
+
+search_backend_counter = SearchBackendCounter()
+
+
+def plan_search_backend(
+    food_name: Optional[str] = None,
+    research_year: Optional[str] = None,
+    maker_name: Optional[str] = None,
+    food_cd: Optional[str] = None,
+    profile: bool = False
+) -> str:
+    """검색 조건을 보고 어느 저장소에서 처리할지 결정합니다.
+
+    food_cd, research_year처럼 SQLite 인덱스로 정확히 일치 조회가 가능한 조건만 있으면 SQLite로,
+    food_name, maker_name 같은 전문 검색(match) 조건이 있거나 ES profile을 요청하면 Elasticsearch로 보냅니다.
+    """
+    if not settings.SEARCH_ROUTER_ENABLED or profile:
+        return SEARCH_BACKEND_ES
+    if food_name or maker_name:
+        return SEARCH_BACKEND_ES
+    return SEARCH_BACKEND_SQLITE
@@ -0,0 +1,8 @@
+from .read_snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    SnapshotFormatError,
+    FoodNutritionReadSnapshot,
+    write_read_snapshot,
+    get_read_snapshot,
+    close_read_snapshot
+)
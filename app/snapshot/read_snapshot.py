@@ -0,0 +1,311 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+
+from app.schemas.food_nutrition import FOOD_NUTRITION_FIELDS
+
+## 파일 구조: [프리앰블(magic, 포맷 버전, 헤더 길이)][JSON 헤더][8바이트 정렬된 섹션들]
+## 모든 섹션은 리틀엔디언 고정폭 배열이며 np.frombuffer로 mmap 위에 복사 없이 올림
+SNAPSHOT_MAGIC = b"FNSNAP\x00\x00"
+## 2: 정규화 영양성분(100g당/100kcal당) 숫자 컬럼 추가 (이전 버전 파일은 다시 빌드해야 함)
+SNAPSHOT_FORMAT_VERSION = 2
+_PREAMBLE = struct.Struct("<8sII")
+_SECTION_ALIGNMENT = 8
+
+SNAPSHOT_STRING_FIELDS: Tuple[str, ...] = ("food_cd", "food_name", "group_name", "research_year", "maker_name", "ref_name")
+SNAPSHOT_NUMERIC_FIELDS: Tuple[str, ...] = tuple(
+    field for field in FOOD_NUTRITION_FIELDS if field != "id" and field not in SNAPSHOT_STRING_FIELDS
+)
+NULL_STRING_ID = -1
+
+
+class SnapshotFormatError(Exception):
+    """스냅샷 파일이 손상되었거나 지원하지 않는 포맷 버전일 때 발생합니다."""
+
+
+def _align(offset: int) -> int:
+    return (offset + _SECTION_ALIGNMENT - 1) // _SECTION_ALIGNMENT * _SECTION_ALIGNMENT
+
+
+def write_read_snapshot(rows: Iterable[Mapping[str, Any]], output_path: str, source: Optional[str] = None) -> Dict[str, Any]:
+    """id 오름차순 행(FOOD_NUTRITION_FIELDS)을 읽기 전용 스냅샷 파일로 저장하고 헤더 정보를 반환합니다.
+
+    - 숫자 컬럼: float64 고정폭 배열 (NULL은 NaN)
+    - 문자열 컬럼: 정렬·중복 제거한 문자열 테이블의 번호(int32, NULL은 -1)
+    - id 인덱스: id 컬럼 자체(오름차순 정렬), food_cd 인덱스: food_cd 순으로 정렬한 행 위치
+    - 이름 검색: 소문자로 바꾼 식품 이름을 줄바꿈으로 이어 붙인 바이트열과 행별 시작 위치
+    """
+    rows = list(rows)
+    ids = np.array([row["id"] for row in rows], dtype="<i8")
+    if len(ids) > 1 and not np.all(ids[1:] > ids[:-1]):
+        raise ValueError("스냅샷 행은 id 오름차순이어야 합니다.")
+
+    strings = sorted({row[field] for row in rows for field in SNAPSHOT_STRING_FIELDS if row[field] is not None})
+    string_ids = {value: index for index, value in enumerate(strings)}
+    encoded_strings = [value.encode("utf-8") for value in strings]
+    string_offsets = np.zeros(len(strings) + 1, dtype="<i8")
+    np.cumsum([len(value) for value in encoded_strings], out=string_offsets[1:])
+
+    sections: Dict[str, bytes] = {"id": ids.tobytes()}
+    for field in SNAPSHOT_NUMERIC_FIELDS:
+        values = np.array([np.nan if row[field] is None else row[field] for row in rows], dtype="<f8")
+        sections[f"num.{field}"] = values.tobytes()
+    string_columns = {}
+    for field in SNAPSHOT_STRING_FIELDS:
+        column = np.array([NULL_STRING_ID if row[field] is None else string_ids[row[field]] for row in rows], dtype="<i4")
+        string_columns[field] = column
+        sections[f"str.{field}"] = column.tobytes()
+    sections["strings.offsets"] = string_offsets.tobytes()
+    sections["strings.data"] = b"".join(encoded_strings)
+    ## 문자열 테이블이 정렬되어 있으므로 문자열 번호 순서 = food_cd 문자열 순서
+    sections["index.food_cd"] = np.argsort(string_columns["food_cd"], kind="stable").astype("<i4").tobytes()
+
+    search_names = [(row["food_name"] or "").lower().encode("utf-8") for row in rows]
+    search_offsets = np.zeros(len(rows) + 1, dtype="<i8")
+    np.cumsum([len(name) + 1 for name in search_names], out=search_offsets[1:])
+    sections["search.food_name.offsets"] = search_offsets.tobytes()
+    sections["search.food_name.data"] = b"\n".join(search_names) + b"\n"
+
+    dtypes = {"id": "<i8", "strings.offsets": "<i8", "strings.data": "|u1", "index.food_cd": "<i4",
+              "search.food_name.offsets": "<i8", "search.food_name.data": "|u1"}
+    section_table = {}
+    offset = 0
+    content_hash = hashlib.blake2b(digest_size=8)
+    for name, data in sections.items():
+        offset = _align(offset)
+        dtype = dtypes.get(name, "<f8" if name.startswith("num.") else "<i4")
+        section_table[name] = {"offset": offset, "length": len(data), "dtype": dtype}
+        content_hash.update(name.encode("utf-8"))
+        content_hash.update(data)
+        offset += len(data)
+
+    header = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "content_version": content_hash.hexdigest(),
+        "row_count": len(rows),
+        "string_count": len(strings),
+        "created_at": time.time(),
+        "source": source,
+        "sections": section_table,
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, data in sections.items():
+            f.seek(data_start + section_table[name]["offset"])
+            f.write(data)
+    ## 실행 중인 리더가 읽던 파일을 덮어쓰지 않도록 교체 (기존 mmap은 이전 파일을 계속 가리킴)
+    os.replace(tmp_path, output_path)
+    return header
+
+
+class FoodNutritionReadSnapshot:
+    """스냅샷 파일을 mmap으로 열어 조회/필터/이름 검색을 제공합니다.
+
+    컬럼은 mmap 위의 numpy 뷰라서 복사하지 않으며, 여러 워커 프로세스가 같은 페이지 캐시를 공유합니다.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, format_version, header_length = _PREAMBLE.unpack_from(self._mmap, 0)
+            if magic != SNAPSHOT_MAGIC:
+                raise SnapshotFormatError(f"스냅샷 파일이 아닙니다: {path}")
+            if format_version != SNAPSHOT_FORMAT_VERSION:
+                raise SnapshotFormatError(f"지원하지 않는 스냅샷 포맷 버전입니다: {format_version} (지원: {SNAPSHOT_FORMAT_VERSION})")
+            self.header = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_length])
+        except Exception:
+            self._file.close()
+            raise
+
+        data_start = _align(_PREAMBLE.size + header_length)
+        self._arrays: Dict[str, np.ndarray] = {}
+        for name, section in self.header["sections"].items():
+            dtype = np.dtype(section["dtype"])
+            if section["length"] == 0:
+                self._arrays[name] = np.empty(0, dtype=dtype)
+                continue
+            self._arrays[name] = np.frombuffer(
+                self._mmap, dtype=dtype, count=section["length"] // dtype.itemsize, offset=data_start + section["offset"]
+            )
+        self.row_count: int = self.header["row_count"]
+        self._ids = self._arrays["id"]
+        self._string_offsets = self._arrays["strings.offsets"]
+        self._strings_start = data_start + self.header["sections"]["strings.data"]["offset"]
+        self._search_offsets = self._arrays["search.food_name.offsets"]
+        self._search_start = data_start + self.header["sections"]["search.food_name.data"]["offset"]
+
+    def close(self) -> None:
+        self._arrays.clear()
+        self._ids = self._string_offsets = self._search_offsets = None
+        self._mmap.close()
+        self._file.close()
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "format_version": self.header["format_version"],
+            "content_version": self.header["content_version"],
+            "row_count": self.row_count,
+            "created_at": self.header["created_at"],
+            "source": self.header["source"],
+        }
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == NULL_STRING_ID:
+            return None
+        start = self._strings_start + int(self._string_offsets[string_id])
+        end = self._strings_start + int(self._string_offsets[string_id + 1])
+        return self._mmap[start:end].decode("utf-8")
+
+    def _find_string_id(self, value: str) -> Optional[int]:
+        ## 정렬된 문자열 테이블에서 이진 탐색 (문자열 전체를 메모리에 올리지 않음)
+        string_count = self.header["string_count"]
+        index = bisect.bisect_left(range(string_count), value, key=self._string)
+        if index < string_count and self._string(index) == value:
+            return index
+        return None
+
+    def position_for_id(self, food_nutrition_id: int) -> Optional[int]:
+        position = int(np.searchsorted(self._ids, food_nutrition_id))
+        if position < self.row_count and self._ids[position] == food_nutrition_id:
+            return position
+        return None
+
+    def position_for_food_cd(self, food_cd: str) -> Optional[int]:
+        string_id = self._find_string_id(food_cd)
+        if string_id is None:
+            return None
+        food_cd_ids = self._arrays["str.food_cd"]
+        index_position = int(np.searchsorted(food_cd_ids, string_id, sorter=self._arrays["index.food_cd"]))
+        if index_position >= self.row_count:
+            return None
+        position = int(self._arrays["index.food_cd"][index_position])
+        return position if food_cd_ids[position] == string_id else None
+
+    def _name_matches(self, position: int, terms: Sequence[bytes]) -> bool:
+        row_start = self._search_start + int(self._search_offsets[position])
+        row_end = self._search_start + int(self._search_offsets[position + 1]) - 1
+        return all(self._mmap.find(term, row_start, row_end) >= 0 for term in terms)
+
+    def _search_name_positions(self, terms: Sequence[bytes]) -> np.ndarray:
+        ## 첫 검색어는 mmap.find로 이름 바이트열 전체를 직접 훑고, 나머지 검색어는 후보 행의 이름에서만 확인 (모두 포함해야 일치)
+        if not terms:
+            return np.arange(self.row_count)
+        data_end = self._search_start + int(self._search_offsets[-1])
+        positions: List[int] = []
+        cursor = self._search_start
+        while True:
+            found = self._mmap.find(terms[0], cursor, data_end)
+            if found < 0:
+                break
+            position = int(np.searchsorted(self._search_offsets, found - self._search_start, side="right")) - 1
+            if self._name_matches(position, terms[1:]):
+                positions.append(position)
+            ## 같은 행에서 다시 찾지 않도록 다음 행의 시작으로 이동
+            cursor = self._search_start + int(self._search_offsets[position + 1])
+        return np.array(positions, dtype=np.int64)
+
+    def find_positions(
+        self,
+        food_name: Optional[str] = None,
+        research_year: Optional[str] = None,
+        maker_name: Optional[str] = None,
+        food_cd: Optional[str] = None
+    ) -> Optional[np.ndarray]:
+        """조건에 맞는 행 위치를 id 오름차순으로 반환합니다. 조건이 없으면 전체를 뜻하는 None을 반환합니다.
+
+        food_name은 공백으로 나눈 검색어가 모두 포함된 이름(대소문자 무시), 나머지는 정확히 일치하는 값을 찾습니다.
+        """
+        if food_name is None and research_year is None and maker_name is None and food_cd is None:
+            return None
+        terms = [term.encode("utf-8") for term in food_name.lower().split()] if food_name is not None else []
+        if food_cd is not None:
+            position = self.position_for_food_cd(food_cd)
+            matched = position is not None and self._name_matches(position, terms)
+            positions = np.array([position] if matched else [], dtype=np.int64)
+        elif terms:
+            positions = self._search_name_positions(terms)
+        else:
+            positions = None
+
+        for field, value in (("research_year", research_year), ("maker_name", maker_name)):
+            if value is None:
+                continue
+            string_id = self._find_string_id(value)
+            if string_id is None:
+                return np.array([], dtype=np.int64)
+            column = self._arrays[f"str.{field}"]
+            if positions is None:
+                positions = np.flatnonzero(column == string_id)
+            else:
+                positions = positions[column[positions] == string_id]
+        return positions if positions is not None else np.arange(self.row_count)
+
+    def page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        **criteria: Optional[str]
+    ) -> Tuple[np.ndarray, int]:
+        """조건에 맞는 행 위치 중 skip/limit 구간과 전체 건수를 반환합니다."""
+        positions = self.find_positions(**criteria)
+        if positions is None:
+            return np.arange(min(skip, self.row_count), min(skip + limit, self.row_count)), self.row_count
+        return positions[skip:skip + limit], len(positions)
+
+    def rows(self, positions: Sequence[int], fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """행 위치 목록을 API 응답 필드 순서의 dict 목록으로 만듭니다 (NaN/-1은 None)."""
+        fields = fields or FOOD_NUTRITION_FIELDS
+        positions = np.asarray(positions, dtype=np.int64)
+        columns: Dict[str, List[Any]] = {}
+        for field in fields:
+            if field == "id":
+                columns[field] = self._ids[positions].tolist()
+            elif field in SNAPSHOT_STRING_FIELDS:
+                columns[field] = [self._string(string_id) for string_id in self._arrays[f"str.{field}"][positions].tolist()]
+            else:
+                values = self._arrays[f"num.{field}"][positions]
+                columns[field] = [None if value != value else value for value in values.tolist()]
+        return [dict(zip(fields, values)) for values in zip(*(columns[field] for field in fields))]
+
+
+_read_snapshot: Optional[FoodNutritionReadSnapshot] = None
+_read_snapshot_lock = threading.Lock()
+
+
+def get_read_snapshot() -> FoodNutritionReadSnapshot:
+    """settings.READ_SNAPSHOT_PATH의 스냅샷을 프로세스당 한 번만 엽니다."""
+    from app.core.config import settings
+
+    global _read_snapshot
+    with _read_snapshot_lock:
+        if _read_snapshot is None:
+            if not settings.READ_SNAPSHOT_PATH:
+                raise RuntimeError("READ_SNAPSHOT_PATH가 설정되지 않았습니다.")
+            _read_snapshot = FoodNutritionReadSnapshot(settings.READ_SNAPSHOT_PATH)
+        return _read_snapshot
+
+
+def close_read_snapshot() -> None:
+    global _read_snapshot
+    with _read_snapshot_lock:
+        if _read_snapshot is not None:
+            _read_snapshot.close()
+            _read_snapshot = None
@@ -0,0 +1,42 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Any, Dict
+import argparse
+import logging
+import os
+
+from app.db.session import SessionLocal
+from app.models.food_nutrition import FoodNutrition as FoodNutritionModel
+from app.schemas.food_nutrition import FOOD_NUTRITION_FIELDS
+from app.snapshot import write_read_snapshot
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_SNAPSHOT_PATH = os.path.join("data", "read_snapshots", "food_nutritions.fnsnap")
+READ_BATCH_SIZE = 5000
+
+
+def build_read_snapshot(db: Session, output_path: str) -> Dict[str, Any]:
+    """food_nutritions 테이블 전체를 id 순으로 읽어 읽기 전용 스냅샷 파일을 만듭니다."""
+    statement = select(*(getattr(FoodNutritionModel, field) for field in FOOD_NUTRITION_FIELDS)).order_by(FoodNutritionModel.id)
+    rows = db.execute(statement.execution_options(yield_per=READ_BATCH_SIZE)).mappings()
+    source = db.get_bind().url.render_as_string(hide_password=True)
+    return write_read_snapshot(rows, output_path, source=source)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite의 식품영양정보를 mmap으로 읽는 읽기 전용 스냅샷 파일로 만듭니다.")
+    parser.add_argument("--output", default=DEFAULT_READ_SNAPSHOT_PATH, help="스냅샷 파일 경로 (서버에서는 READ_SNAPSHOT_PATH로 지정)")
+    args = parser.parse_args()
+
+    logger.info("읽기 전용 스냅샷 생성을 시작합니다...")
+    db = SessionLocal()
+    try:
+        header = build_read_snapshot(db, args.output)
+    finally:
+        db.close()
+    logger.info(
+        f"스냅샷 생성 완료: {args.output} ({header['row_count']}건, 문자열 {header['string_count']}개, "
+        f"내용 버전 {header['content_version']}, {os.path.getsize(args.output)} bytes)"
+    )
@@ -0,0 +1,232 @@
+import numpy as np
+import pandas as pd
+import argparse
+import logging
+import math
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from scripts.load_data import (
+    EXCEL_FILE_PATH,
+    GROUP_COLUMNS,
+    LESS_THAN_1G_TEXT,
+    LESS_THAN_1G_VALUE,
+    LOAD_MODE_INSERT,
+    LOAD_MODE_UPSERT,
+    NUMERIC_COLUMN_MAP,
+    TEXT_COLUMN_MAP,
+    _normalize_for_parquet,
+    load_excel_to_db_and_es,
+    read_source_dataframe,
+    transform_source_dataframe,
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SYNTHETIC_FOOD_CD_PREFIX = "SYN"
+GROUP_NAME_SEPARATOR = " - "
+## 숫자 컬럼 분포를 기억할 분위수 개수 (역누적분포 샘플링에 사용)
+NUMERIC_QUANTILES = 101
+## 행 수에 비례해 고유값 수가 늘어나는 컬럼 (식품군/조사년도 등은 원본의 고유값을 그대로 사용)
+SCALED_CARDINALITY_FIELDS = ("maker_name",)
+CATEGORICAL_FIELDS = ("group_name", "research_year", "maker_name", "ref_name")
+
+
+def _categorical_profile(series: pd.Series) -> Dict[str, Any]:
+    counts = series.value_counts(dropna=True)
+    return {
+        "null_rate": float(series.isna().mean()),
+        "values": counts.index.tolist(),
+        "weights": (counts / counts.sum()).tolist() if len(counts) else [],
+    }
+
+
+def _numeric_profile(series: pd.Series) -> Dict[str, Any]:
+    is_less_than_1g = series.eq(LESS_THAN_1G_VALUE)
+    values = series[series.notna() & ~is_less_than_1g]
+    return {
+        "null_rate": float(series.isna().mean()),
+        "less_than_1g_rate": float(is_less_than_1g.mean()),
+        "quantiles": np.quantile(values, np.linspace(0, 1, NUMERIC_QUANTILES)).tolist() if len(values) else [],
+        "is_integer": bool(len(values) and values.mod(1).eq(0).all()),
+    }
+
+
+def _name_token_profile(food_names: pd.Series) -> Dict[str, Any]:
+    ## 마지막 토큰(예: '김치', '찌개')과 앞쪽 토큰을 따로 모아 이름 형태를 유지
+    tokens = food_names.str.split()
+    token_counts = tokens.str.len()
+    heads = pd.Series([token for name_tokens in tokens for token in name_tokens[:-1]], dtype=object)
+    tails = tokens.str[-1]
+    return {
+        "token_counts": _categorical_profile(token_counts),
+        "heads": _categorical_profile(heads),
+        "tails": _categorical_profile(tails),
+    }
+
+
+def build_column_profile(clean_df: pd.DataFrame) -> Dict[str, Any]:
+    """정제된 원본 DataFrame(transform_source_dataframe 결과)에서 컬럼별 분포를 학습합니다."""
+    return {
+        "source_rows": len(clean_df),
+        "food_name": _name_token_profile(clean_df["food_name"]),
+        "categorical": {field: _categorical_profile(clean_df[field]) for field in CATEGORICAL_FIELDS},
+        "numeric": {field: _numeric_profile(clean_df[field]) for field in NUMERIC_COLUMN_MAP},
+    }
+
+
+def _sample_categorical(rng: np.random.Generator, profile: Dict[str, Any], n_rows: int) -> np.ndarray:
+    result = np.full(n_rows, None, dtype=object)
+    if not profile["values"]:
+        return result
+    values = np.empty(len(profile["values"]), dtype=object)
+    values[:] = profile["values"]
+    sampled = values[rng.choice(len(values), size=n_rows, p=profile["weights"])]
+    is_null = rng.random(n_rows) < profile["null_rate"]
+    result[~is_null] = sampled[~is_null]
+    return result
+
+
+def _sample_numeric(rng: np.random.Generator, profile: Dict[str, Any], n_rows: int) -> np.ndarray:
+    if not profile["quantiles"]:
+        values = np.full(n_rows, np.nan)
+    else:
+        ## 분위수 사이를 선형 보간하는 역누적분포 샘플링 (원본의 최소~최대 범위를 벗어나지 않음)
+        quantiles = np.asarray(profile["quantiles"])
+        values = np.interp(rng.random(n_rows), np.linspace(0, 1, len(quantiles)), quantiles)
+        values = np.round(values) if profile["is_integer"] else np.round(values, 2)
+    draw = rng.random(n_rows)
+    values[draw < profile["null_rate"]] = np.nan
+    values[(draw >= profile["null_rate"]) & (draw < profile["null_rate"] + profile["less_than_1g_rate"])] = LESS_THAN_1G_VALUE
+    return values
+
+
+def _sample_food_names(rng: np.random.Generator, profile: Dict[str, Any], n_rows: int) -> np.ndarray:
+    token_counts = _sample_categorical(rng, {**profile["token_counts"], "null_rate": 0.0}, n_rows)
+    names = _sample_categorical(rng, {**profile["tails"], "null_rate": 0.0}, n_rows)
+    max_heads = int(max(profile["token_counts"]["values"], default=1)) - 1
+    for position in range(max_heads):
+        has_head = token_counts > position + 1
+        if not has_head.any() or not profile["heads"]["values"]:
+            break
+        heads = _sample_categorical(rng, {**profile["heads"], "null_rate": 0.0}, int(has_head.sum()))
+        names[has_head] = [f"{head} {name}" for head, name in zip(heads, names[has_head])]
+    return names
+
+
+def _scale_cardinality(rng: np.random.Generator, values: np.ndarray, scale: int) -> np.ndarray:
+    ## 원본 값에 번호를 붙여 고유값 수가 행 수에 비례하게 늘어나도록 함 (예: '삼삼한밥상' -> '삼삼한밥상 3')
+    if scale <= 1:
+        return values
+    replica = rng.integers(0, scale, size=len(values))
+    scaled = values.copy()
+    needs_suffix = (replica > 0) & (values != None)  # noqa: E711
+    scaled[needs_suffix] = [f"{value} {number + 1}" for value, number in zip(values[needs_suffix], replica[needs_suffix])]
+    return scaled
+
+
+def generate_synthetic_dataframe(
+    profile: Dict[str, Any],
+    n_rows: int,
+    seed: int = 0,
+    food_cd_prefix: str = SYNTHETIC_FOOD_CD_PREFIX,
+    start_index: int = 0
+) -> pd.DataFrame:
+    """학습한 분포로 n_rows개의 합성 행을 만들어 적재 스크립트의 원본 컬럼 형식 DataFrame으로 반환합니다.
+
+    같은 profile, seed, start_index이면 항상 같은 데이터를 생성하며, food_cd는 '{prefix}{번호}'로 고유합니다.
+    """
+    rng = np.random.default_rng(seed)
+    scale = max(1, math.ceil(n_rows / max(profile["source_rows"], 1)))
+    source = pd.DataFrame(index=range(n_rows))
+
+    source[TEXT_COLUMN_MAP["food_cd"]] = [f"{food_cd_prefix}{start_index + i:09d}" for i in range(n_rows)]
+    source[TEXT_COLUMN_MAP["food_name"]] = _sample_food_names(rng, profile["food_name"], n_rows)
+
+    for field in CATEGORICAL_FIELDS:
+        values = _sample_categorical(rng, profile["categorical"][field], n_rows)
+        if field in SCALED_CARDINALITY_FIELDS:
+            values = _scale_cardinality(rng, values, scale)
+        if field == "group_name":
+            groups = pd.Series(values, dtype=object).str.split(GROUP_NAME_SEPARATOR, n=1, expand=True).reindex(columns=[0, 1])
+            source[GROUP_COLUMNS[0]] = groups[0].values
+            source[GROUP_COLUMNS[1]] = groups[1].values
+        else:
+            source[TEXT_COLUMN_MAP[field]] = values
+
+    for field, column_name in NUMERIC_COLUMN_MAP.items():
+        values = pd.Series(_sample_numeric(rng, profile["numeric"][field], n_rows), dtype=object)
+        ## 원본 파일처럼 '1g 미만'은 문자열로 기록
+        source[column_name] = values.mask(values.eq(LESS_THAN_1G_VALUE), LESS_THAN_1G_TEXT).where(values.notna(), None)
+
+    return source
+
+
+def write_source_dataframe(df: pd.DataFrame, output_path: str):
+    extension = os.path.splitext(output_path)[1].lower()
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    if extension == ".parquet":
+        _normalize_for_parquet(df).to_parquet(output_path, index=False)
+    elif extension == ".csv":
+        df.to_csv(output_path, index=False)
+    elif extension == ".xlsx":
+        df.to_excel(output_path, index=False)
+    else:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output_path} (xlsx, csv, parquet 지원)")
+
+
+def generate_synthetic_source(
+    n_rows: Optional[int] = None,
+    scale: Optional[float] = None,
+    source_path: str = EXCEL_FILE_PATH,
+    output_path: Optional[str] = None,
+    seed: int = 0,
+    load: bool = False,
+    mode: str = LOAD_MODE_INSERT
+) -> str:
+    """원본 파일에서 분포를 학습해 합성 데이터를 파일로 저장하고, load=True이면 SQLite/Elasticsearch에 적재합니다.
+
+    행 수는 n_rows 또는 원본 대비 배율(scale)로 지정하며, 저장한 파일 경로를 반환합니다.
+    """
+    if output_path is None and not load:
+        raise ValueError("output_path를 지정하거나 load=True로 바로 적재해야 합니다.")
+
+    clean_df, _ = transform_source_dataframe(read_source_dataframe(source_path))
+    profile = build_column_profile(clean_df)
+    if n_rows is None:
+        n_rows = int(profile["source_rows"] * scale)
+    logger.info(f"'{source_path}'의 {profile['source_rows']}행에서 컬럼 분포를 학습했습니다. 합성 데이터 {n_rows}행 생성 시작...")
+    synthetic_df = generate_synthetic_dataframe(profile, n_rows, seed=seed)
+
+    if output_path is None:
+        output_path = os.path.join(tempfile.mkdtemp(prefix="synthetic_"), "synthetic.parquet")
+    write_source_dataframe(synthetic_df, output_path)
+    logger.info(f"합성 데이터 저장 완료: {output_path}")
+
+    if load:
+        load_excel_to_db_and_es(source_path=output_path, use_snapshot=False, mode=mode)
+    return output_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="원본 파일의 컬럼 분포를 학습해 용량 테스트용 합성 식품영양정보를 생성합니다.")
+    parser.add_argument("--source", default=EXCEL_FILE_PATH, help="분포를 학습할 원본 파일 경로")
+    size_group = parser.add_mutually_exclusive_group(required=True)
+    size_group.add_argument("--rows", type=int, help="생성할 행 수")
+    size_group.add_argument("--scale", type=float, help="원본 행 수 대비 배율 (예: 10, 1000)")
+    parser.add_argument("--output", help="출력 파일 경로 (parquet, csv, xlsx). 1M행 이상은 parquet 권장")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (같은 시드면 같은 데이터 생성)")
+    parser.add_argument("--load", action="store_true", help="생성 후 load_data.py로 SQLite/Elasticsearch에 바로 적재")
+    parser.add_argument("--mode", choices=[LOAD_MODE_INSERT, LOAD_MODE_UPSERT], default=LOAD_MODE_INSERT, help="--load 시 적재 모드")
+    args = parser.parse_args()
+
+    if args.output is None and not args.load:
+        parser.error("--output 또는 --load 중 하나는 지정해야 합니다.")
+    generate_synthetic_source(
+        n_rows=args.rows, scale=args.scale, source_path=args.source, output_path=args.output,
+        seed=args.seed, load=args.load, mode=args.mode
+    )
@@ -1,41 +1,259 @@
 import pandas as pd
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from elasticsearch import Elasticsearch, exceptions as es_exceptions
 from elasticsearch.helpers import bulk
+import argparse
+import hashlib
 import logging
-import math
 import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from app.core.nutrition_calculator import NORMALIZED_NUTRIENT_FIELDS, NORMALIZED_NUTRIENT_SOURCES, normalize_nutrient_values
 from app.db.session import SessionLocal
 from app.models.food_nutrition import FoodNutrition as FoodNutritionModel
-from app.schemas.food_nutrition import FoodNutritionCreate
-from app.repositories import food_nutrition_repository
-from app.search import get_es_client, FOOD_NUTRITIONS_INDEX_NAME
+from app.repositories.food_nutrition_repository import (
+    CONTENT_HASH_FIELDS,
+    CONTENT_HASH_NULL,
+    CONTENT_HASH_SEPARATOR,
+    hash_canonical_content,
+    record_food_nutrition_changes,
+)
+from app.models.food_nutrition_change import CHANGE_OPERATION_UPSERT
+from app.search import get_es_client, FOOD_NUTRITIONS_INDEX_NAME, extract_chosung, decompose_jamo
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 EXCEL_FILE_PATH = "data/food_data.xlsx" 
+SNAPSHOT_DIR = os.getenv("LOADER_SNAPSHOT_DIR", "data/snapshots")
+HASH_CHUNK_SIZE = 1024 * 1024
+INSERT_CHUNK_SIZE = 1000
+ES_BULK_CHUNK_SIZE = 1000
 
-def safe_float_conversion(value, column_name_for_log="", food_cd_for_log=""):
-    if pd.isna(value) or str(value).strip() == '-' or str(value).strip() == '':
-        return None
-    
-    # "1g 미만"을 -1.0으로 치환
-    if value == '1g 미만':
-        logger.info(f"FoodCD '{food_cd_for_log}': 컬럼 '{column_name_for_log}'의 값 '{value}'을(를) -1.0으로 변환합니다 (1g 미만 의미).")
-        return -1.0 
+LOAD_MODE_INSERT = "insert"
+LOAD_MODE_UPSERT = "upsert"
+
+## 적재 진행 상황 콜백: {"stage": ..., "rows_processed": ..., "error": ...} 같은 갱신 내용을 전달받음
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+def _file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
+def _snapshot_path_for(source_path: str, content_hash: str, snapshot_dir: str = SNAPSHOT_DIR) -> str:
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(snapshot_dir, f"{stem}.{content_hash[:16]}.parquet")
+
+def _normalize_for_parquet(df: pd.DataFrame) -> pd.DataFrame:
+    ## Excel의 혼합 타입 컬럼(예: '39.7'과 '1g 미만'이 섞인 object 컬럼)은 Parquet으로 저장할 수 없으므로 문자열로 통일
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+def _write_snapshot(df: pd.DataFrame, source_path: str, snapshot_path: str, snapshot_dir: str = SNAPSHOT_DIR):
     try:
-        return float(value)
-    except ValueError:
-        logger.warning(f"FoodCD '{food_cd_for_log}': 컬럼 '{column_name_for_log}'의 값 '{value}'을(를) float으로 변환할 수 없습니다. None으로 처리합니다.")
-        return None
+        os.makedirs(snapshot_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        for file_name in os.listdir(snapshot_dir):
+            if file_name.startswith(f"{stem}.") and file_name.endswith(".parquet"):
+                os.remove(os.path.join(snapshot_dir, file_name))
+        tmp_path = f"{snapshot_path}.tmp"
+        _normalize_for_parquet(df).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, snapshot_path)
+        logger.info(f"원본 스냅샷 저장 완료: {snapshot_path}")
+    except Exception as e:
+        logger.warning(f"원본 스냅샷 저장 실패 (다음 실행에서 다시 원본을 파싱합니다): {e}")
 
-def safe_str_conversion(value):
-    if pd.isna(value) or value is None:
-        return None
-    return str(value).strip()
+def read_source_dataframe(source_path: str = EXCEL_FILE_PATH, use_snapshot: bool = True, snapshot_dir: str = SNAPSHOT_DIR) -> pd.DataFrame:
+    extension = os.path.splitext(source_path)[1].lower()
+
+    if extension == ".csv":
+        return pd.read_csv(source_path, na_values=['-'])
+    if extension == ".parquet":
+        return pd.read_parquet(source_path)
+    if extension not in (".xlsx", ".xls"):
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {source_path} (xlsx, xls, csv, parquet 지원)")
+
+    if not use_snapshot:
+        return pd.read_excel(source_path, na_values=['-'])
+
+    ## 원본 파일의 내용 해시를 키로 스냅샷을 찾으므로, 원본이 바뀌면 자동으로 새로 파싱
+    content_hash = _file_sha256(source_path)
+    snapshot_path = _snapshot_path_for(source_path, content_hash, snapshot_dir)
+    if os.path.exists(snapshot_path):
+        try:
+            df = pd.read_parquet(snapshot_path)
+            logger.info(f"원본 스냅샷 사용: {snapshot_path}")
+            return df
+        except Exception as e:
+            logger.warning(f"원본 스냅샷 읽기 실패, Excel 파일을 다시 파싱합니다: {e}")
+
+    df = pd.read_excel(source_path, na_values=['-'])
+    _write_snapshot(df, source_path, snapshot_path, snapshot_dir)
+    return df
+
+LESS_THAN_1G_TEXT = '1g 미만'
+LESS_THAN_1G_VALUE = -1.0
+MISSING_VALUE_TEXTS = ['-', '']
+REPORT_SAMPLE_SIZE = 5
+
+## 모델 필드명 -> 원본 컬럼명
+TEXT_COLUMN_MAP = {
+    "food_cd": "식품코드",
+    "food_name": "식품명",
+    "research_year": "연도",
+    "maker_name": "지역 / 제조사",
+    "ref_name": "성분표출처",
+}
+NUMERIC_COLUMN_MAP = {
+    "serving_size": "1회제공량",
+    "calorie": "에너지(㎉)",
+    "carbohydrate": "탄수화물(g)",
+    "protein": "단백질(g)",
+    "province": "지방(g)",
+    "sugars": "총당류(g)",
+    "salt": "나트륨(㎎)",
+    "cholesterol": "콜레스테롤(㎎)",
+    "saturated_fatty_acids": "총 포화 지방산(g)",
+    "trans_fat": "트랜스 지방산(g)",
+}
+GROUP_COLUMNS = ("식품대분류", "식품상세분류")
+REQUIRED_FIELDS = ("food_cd", "food_name")
+MODEL_FIELDS = ["food_cd", "food_name", "group_name", "research_year", "maker_name", "ref_name", *NUMERIC_COLUMN_MAP.keys()]
+
+def _column_or_empty(df: pd.DataFrame, column_name: str) -> pd.Series:
+    if column_name in df.columns:
+        return df[column_name]
+    return pd.Series(None, index=df.index, dtype=object)
+
+def _clean_str_column(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_float_dtype(series) and series.dropna().mod(1).eq(0).all():
+        ## 결측치 때문에 float으로 읽힌 정수 컬럼(예: 연도)이 '2019.0'이 되지 않도록 정수로 되돌림
+        series = series.astype("Int64")
+    cleaned = series.astype(object).where(series.notna(), None)
+    cleaned = cleaned.where(cleaned.isna(), cleaned.astype(str).str.strip())
+    return cleaned.where(cleaned.ne(''), None)
+
+def _clean_numeric_column(series: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    if pd.api.types.is_numeric_dtype(series):
+        empty = pd.Series(False, index=series.index)
+        return series.astype(float), empty, empty
+
+    text = series.astype(str).str.strip().where(series.notna(), None)
+    is_missing = text.isna() | text.isin(MISSING_VALUE_TEXTS)
+    is_less_than_1g = text.eq(LESS_THAN_1G_TEXT)
+    values = pd.to_numeric(text.where(~is_missing & ~is_less_than_1g), errors='coerce')
+    is_invalid = values.isna() & ~is_missing & ~is_less_than_1g
+    values = values.mask(is_less_than_1g, LESS_THAN_1G_VALUE)
+    return values.astype(float), is_less_than_1g, is_invalid
+
+def transform_source_dataframe(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """원본 DataFrame을 컬럼 단위로 정제해 FoodNutrition 필드명을 가진 DataFrame과 요약 리포트를 반환합니다."""
+    missing_required = [TEXT_COLUMN_MAP[field] for field in REQUIRED_FIELDS if TEXT_COLUMN_MAP[field] not in df.columns]
+    if missing_required:
+        raise KeyError(f"원본 파일에 필수 컬럼이 없습니다: {missing_required}")
+
+    report: Dict[str, Any] = {
+        "source_rows": len(df),
+        "less_than_1g": {},
+        "invalid_numeric": {},
+        "invalid_numeric_samples": {},
+        "missing_required_rows": 0,
+        "duplicate_food_cd_rows": 0,
+    }
+    cleaned = pd.DataFrame(index=df.index)
+
+    for field, column_name in TEXT_COLUMN_MAP.items():
+        cleaned[field] = _clean_str_column(_column_or_empty(df, column_name))
+
+    main_group, sub_group = (_clean_str_column(_column_or_empty(df, column_name)) for column_name in GROUP_COLUMNS)
+    group_name = main_group.where(sub_group.isna(), main_group + " - " + sub_group)
+    cleaned["group_name"] = group_name.where(main_group.notna(), sub_group)
+
+    for field, column_name in NUMERIC_COLUMN_MAP.items():
+        values, is_less_than_1g, is_invalid = _clean_numeric_column(_column_or_empty(df, column_name))
+        cleaned[field] = values
+        if is_less_than_1g.any():
+            report["less_than_1g"][column_name] = int(is_less_than_1g.sum())
+        if is_invalid.any():
+            report["invalid_numeric"][column_name] = int(is_invalid.sum())
+            report["invalid_numeric_samples"][column_name] = cleaned.loc[is_invalid, "food_cd"].head(REPORT_SAMPLE_SIZE).tolist()
+
+    has_required = cleaned[list(REQUIRED_FIELDS)].notna().all(axis=1)
+    report["missing_required_rows"] = int((~has_required).sum())
+    cleaned = cleaned[has_required]
+
+    is_duplicate = cleaned["food_cd"].duplicated(keep="first")
+    report["duplicate_food_cd_rows"] = int(is_duplicate.sum())
+    cleaned = cleaned[~is_duplicate]
+
+    report["valid_rows"] = len(cleaned)
+    return cleaned[MODEL_FIELDS].reset_index(drop=True), report
+
+def _log_transform_report(report: Dict[str, Any]):
+    logger.info(
+        f"원본 정제 완료: 원본 {report['source_rows']}행 중 유효 {report['valid_rows']}행, "
+        f"필수값 누락 {report['missing_required_rows']}행, 식품코드 중복 {report['duplicate_food_cd_rows']}행."
+    )
+    if report["less_than_1g"]:
+        logger.info(f"'{LESS_THAN_1G_TEXT}' 값을 {LESS_THAN_1G_VALUE}(으)로 변환한 건수 (컬럼별): {report['less_than_1g']}")
+    if report["invalid_numeric"]:
+        logger.warning(
+            f"숫자로 변환할 수 없어 NULL로 처리한 건수 (컬럼별): {report['invalid_numeric']}, "
+            f"예시 식품코드: {report['invalid_numeric_samples']}"
+        )
+
+def compute_content_hashes(df: pd.DataFrame) -> pd.Series:
+    """정제된 DataFrame의 행별 내용 해시를 계산합니다. Repository의 compute_content_hash와 같은 값을 냅니다."""
+    canonical = None
+    for field in CONTENT_HASH_FIELDS:
+        column = df[field]
+        if pd.api.types.is_numeric_dtype(column):
+            text = column.astype(float).astype(str)
+        else:
+            text = column.astype(str)
+        text = text.where(column.notna(), CONTENT_HASH_NULL)
+        canonical = text if canonical is None else canonical + CONTENT_HASH_SEPARATOR + text
+    return canonical.map(hash_canonical_content)
+
+def compute_normalized_nutrient_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """정제된 DataFrame의 100g당/100kcal당 값을 컬럼 단위로 계산합니다. Repository의 compute_normalized_nutrients와 같은 값을 냅니다."""
+    return pd.DataFrame(
+        {
+            field: normalize_nutrient_values(df[source].astype(float).to_numpy(), df[base].astype(float).to_numpy())
+            for field, (source, base) in NORMALIZED_NUTRIENT_SOURCES.items()
+        },
+        index=df.index,
+    )
+
+def _dataframe_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    return df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
+def _fetch_existing_hashes(db: Session, food_cds: List[str], chunk_size: int = 500) -> pd.DataFrame:
+    rows = []
+    for i in range(0, len(food_cds), chunk_size):
+        food_cd_chunk = food_cds[i:i + chunk_size]
+        rows.extend(
+            db.query(FoodNutritionModel.id, FoodNutritionModel.food_cd, FoodNutritionModel.content_hash)
+            .filter(FoodNutritionModel.food_cd.in_(food_cd_chunk))
+            .all()
+        )
+    return pd.DataFrame(rows, columns=["id", "food_cd", "existing_hash"])
+
+def _fetch_existing_items(db: Session, food_cds: List[str], chunk_size: int = 500) -> Dict[str, FoodNutritionModel]:
+    items: Dict[str, FoodNutritionModel] = {}
+    for i in range(0, len(food_cds), chunk_size):
+        food_cd_chunk = food_cds[i:i + chunk_size]
+        query_result = db.query(FoodNutritionModel).filter(FoodNutritionModel.food_cd.in_(food_cd_chunk)).all()
+        for item in query_result:
+            items[item.food_cd] = item
+    return items
 
 def _get_es_doc_from_sqlalchemy_model(food_model: FoodNutritionModel) -> dict:
     doc = {
@@ -43,6 +261,8 @@ def _get_es_doc_from_sqlalchemy_model(food_model: FoodNutritionModel) -> dict:
         "food_cd": food_model.food_cd,
         "group_name": food_model.group_name,
         "food_name": food_model.food_name,
+        "food_name_chosung": extract_chosung(food_model.food_name),
+        "food_name_jamo": decompose_jamo(food_model.food_name),
         "research_year": food_model.research_year,
         "maker_name": food_model.maker_name,
         "ref_name": food_model.ref_name,
@@ -56,11 +276,25 @@ def _get_es_doc_from_sqlalchemy_model(food_model: FoodNutritionModel) -> dict:
         "cholesterol": food_model.cholesterol,
         "saturated_fatty_acids": food_model.saturated_fatty_acids,
         "trans_fat": food_model.trans_fat,
+        **{field: getattr(food_model, field) for field in NORMALIZED_NUTRIENT_FIELDS},
     }
     return {k: v for k, v in doc.items() if v is not None}
 
 
-def load_excel_to_db_and_es():
+def _report_progress(progress_callback: Optional[ProgressCallback], **update: Any):
+    if progress_callback is not None:
+        progress_callback(update)
+
+def load_excel_to_db_and_es(
+    source_path: str = EXCEL_FILE_PATH,
+    use_snapshot: bool = True,
+    mode: str = LOAD_MODE_INSERT,
+    progress_callback: Optional[ProgressCallback] = None
+) -> Optional[Dict[str, int]]:
+    """원본 파일을 정제해 SQLite에 청크 단위로 적재하고 Elasticsearch에 bulk 인덱싱합니다.
+
+    progress_callback을 지정하면 단계(stage)와 처리 건수, 오류를 dict로 전달받습니다 (백그라운드 import 작업에서 사용).
+    """
     db: Session = SessionLocal()
     es_client: Elasticsearch = None
 
@@ -73,134 +307,155 @@ def load_excel_to_db_and_es():
         logger.warning(f"Elasticsearch 클라이언트 생성 중 오류: {e}. 데이터는 SQLite에만 적재됩니다.")
         es_client = None
 
-    logger.info(f"'{EXCEL_FILE_PATH}'에서 데이터 로딩 시작...")
+    logger.info(f"'{source_path}'에서 데이터 로딩 시작...")
+    _report_progress(progress_callback, stage="reading")
     try:
-        df = pd.read_excel(EXCEL_FILE_PATH, na_values=['-'])
-        logger.info(f"Excel 파일에서 {len(df)}개의 행을 읽었습니다.")
+        df = read_source_dataframe(source_path, use_snapshot=use_snapshot)
+        logger.info(f"원본 파일에서 {len(df)}개의 행을 읽었습니다.")
     except FileNotFoundError:
-        logger.error(f"Excel 파일을 찾을 수 없습니다: {EXCEL_FILE_PATH}")
+        logger.error(f"원본 파일을 찾을 수 없습니다: {source_path}")
+        _report_progress(progress_callback, error=f"원본 파일을 찾을 수 없습니다: {source_path}")
         db.close()
-        return
+        return None
     except Exception as e:
-        logger.error(f"Excel 파일 읽기 중 오류 발생: {e}")
+        logger.error(f"원본 파일 읽기 중 오류 발생: {e}")
+        _report_progress(progress_callback, error=f"원본 파일 읽기 중 오류 발생: {e}")
         db.close()
-        return
+        return None
 
-    logger.info("SQLite에서 기존 식품코드 조회 시작 (최적화 적용)...")
-    all_excel_food_cds = set(df['식품코드'].astype(str).unique())
-    existing_db_items_dict = {}
-    
-    excel_food_cds_list = list(all_excel_food_cds)
-    chunk_size_for_select = 500 
-    for i in range(0, len(excel_food_cds_list), chunk_size_for_select):
-        food_cd_chunk = excel_food_cds_list[i:i + chunk_size_for_select]
-        if food_cd_chunk:
-            logger.info(f"SQLite에서 식품코드 {len(food_cd_chunk)}건에 대해 기존 데이터 조회 중 (청크 {i//chunk_size_for_select + 1})...")
-            query_result = db.query(FoodNutritionModel).filter(FoodNutritionModel.food_cd.in_(food_cd_chunk)).all()
-            for item in query_result:
-                existing_db_items_dict[item.food_cd] = item
-    logger.info(f"SQLite에서 총 {len(existing_db_items_dict)}개의 기존 식품 정보를 메모리에 로드했습니다.")
+    _report_progress(progress_callback, stage="transforming")
 
-    es_actions = []
-    newly_added_to_sqlite_count = 0
-    already_in_sqlite_count = 0
-    error_in_row_processing_count = 0
+    try:
+        clean_df, transform_report = transform_source_dataframe(df)
+    except KeyError as e:
+        logger.error(f"원본 파일 정제 중 오류 발생: {e}")
+        _report_progress(progress_callback, error=f"원본 파일 정제 중 오류 발생: {e}")
+        db.close()
+        return None
+    _log_transform_report(transform_report)
+    _report_progress(
+        progress_callback,
+        rows_total=transform_report["valid_rows"],
+        rows_skipped=transform_report["missing_required_rows"] + transform_report["duplicate_food_cd_rows"],
+        invalid_numeric=transform_report["invalid_numeric"],
+    )
 
-    logger.info("Excel 데이터 처리 및 SQLite 저장, Elasticsearch 인덱싱 준비 시작...")
-    records = df.to_dict(orient='records')
+    clean_df["content_hash"] = compute_content_hashes(clean_df)
+    ## 정규화 값은 원본 필드에서 파생되므로 내용 해시에는 포함하지 않음 (원본이 바뀌면 함께 갱신됨)
+    clean_df[list(NORMALIZED_NUTRIENT_FIELDS)] = compute_normalized_nutrient_columns(clean_df)
 
-    for row_dict in records:
-        current_food_cd_for_log = str(row_dict.get('식품코드', '알수없음'))
-        try:
-            group_name_parts = []
-            main_group = safe_str_conversion(row_dict.get('식품대분류'))
-            sub_group = safe_str_conversion(row_dict.get('식품상세분류'))
-            if main_group: group_name_parts.append(main_group)
-            if sub_group: group_name_parts.append(sub_group)
-            combined_group_name = " - ".join(group_name_parts) if group_name_parts else None
-
-            ref_name_val = safe_str_conversion(row_dict.get('성분표출처'))
-
-            food_data_to_create = FoodNutritionCreate(
-                food_cd=str(row_dict['식품코드']),
-                food_name=str(row_dict['식품명']),
-                group_name=combined_group_name,
-                research_year=safe_str_conversion(row_dict.get('연도')),
-                maker_name=safe_str_conversion(row_dict.get('지역 / 제조사')),
-                ref_name=ref_name_val,
-                serving_size=safe_float_conversion(row_dict.get('1회제공량'), '1회제공량', current_food_cd_for_log),
-                calorie=safe_float_conversion(row_dict.get('에너지(㎉)'), '에너지(㎉)', current_food_cd_for_log),
-                carbohydrate=safe_float_conversion(row_dict.get('탄수화물(g)'), '탄수화물(g)', current_food_cd_for_log),
-                protein=safe_float_conversion(row_dict.get('단백질(g)'), '단백질(g)', current_food_cd_for_log),
-                province=safe_float_conversion(row_dict.get('지방(g)'), '지방(g)', current_food_cd_for_log),
-                sugars=safe_float_conversion(row_dict.get('총당류(g)'), '총당류(g)', current_food_cd_for_log),
-                salt=safe_float_conversion(row_dict.get('나트륨(㎎)'), '나트륨(㎎)', current_food_cd_for_log),
-                cholesterol=safe_float_conversion(row_dict.get('콜레스테롤(㎎)'), '콜레스테롤(㎎)', current_food_cd_for_log),
-                saturated_fatty_acids=safe_float_conversion(row_dict.get('총 포화 지방산(g)'), '총 포화 지방산(g)', current_food_cd_for_log),
-                trans_fat=safe_float_conversion(row_dict.get('트랜스 지방산(g)'), '트랜스 지방산(g)', current_food_cd_for_log),
-            )
-
-            db_item_for_es = existing_db_items_dict.get(food_data_to_create.food_cd)
-            
-            if db_item_for_es:
-                already_in_sqlite_count += 1
-            else:
-                db_item_for_es = food_nutrition_repository.create_food_nutrition(
-                    db=db, 
-                    food_nutrition=food_data_to_create, 
-                    sync_to_es=False 
+    logger.info("SQLite에서 기존 식품코드 및 내용 해시 조회 시작...")
+    existing_df = _fetch_existing_hashes(db, clean_df["food_cd"].tolist())
+    merged_df = clean_df.merge(existing_df, on="food_cd", how="left")
+    logger.info(f"SQLite에서 총 {len(existing_df)}개의 기존 식품 정보를 조회했습니다.")
+
+    is_new = merged_df["id"].isna()
+    is_changed = ~is_new & merged_df["content_hash"].ne(merged_df["existing_hash"])
+    written_fields = MODEL_FIELDS + list(NORMALIZED_NUTRIENT_FIELDS) + ["content_hash"]
+    new_rows_df = merged_df.loc[is_new, written_fields]
+    changed_rows_df = merged_df.loc[is_changed, ["id"] + written_fields] if mode == LOAD_MODE_UPSERT else merged_df.iloc[0:0]
+
+    summary = {"inserted": 0, "updated": 0, "unchanged": int((~is_new & ~is_changed).sum())}
+    if mode == LOAD_MODE_INSERT:
+        ## insert 모드에서는 기존 행을 변경하지 않으므로 내용이 달라진 행도 그대로 둡니다.
+        summary["unchanged"] += int(is_changed.sum())
+
+    ## 변경이 없는 행은 바로 처리된 것으로 보고, 나머지는 청크를 쓸 때마다 진행 상황을 알림
+    rows_processed = summary["unchanged"]
+    _report_progress(progress_callback, stage="writing_sqlite", rows_processed=rows_processed)
+    try:
+        if not new_rows_df.empty:
+            logger.info(f"SQLite에 {len(new_rows_df)}건 bulk insert 시작...")
+            new_records = _dataframe_to_records(new_rows_df)
+            for i in range(0, len(new_records), INSERT_CHUNK_SIZE):
+                chunk = new_records[i:i + INSERT_CHUNK_SIZE]
+                db.execute(insert(FoodNutritionModel), chunk)
+                ## 변경 피드에도 같은 트랜잭션으로 기록 (새 행의 id는 food_cd로 다시 찾음)
+                record_food_nutrition_changes(
+                    db, CHANGE_OPERATION_UPSERT, FoodNutritionModel.food_cd.in_([record["food_cd"] for record in chunk])
                 )
-                if db_item_for_es:
-                    newly_added_to_sqlite_count += 1
-                    existing_db_items_dict[db_item_for_es.food_cd] = db_item_for_es
-                else:
-                    logger.error(f"FoodCD '{current_food_cd_for_log}': SQLite 저장에 실패했습니다 (Repository에서 None 반환).")
-                    error_in_row_processing_count +=1
-                    continue 
-            
-            if es_client and db_item_for_es:
-                es_document_cleaned = _get_es_doc_from_sqlalchemy_model(db_item_for_es)
-                action = {
-                    "_index": FOOD_NUTRITIONS_INDEX_NAME,
-                    "_id": str(db_item_for_es.id),
-                    "_source": es_document_cleaned
-                }
-                es_actions.append(action)
-
-        except KeyError as e:
-            logger.error(f"Excel 파일의 레코드 처리 중 누락된 필수 컬럼 오류: {e}. FoodCD: {current_food_cd_for_log}. 해당 레코드 건너뜀.")
-            error_in_row_processing_count +=1
-            continue
-        except Exception as e:
-            logger.error(f"Excel 파일의 레코드 처리 중 일반 오류 발생: {e}. FoodCD: {current_food_cd_for_log}, RowData: {row_dict}. 해당 레코드 건너뜀.")
-            error_in_row_processing_count +=1
-            continue
+                rows_processed += len(chunk)
+                _report_progress(progress_callback, rows_processed=rows_processed)
+        if not changed_rows_df.empty:
+            logger.info(f"SQLite에 내용이 변경된 {len(changed_rows_df)}건 bulk update 시작...")
+            changed_records = _dataframe_to_records(changed_rows_df.astype({"id": int}))
+            for i in range(0, len(changed_records), INSERT_CHUNK_SIZE):
+                chunk = changed_records[i:i + INSERT_CHUNK_SIZE]
+                db.execute(update(FoodNutritionModel), chunk)
+                record_food_nutrition_changes(db, CHANGE_OPERATION_UPSERT, FoodNutritionModel.id.in_([record["id"] for record in chunk]))
+                rows_processed += len(chunk)
+                _report_progress(progress_callback, rows_processed=rows_processed)
+        db.commit()
+        summary["inserted"] = len(new_rows_df)
+        summary["updated"] = len(changed_rows_df)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"SQLite 적재 중 오류 발생 (변경사항 롤백): {e}")
+        _report_progress(progress_callback, error=f"SQLite 적재 중 오류 발생 (변경사항 롤백): {e}")
+        db.close()
+        return None
 
-    logger.info(f"Excel 데이터 반복 처리 완료. SQLite에 새로 추가: {newly_added_to_sqlite_count}건, 이미 존재(메모리 확인): {already_in_sqlite_count}건, 처리 중 오류: {error_in_row_processing_count}건.")
+    logger.info(f"SQLite 적재 완료 ({mode} 모드). 추가: {summary['inserted']}건, 수정: {summary['updated']}건, 변경 없음: {summary['unchanged']}건.")
+
+    es_actions = []
+    if es_client:
+        ## upsert 모드에서는 추가/수정된 행만, insert 모드에서는 기존처럼 전체 행을 인덱싱
+        if mode == LOAD_MODE_UPSERT:
+            es_food_cds = new_rows_df["food_cd"].tolist() + changed_rows_df["food_cd"].tolist()
+        else:
+            es_food_cds = clean_df["food_cd"].tolist()
+        es_actions = [
+            {
+                "_index": FOOD_NUTRITIONS_INDEX_NAME,
+                "_id": str(db_item.id),
+                "_source": _get_es_doc_from_sqlalchemy_model(db_item),
+            }
+            for db_item in _fetch_existing_items(db, es_food_cds).values()
+        ]
 
     if es_client and es_actions:
         logger.info(f"Elasticsearch에 {len(es_actions)}건의 문서 bulk 인덱싱 시작...")
+        _report_progress(progress_callback, stage="indexing_es", es_total=len(es_actions), es_indexed=0, es_errors=0)
+        successes, errors = 0, []
         try:
-            successes, errors = bulk(
-                client=es_client,
-                actions=es_actions,
-                raise_on_error=False, 
-                refresh=False,    
-                chunk_size=1000,     
-                request_timeout=60   
-            )
+            ## 청크마다 bulk를 호출해 진행 상황을 알림 (청크 크기는 기존 bulk의 chunk_size와 동일)
+            for i in range(0, len(es_actions), ES_BULK_CHUNK_SIZE):
+                chunk_successes, chunk_errors = bulk(
+                    client=es_client,
+                    actions=es_actions[i:i + ES_BULK_CHUNK_SIZE],
+                    raise_on_error=False, 
+                    refresh=False,    
+                    chunk_size=ES_BULK_CHUNK_SIZE,     
+                    request_timeout=60   
+                )
+                successes += chunk_successes
+                errors.extend(chunk_errors)
+                _report_progress(progress_callback, es_indexed=successes, es_errors=len(errors))
             logger.info(f"Elasticsearch bulk 인덱싱 완료: 성공 {successes}건, 실패 {len(errors)}건.")
             if errors:
                 logger.error(f"Elasticsearch bulk 인덱싱 실패 상세 (최대 5건): {errors[:5]}")
         except Exception as e:
             logger.error(f"Elasticsearch bulk 인덱싱 중 치명적 오류 발생: {e}")
+            _report_progress(progress_callback, error=f"Elasticsearch bulk 인덱싱 중 치명적 오류 발생: {e}")
     elif es_client:
         logger.info("Elasticsearch로 인덱싱할 작업이 없습니다 (es_actions 비어있음).")
     
     db.close()
     logger.info("데이터 로딩 스크립트 실행 완료.")
+    return summary
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="식품영양정보 원본 파일을 SQLite와 Elasticsearch에 적재합니다.")
+    parser.add_argument("--source", default=EXCEL_FILE_PATH, help="원본 파일 경로 (xlsx, xls, csv, parquet)")
+    parser.add_argument(
+        "--mode",
+        choices=[LOAD_MODE_INSERT, LOAD_MODE_UPSERT],
+        default=LOAD_MODE_INSERT,
+        help="insert: 새 식품코드만 추가, upsert: 내용 해시가 달라진 기존 행도 수정",
+    )
+    parser.add_argument("--no-snapshot", action="store_true", help="Excel 스냅샷 캐시를 사용하지 않고 항상 원본을 파싱")
+    args = parser.parse_args()
+
     logger.info("데이터 로딩 프로세스를 시작합니다...")
-    load_excel_to_db_and_es()
\ No newline at end of file
+    load_excel_to_db_and_es(source_path=args.source, use_snapshot=not args.no_snapshot, mode=args.mode)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+
+def test_livez(client: TestClient):
+    response = client.get("/livez")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"status": "ok"}
+
+
+def test_readyz_reports_dependencies_without_waiting_for_es(client: TestClient):
+    response = client.get("/readyz")
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["dependencies"]["sqlite"]["ready"] is True
+    assert "ready" in data["dependencies"]["elasticsearch"]
+
+
+def test_readyz_requires_es_when_configured(client: TestClient):
+    with patch("app.main.settings.READINESS_REQUIRES_ES", True), \
+         patch("app.main.get_es_bootstrap_status", return_value={"ready": False, "attempts": 1, "last_error": "down"}):
+        response = client.get("/readyz")
+    assert response.status_code == 503, response.text
+    assert response.json()["dependencies"]["elasticsearch"]["ready"] is False
+
+
+def test_debug_traces_returns_request_breakdown(client: TestClient, monkeypatch):
+    from app.core.config import settings
+    from app.core.tracing import trace_ring_buffer
+    from app.db.sql_tracing import install_sql_tracing
+    from tests.conftest import engine_test
+
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACING_DEBUG_ENDPOINT_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 1.0)
+    install_sql_tracing(engine_test)
+    trace_ring_buffer.clear()
+
+    response = client.get("/api/v1/food-nutritions/1")
+    assert response.status_code == 404
+    trace_id = response.headers["x-trace-id"]
+
+    traces = client.get("/debug/traces").json()["traces"]
+    assert [trace["trace_id"] for trace in traces] == [trace_id]
+    trace = client.get(f"/debug/traces/{trace_id}").json()
+    assert trace["name"] == "GET /api/v1/food-nutritions/{food_nutrition_id}"
+    assert trace["spans"][0]["attributes"]["status_code"] == 404
+    kinds = {span["kind"] for span in trace["spans"]}
+    assert {"http", "repository", "sql"} <= kinds
+    assert client.get("/debug/traces/unknown").status_code == 404
+
+def test_debug_traces_is_disabled_by_default(client: TestClient):
+    from app.core.config import Settings
+
+    defaults = Settings()
+    assert defaults.TRACING_ENABLED is False
+    assert defaults.TRACING_DEBUG_ENDPOINT_ENABLED is False
+    assert client.get("/debug/traces").status_code == 404
@@ -1,6 +1,10 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
+from unittest.mock import patch, MagicMock
 
+from app.main import app
+from app.api.v1.endpoints.food_nutritions import get_ready_es_client, get_optional_es_client
+from app.search import ESOverloadedError
 from app.schemas.food_nutrition import FoodNutrition, FoodNutritionCreate, FoodNutritionUpdate
 
 API_V1_STR = "/api/v1/food-nutritions"
@@ -199,4 +203,345 @@ def test_search_food_nutrition_no_params(client: TestClient):
     response = client.get(f"{API_V1_STR}/search/")
     assert response.status_code == 200, response.text
     data = response.json()
-    assert isinstance(data, list)
\ No newline at end of file
+    assert isinstance(data, list)
+def test_search_food_nutrition_overloaded_returns_503_with_retry_after(client: TestClient):
+    app.dependency_overrides[get_optional_es_client] = lambda: MagicMock()
+    with patch(
+        "app.api.v1.endpoints.food_nutritions.search_food_nutritions_page_in_es",
+        side_effect=ESOverloadedError("대기열 초과", retry_after=2)
+    ):
+        response = client.get(f"{API_V1_STR}/search/", params={"food_name": "김치"})
+    assert response.status_code == 503, response.text
+    assert response.headers["Retry-After"] == "2"
+
+    metrics = client.get("/metrics").json()
+    assert "queue_depth" in metrics["es_admission"]
+
+def test_search_food_nutrition_profile_returns_took_and_profile(client: TestClient):
+    app.dependency_overrides[get_optional_es_client] = lambda: MagicMock()
+    profiled = {
+        "results": [{"id": 1, "food_cd": "P001", "food_name": "프로파일 식품"}],
+        "took": 7,
+        "profile": {"shards": []},
+    }
+    with patch(
+        "app.api.v1.endpoints.food_nutritions.profile_food_nutritions_search_in_es",
+        return_value=profiled
+    ) as mock_profile:
+        response = client.get(f"{API_V1_STR}/search/", params={"food_name": "식품", "profile": "true"})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["took"] == 7
+    assert data["profile"] == {"shards": []}
+    assert data["results"][0]["food_cd"] == "P001"
+    mock_profile.assert_called_once()
+
+def test_read_food_nutritions_with_fields(client: TestClient):
+    response_create = client.post(
+        f"{API_V1_STR}",
+        json={"food_cd": "API_FIELDS001", "food_name": "필드 선택 식품", "calorie": 88.0, "protein": 3.0}
+    )
+    assert response_create.status_code == 201
+    food_nutrition_id = response_create.json()["id"]
+
+    response_list = client.get(f"{API_V1_STR}", params={"fields": "id,food_name,calorie"})
+    assert response_list.status_code == 200, response_list.text
+    assert response_list.json() == [{"id": food_nutrition_id, "food_name": "필드 선택 식품", "calorie": 88.0}]
+
+    response_single = client.get(f"{API_V1_STR}/{food_nutrition_id}", params={"fields": "food_cd,protein"})
+    assert response_single.status_code == 200, response_single.text
+    assert response_single.json() == {"food_cd": "API_FIELDS001", "protein": 3.0}
+
+    response_not_found = client.get(f"{API_V1_STR}/99999", params={"fields": "id"})
+    assert response_not_found.status_code == 404, response_not_found.text
+
+    response_unknown = client.get(f"{API_V1_STR}", params={"fields": "id,unknown_field"})
+    assert response_unknown.status_code == 400, response_unknown.text
+
+def test_search_food_nutrition_with_fields_pushes_down_source(client: TestClient):
+    mock_es = MagicMock()
+    mock_es.search.return_value = {"hits": {"hits": [{"_source": {"id": 1, "food_name": "김치찌개"}}]}}
+    app.dependency_overrides[get_optional_es_client] = lambda: mock_es
+
+    response = client.get(f"{API_V1_STR}/search/", params={"food_name": "김치", "fields": "id,food_name"})
+    assert response.status_code == 200, response.text
+    assert response.json() == [{"id": 1, "food_name": "김치찌개"}]
+
+    _, kwargs = mock_es.search.call_args
+    assert kwargs["body"]["_source"] == ["id", "food_name"]
+    assert kwargs["filter_path"] == ["hits.hits._source"]
+
+def test_batch_search_food_nutritions_uses_single_msearch(client: TestClient):
+    mock_es = MagicMock()
+    mock_es.msearch.return_value = {
+        "responses": [
+            {"hits": {"hits": [{"_source": {"id": 1, "food_cd": "B001", "food_name": "김치"}}]}},
+            {"error": {"type": "query_shard_exception", "reason": "잘못된 쿼리"}, "status": 400},
+        ]
+    }
+    app.dependency_overrides[get_ready_es_client] = lambda: mock_es
+
+    response = client.post(
+        f"{API_V1_STR}/search/batch",
+        json=[{"food_name": "김치"}, {"research_year": "2020", "limit": 5}],
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data[0]["results"][0]["food_cd"] == "B001"
+    assert data[0]["error"] is None
+    assert data[1] == {"results": [], "total": None, "total_relation": None, "error": "잘못된 쿼리"}
+
+    mock_es.msearch.assert_called_once()
+    msearch_body = mock_es.msearch.call_args.kwargs["body"]
+    assert len(msearch_body) == 4
+    assert msearch_body[3]["size"] == 5
+
+def test_batch_search_supports_get_search_parameters(client: TestClient):
+    mock_es = MagicMock()
+    mock_es.msearch.return_value = {
+        "responses": [
+            {"hits": {"total": {"value": 12, "relation": "eq"}, "hits": [{"_source": {"food_cd": "B001"}}]}},
+            {"hits": {"hits": [{"_source": {"id": 2, "food_cd": "B002", "food_name": "두부"}}]}},
+        ]
+    }
+    app.dependency_overrides[get_ready_es_client] = lambda: mock_es
+
+    response = client.post(
+        f"{API_V1_STR}/search/batch",
+        json=[
+            {"food_name": "김치", "fields": "food_cd", "track_total_hits": "exact", "sort": "-salt_per_100g", "range": ["salt_per_100g::120"]},
+            {"food_name": "두부"},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data[0] == {"results": [{"food_cd": "B001"}], "total": 12, "total_relation": "eq", "error": None}
+    assert data[1]["results"][0]["food_cd"] == "B002" and data[1]["total"] is None
+
+    first_query = mock_es.msearch.call_args.kwargs["body"][1]
+    assert first_query["_source"] == ["food_cd"]
+    assert first_query["track_total_hits"] is True
+    assert first_query["sort"][0] == {"salt_per_100g": {"order": "desc"}}
+    assert {"range": {"salt_per_100g": {"lte": 120.0}}} in first_query["query"]["bool"]["filter"]
+
+    ## 지원하지 않거나 잘못된 조건은 조용히 무시하지 않고 422
+    assert client.post(f"{API_V1_STR}/search/batch", json=[{"food_name": "김치", "order_by": "salt"}]).status_code == 422
+    assert client.post(f"{API_V1_STR}/search/batch", json=[{"food_name": "김치", "sort": "salt"}]).status_code == 422
+    assert client.post(f"{API_V1_STR}/search/batch", json=[{"food_name": "김치", "fields": "unknown"}]).status_code == 422
+
+def test_search_food_nutrition_track_total_hits_sets_total_headers(client: TestClient):
+    mock_es = MagicMock()
+    mock_es.search.return_value = {
+        "hits": {"total": {"value": 10000, "relation": "gte"}, "hits": [{"_source": {"id": 1, "food_cd": "T001", "food_name": "김치"}}]}
+    }
+    app.dependency_overrides[get_optional_es_client] = lambda: mock_es
+
+    response = client.get(f"{API_V1_STR}/search/", params={"food_name": "김치", "track_total_hits": "capped"})
+    assert response.status_code == 200, response.text
+    assert response.headers["X-Total-Count"] == "10000"
+    assert response.headers["X-Total-Count-Relation"] == "gte"
+    assert mock_es.search.call_args.kwargs["body"]["track_total_hits"] == 10000
+
+    response_off = client.get(f"{API_V1_STR}/search/", params={"food_name": "김치찌개"})
+    assert "X-Total-Count" not in response_off.headers
+    assert mock_es.search.call_args.kwargs["body"]["track_total_hits"] is False
+
+def test_search_count_uses_es_count(client: TestClient):
+    mock_es = MagicMock()
+    mock_es.count.return_value = {"count": 42}
+    app.dependency_overrides[get_ready_es_client] = lambda: mock_es
+
+    response = client.get(f"{API_V1_STR}/search/count", params={"research_year": "2020"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"count": 42}
+    assert mock_es.count.call_args.kwargs["body"] == {"query": {"bool": {"must": [{"term": {"research_year": "2020"}}]}}}
+
+def test_count_food_nutritions_with_filters(client: TestClient):
+    client.post(f"{API_V1_STR}", json={"food_cd": "API_COUNT001", "food_name": "건수1", "research_year": "2020"})
+    client.post(f"{API_V1_STR}", json={"food_cd": "API_COUNT002", "food_name": "건수2", "research_year": "2020"})
+    client.post(f"{API_V1_STR}", json={"food_cd": "API_COUNT003", "food_name": "건수3", "research_year": "2021"})
+
+    assert client.get(f"{API_V1_STR}/count").json() == {"count": 3}
+    assert client.get(f"{API_V1_STR}/count", params={"research_year": "2020"}).json() == {"count": 2}
+
+    response_list = client.get(f"{API_V1_STR}", params={"research_year": "2021"})
+    assert [item["food_cd"] for item in response_list.json()] == ["API_COUNT003"]
+
+def test_search_exact_match_is_routed_to_sqlite_without_es(client: TestClient):
+    client.post(f"{API_V1_STR}", json={"food_cd": "ROUTE001", "food_name": "라우팅1", "research_year": "2020"})
+    client.post(f"{API_V1_STR}", json={"food_cd": "ROUTE002", "food_name": "라우팅2", "research_year": "2021"})
+    app.dependency_overrides[get_optional_es_client] = lambda: None
+
+    response = client.get(f"{API_V1_STR}/search/", params={"food_code": "ROUTE002", "track_total_hits": "exact"})
+    assert response.status_code == 200, response.text
+    assert response.headers["X-Search-Backend"] == "sqlite"
+    assert response.headers["X-Total-Count"] == "1"
+    assert [item["food_cd"] for item in response.json()] == ["ROUTE002"]
+
+    response_fields = client.get(f"{API_V1_STR}/search/", params={"research_year": "2020", "fields": "food_cd"})
+    assert response_fields.headers["X-Search-Backend"] == "sqlite"
+    assert response_fields.json() == [{"food_cd": "ROUTE001"}]
+
+    response_text = client.get(f"{API_V1_STR}/search/", params={"food_name": "라우팅", "research_year": "2020"})
+    assert response_text.status_code == 503
+
+    metrics = client.get("/metrics").json()
+    assert metrics["search_router"]["sqlite_total"] >= 2
+
+def test_search_full_text_is_routed_to_es(client: TestClient):
+    mock_es = MagicMock()
+    mock_es.search.return_value = {"hits": {"hits": [{"_source": {"id": 1, "food_cd": "T001", "food_name": "김치"}}]}}
+    app.dependency_overrides[get_optional_es_client] = lambda: mock_es
+
+    response = client.get(f"{API_V1_STR}/search/", params={"food_name": "김치", "research_year": "2020"})
+    assert response.status_code == 200, response.text
+    assert response.headers["X-Search-Backend"] == "elasticsearch"
+    assert mock_es.search.called
+
+def test_calculate_meal_nutritions(client: TestClient):
+    created = client.post(f"{API_V1_STR}", json={"food_cd": "CALC001", "food_name": "계산1", "serving_size": 100.0, "calorie": 200.0, "salt": -1.0}).json()
+    client.post(f"{API_V1_STR}", json={"food_cd": "CALC002", "food_name": "계산2", "serving_size": 200.0, "calorie": 100.0, "salt": 40.0})
+
+    response = client.post(f"{API_V1_STR}/calculate", json={"meals": [
+        {"name": "아침", "items": [{"id": created["id"], "grams": 50}, {"food_cd": "CALC002", "grams": 400}]},
+        {"name": "저녁", "items": [{"food_cd": "CALC001", "grams": 200}]},
+    ]})
+    assert response.status_code == 200, response.text
+    breakfast, dinner = response.json()["meals"]
+    assert [item["nutrients"]["calorie"] for item in breakfast["items"]] == [100.0, 200.0]
+    assert breakfast["total"]["calorie"] == 300.0
+    assert breakfast["total"]["salt"] == 80.0
+    assert breakfast["less_than_1g"] == ["salt"]
+    assert dinner["total"]["calorie"] == 400.0
+
+    response_missing = client.post(f"{API_V1_STR}/calculate", json={"meals": [{"items": [{"food_cd": "NOPE", "grams": 10}]}]})
+    assert response_missing.status_code == 404
+
+    response_invalid = client.post(f"{API_V1_STR}/calculate", json={"meals": [{"items": [{"id": 1, "food_cd": "CALC001", "grams": 10}]}]})
+    assert response_invalid.status_code == 422
+
+@patch('app.repositories.food_nutrition_repository.is_es_ready', new=lambda: True)
+@patch('app.repositories.food_nutrition_repository.get_es_client')
+def test_bulk_update_and_delete_by_filter(mock_get_es_client: MagicMock, client: TestClient):
+    mock_es = MagicMock()
+    mock_es.update_by_query.return_value = {"updated": 2, "failures": []}
+    mock_es.delete_by_query.return_value = {"deleted": 1, "failures": []}
+    mock_get_es_client.return_value = mock_es
+    client.post(f"{API_V1_STR}", json={"food_cd": "BULK001", "food_name": "일괄1", "ref_name": "옛출처"})
+    client.post(f"{API_V1_STR}", json={"food_cd": "BULK002", "food_name": "일괄2", "ref_name": "옛출처"})
+    client.post(f"{API_V1_STR}", json={"food_cd": "BULK003", "food_name": "일괄3", "ref_name": "다른출처"})
+
+    response = client.patch(f"{API_V1_STR}/", params={"ref_name": "옛출처"}, json={"ref_name": "새출처"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"affected": 2, "es_affected": 2, "es_synced": True, "es_error": None}
+    assert client.get(f"{API_V1_STR}/count", params={"food_code": "BULK001"}).json() == {"count": 1}
+    assert {item["ref_name"] for item in client.get(f"{API_V1_STR}/").json()} == {"새출처", "다른출처"}
+
+    assert client.patch(f"{API_V1_STR}/", json={"ref_name": "새출처"}).status_code == 400
+    assert client.patch(f"{API_V1_STR}/", params={"ref_name": "새출처"}, json={}).status_code == 400
+    assert client.patch(f"{API_V1_STR}/", params={"ref_name": "새출처"}, json={"food_name": "x"}).status_code == 422
+    assert client.delete(f"{API_V1_STR}/").status_code == 400
+
+    response_delete = client.delete(f"{API_V1_STR}/", params={"ref_name": "다른출처"})
+    assert response_delete.status_code == 200, response_delete.text
+    assert response_delete.json()["affected"] == 1
+    assert [item["food_cd"] for item in client.get(f"{API_V1_STR}/").json()] == ["BULK001", "BULK002"]
+
+def test_upsert_food_nutrition_by_food_code(client: TestClient):
+    response_create = client.put(f"{API_V1_STR}/by-code/UPSERT_API001", json={"food_name": "업서트", "calorie": 50.0})
+    assert response_create.status_code == 200, response_create.text
+    created = response_create.json()
+    assert created["food_cd"] == "UPSERT_API001"
+    assert created["calorie"] == 50.0
+
+    response_update = client.put(f"{API_V1_STR}/by-code/UPSERT_API001", json={"food_name": "업서트 교체", "protein": 3.0})
+    assert response_update.status_code == 200, response_update.text
+    updated = response_update.json()
+    assert updated["id"] == created["id"]
+    assert updated["food_name"] == "업서트 교체"
+    assert updated["calorie"] is None
+    assert updated["protein"] == 3.0
+
+    assert client.put(f"{API_V1_STR}/by-code/UPSERT_API001", json={"calorie": 1.0}).status_code == 422
+
+def test_update_food_nutrition_rejects_duplicate_food_code(client: TestClient):
+    client.post(f"{API_V1_STR}", json={"food_cd": "DUP_API001", "food_name": "중복1"})
+    second = client.post(f"{API_V1_STR}", json={"food_cd": "DUP_API002", "food_name": "중복2"}).json()
+
+    response = client.put(f"{API_V1_STR}/{second['id']}", json={"food_cd": "DUP_API001"})
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "FoodNutrition with food_cd 'DUP_API001' already exists."
+
+def test_read_food_nutrition_changes(client: TestClient):
+    created = client.post(f"{API_V1_STR}", json={"food_cd": "FEED001", "food_name": "피드1"}).json()
+    client.post(f"{API_V1_STR}", json={"food_cd": "FEED002", "food_name": "피드2"})
+    client.put(f"{API_V1_STR}/{created['id']}", json={"calorie": 12.0})
+
+    response = client.get(f"{API_V1_STR}/changes", params={"since": 0, "limit": 2})
+    assert response.status_code == 200, response.text
+    first_page = response.json()
+    assert [change["food_cd"] for change in first_page["changes"]] == ["FEED001", "FEED002"]
+    assert first_page["has_more"] is True
+    assert first_page["changes"][0]["data"]["calorie"] == 12.0
+
+    client.delete(f"{API_V1_STR}/{created['id']}")
+    second_page = client.get(f"{API_V1_STR}/changes", params={"since": first_page["next_since"]}).json()
+    assert [(change["operation"], change["food_cd"]) for change in second_page["changes"]] == [("delete", "FEED001")]
+    assert second_page["changes"][0]["data"] is None
+    assert second_page["has_more"] is False
+
+    assert client.get(f"{API_V1_STR}/changes", params={"since": -1}).status_code == 422
+
+def test_request_deadline_from_header_returns_504(client: TestClient):
+    from app.db.sql_deadline import install_sql_deadline
+    from tests.conftest import engine_test
+
+    install_sql_deadline(engine_test)
+    response = client.get(f"{API_V1_STR}/", headers={"X-Request-Timeout": "0.000001"})
+    assert response.status_code == 504
+    assert client.get(f"{API_V1_STR}/", headers={"X-Request-Timeout": "5"}).status_code == 200
+
+def test_list_and_search_sort_and_filter_by_normalized_nutrients(client: TestClient):
+    for food_cd, serving_size, salt in [("NORM_API1", 100.0, 300.0), ("NORM_API2", 50.0, 100.0), ("NORM_API3", 200.0, 100.0), ("NORM_API4", None, 10.0)]:
+        client.post(f"{API_V1_STR}", json={"food_cd": food_cd, "food_name": food_cd, "research_year": "2024", "serving_size": serving_size, "salt": salt})
+    app.dependency_overrides[get_optional_es_client] = lambda: None
+
+    response = client.get(f"{API_V1_STR}/", params={"sort": "salt_per_100g", "fields": "food_cd,salt_per_100g"})
+    assert response.status_code == 200, response.text
+    assert response.json() == [
+        {"food_cd": "NORM_API3", "salt_per_100g": 50.0},
+        {"food_cd": "NORM_API2", "salt_per_100g": 200.0},
+        {"food_cd": "NORM_API1", "salt_per_100g": 300.0},
+    ]
+
+    response_range = client.get(f"{API_V1_STR}/", params=[("range", "salt_per_100g:100:"), ("range", "salt_per_100g::250"), ("fields", "food_cd")])
+    assert response_range.json() == [{"food_cd": "NORM_API2"}]
+    assert client.get(f"{API_V1_STR}/count", params={"range": "salt_per_100g:100:"}).json() == {"count": 2}
+
+    response_search = client.get(
+        f"{API_V1_STR}/search/",
+        params={"research_year": "2024", "sort": "-salt_per_100g", "track_total_hits": "exact", "fields": "food_cd"}
+    )
+    assert response_search.headers["X-Search-Backend"] == "sqlite"
+    assert response_search.headers["X-Total-Count"] == "3"
+    assert [item["food_cd"] for item in response_search.json()] == ["NORM_API1", "NORM_API2", "NORM_API3"]
+
+    assert client.get(f"{API_V1_STR}/", params={"sort": "salt"}).status_code == 400
+    assert client.get(f"{API_V1_STR}/", params={"range": "salt_per_100g:abc:"}).status_code == 400
+    assert client.get(f"{API_V1_STR}/", params={"range": "salt_per_100g::"}).status_code == 400
+
+def test_search_sort_and_range_are_pushed_down_to_es(client: TestClient):
+    mock_es = MagicMock()
+    mock_es.search.return_value = {"hits": {"hits": []}}
+    app.dependency_overrides[get_optional_es_client] = lambda: mock_es
+
+    response = client.get(
+        f"{API_V1_STR}/search/", params={"food_name": "김치", "sort": "-protein_per_100kcal", "range": "salt_per_100g::120"}
+    )
+    assert response.status_code == 200, response.text
+    body = mock_es.search.call_args.kwargs["body"]
+    assert body["sort"] == [{"protein_per_100kcal": {"order": "desc"}}, {"id": {"order": "desc"}}]
+    assert body["query"]["bool"]["filter"] == [
+        {"range": {"salt_per_100g": {"lte": 120.0}}},
+        {"exists": {"field": "protein_per_100kcal"}},
+    ]
@@ -0,0 +1,98 @@
+import os
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from app.core.config import settings
+from app.imports import jobs, run_import_job, get_import_job_status
+
+API_V1_STR = "/api/v1/imports"
+
+def test_create_import_job_spools_upload_and_reports_status(client: TestClient, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_SPOOL_DIR", str(tmp_path))
+
+    with patch("app.api.v1.endpoints.imports.submit_import_job") as mock_submit:
+        response = client.post(
+            f"{API_V1_STR}/",
+            files={"file": ("foods.csv", b"a,b\n1,2\n", "text/csv")},
+            data={"mode": "upsert"},
+        )
+
+    assert response.status_code == 202, response.text
+    data = response.json()
+    assert data["status"] == "queued"
+    assert data["mode"] == "upsert"
+    assert data["file_size"] == 8
+    assert "source_path" not in data
+    mock_submit.assert_called_once_with(data["job_id"])
+    assert (tmp_path / data["job_id"] / "source.csv").read_bytes() == b"a,b\n1,2\n"
+
+    response_status = client.get(f"{API_V1_STR}/{data['job_id']}")
+    assert response_status.status_code == 200
+    assert response_status.json()["job_id"] == data["job_id"]
+
+def test_create_import_job_rejects_unsupported_extension(client: TestClient, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_SPOOL_DIR", str(tmp_path))
+
+    with patch("app.api.v1.endpoints.imports.submit_import_job") as mock_submit:
+        response = client.post(f"{API_V1_STR}/", files={"file": ("foods.txt", b"x", "text/plain")})
+
+    assert response.status_code == 400
+    mock_submit.assert_not_called()
+    assert list(tmp_path.iterdir()) == []
+
+def test_create_import_job_rejects_too_large_upload(client: TestClient, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_SPOOL_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "IMPORT_MAX_UPLOAD_BYTES", 4)
+
+    with patch("app.api.v1.endpoints.imports.submit_import_job"):
+        response = client.post(f"{API_V1_STR}/", files={"file": ("foods.csv", b"a,b\n1,2\n", "text/csv")})
+
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+def test_read_import_job_not_found(client: TestClient, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_SPOOL_DIR", str(tmp_path))
+    assert client.get(f"{API_V1_STR}/0123abcd").status_code == 404
+    assert client.get(f"{API_V1_STR}/..").status_code == 404
+
+def test_run_import_job_records_progress_and_summary(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_SPOOL_DIR", str(tmp_path))
+    with open(tmp_path / "upload.csv", "wb") as f:
+        f.write(b"a\n")
+    with open(tmp_path / "upload.csv", "rb") as source:
+        job = jobs.spool_upload("upload.csv", source, "insert")
+
+    def fake_loader(source_path, use_snapshot, mode, progress_callback):
+        progress_callback({"stage": "writing_sqlite", "rows_total": 10, "rows_processed": 0})
+        progress_callback({"rows_processed": 10})
+        progress_callback({"stage": "indexing_es", "es_total": 10, "es_indexed": 8, "es_errors": 2, "error": "ES 색인 오류 2건"})
+        return {"inserted": 10, "updated": 0, "unchanged": 0}
+
+    with patch("scripts.load_data.load_excel_to_db_and_es", side_effect=fake_loader):
+        summary = run_import_job(job["job_id"])
+
+    assert summary == {"inserted": 10, "updated": 0, "unchanged": 0}
+    status = get_import_job_status(job["job_id"])
+    assert status["status"] == "completed"
+    assert status["rows_processed"] == 10
+    assert status["es_indexed"] == 8
+    assert status["errors"] == ["ES 색인 오류 2건"]
+    assert status["eta_seconds"] is None
+    assert status["elapsed_seconds"] is not None
+    ## 끝난 작업은 상태 파일만 남고 업로드 원본은 삭제됨
+    assert os.listdir(tmp_path / job["job_id"]) == ["status.json"]
+
+def test_run_import_job_marks_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_SPOOL_DIR", str(tmp_path))
+    with open(tmp_path / "upload.csv", "wb") as f:
+        f.write(b"a\n")
+    with open(tmp_path / "upload.csv", "rb") as source:
+        job = jobs.spool_upload("upload.csv", source, "insert")
+
+    with patch("scripts.load_data.load_excel_to_db_and_es", side_effect=RuntimeError("broken file")):
+        assert run_import_job(job["job_id"]) is None
+
+    status = get_import_job_status(job["job_id"])
+    assert status["status"] == "failed"
+    assert "broken file" in status["errors"][0]
+    assert not os.path.exists(job["source_path"])
@@ -0,0 +1,66 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import snapshot_food_nutritions
+from app.core.config import settings
+from app.main import app as main_app
+from app.models.food_nutrition import FoodNutrition as FoodNutritionModel
+from app.snapshot import close_read_snapshot
+from scripts.build_read_snapshot import build_read_snapshot
+
+API_V1_STR = "/api/v1/food-nutritions"
+
+@pytest.fixture
+def snapshot_client(db_session_for_api_test, tmp_path, monkeypatch):
+    db = db_session_for_api_test
+    db.add_all([
+        FoodNutritionModel(food_cd="SNAP001", food_name="김치찌개", research_year="2023", maker_name="서울", calorie=120.5),
+        FoodNutritionModel(food_cd="SNAP002", food_name="된장찌개", research_year="2023", maker_name="부산"),
+        FoodNutritionModel(food_cd="SNAP003", food_name="김치볶음밥", research_year="2022", maker_name="서울"),
+    ])
+    db.commit()
+    snapshot_path = tmp_path / "foods.fnsnap"
+    header = build_read_snapshot(db, str(snapshot_path))
+    assert header["row_count"] == 3
+
+    monkeypatch.setattr(settings, "READ_SNAPSHOT_PATH", str(snapshot_path))
+    snapshot_app = FastAPI()
+    snapshot_app.include_router(snapshot_food_nutritions.router, prefix=API_V1_STR)
+    with TestClient(snapshot_app) as test_client:
+        yield test_client
+    close_read_snapshot()
+
+def test_snapshot_read_endpoints(snapshot_client: TestClient):
+    response = snapshot_client.get(f"{API_V1_STR}/1")
+    assert response.status_code == 200
+    assert response.json()["food_cd"] == "SNAP001"
+    assert response.json()["calorie"] == 120.5
+    assert response.json()["protein"] is None
+
+    assert snapshot_client.get(f"{API_V1_STR}/99").status_code == 404
+    assert snapshot_client.get(f"{API_V1_STR}/2", params={"fields": "id,food_name"}).json() == {"id": 2, "food_name": "된장찌개"}
+
+    listed = snapshot_client.get(f"{API_V1_STR}/", params={"maker_name": "서울"}).json()
+    assert [item["food_cd"] for item in listed] == ["SNAP001", "SNAP003"]
+    assert snapshot_client.get(f"{API_V1_STR}/count", params={"research_year": "2023"}).json() == {"count": 2}
+
+def test_snapshot_search(snapshot_client: TestClient):
+    response = snapshot_client.get(f"{API_V1_STR}/search/", params={"food_name": "김치", "limit": 1, "fields": "food_cd"})
+    assert response.status_code == 200
+    assert response.headers["X-Search-Backend"] == "snapshot"
+    assert response.headers["X-Total-Count"] == "2"
+    assert response.json() == [{"food_cd": "SNAP001"}]
+
+    response_filtered = snapshot_client.get(f"{API_V1_STR}/search/", params={"food_name": "김치", "research_year": "2022"})
+    assert [item["food_cd"] for item in response_filtered.json()] == ["SNAP003"]
+
+def test_snapshot_mode_has_no_write_endpoints(snapshot_client: TestClient):
+    assert snapshot_client.post(f"{API_V1_STR}/", json={"food_cd": "X", "food_name": "X"}).status_code == 405
+    assert snapshot_client.delete(f"{API_V1_STR}/1").status_code == 405
+
+def test_readyz_reports_snapshot_in_snapshot_mode(snapshot_client: TestClient):
+    with TestClient(main_app) as client:
+        response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json()["dependencies"]["read_snapshot"]["row_count"] == 3
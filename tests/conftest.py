@@ -5,7 +5,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.db.session import Base, get_db
+from app.db.session import Base, get_db, get_read_db
 
 SQLALCHEMY_DATABASE_URL_TEST = "sqlite:///:memory:"
 
@@ -33,6 +33,7 @@ def db_session_for_api_test():
 @pytest.fixture(scope="function")
 def client(db_session_for_api_test):
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from app.core import deadline
+from app.core.config import settings
+
+
+def test_resolve_request_budget_uses_longest_prefix_and_header(monkeypatch):
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_DEFAULT_SECONDS", 10.0)
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_ROUTE_SECONDS", {"/api": 8.0, "/api/search": 3.0, "/livez": 0.0})
+
+    assert deadline.resolve_request_budget("/other") == 10.0
+    assert deadline.resolve_request_budget("/api/items") == 8.0
+    assert deadline.resolve_request_budget("/api/search/") == 3.0
+    assert deadline.resolve_request_budget("/livez") is None
+    ## 헤더는 예산을 줄이기만 하고, 잘못된 값은 무시
+    assert deadline.resolve_request_budget("/api/search/", "1.5") == 1.5
+    assert deadline.resolve_request_budget("/api/search/", "60") == 3.0
+    assert deadline.resolve_request_budget("/api/search/", "abc") == 3.0
+
+
+def test_resolve_request_budget_supports_method_specific_routes(monkeypatch):
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_DEFAULT_SECONDS", 10.0)
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_ROUTE_SECONDS", {"/api/items/": 8.0, "PATCH /api/items/": 0.0})
+
+    assert deadline.resolve_request_budget("/api/items/", method="GET") == 8.0
+    assert deadline.resolve_request_budget("/api/items/", method="PATCH") is None
+    assert deadline.resolve_request_budget("/api/items/", "1.0", method="patch") is None
+    assert deadline.resolve_request_budget("/api/items/") == 8.0
+    ## 기본 설정: 일괄 수정/삭제는 ES by-query 완료까지 기다리도록 deadline 없음, 목록 조회는 기본 예산
+    monkeypatch.undo()
+    assert deadline.resolve_request_budget("/api/v1/food-nutritions/", method="PATCH") is None
+    assert deadline.resolve_request_budget("/api/v1/food-nutritions/", method="DELETE") is None
+    assert deadline.resolve_request_budget("/api/v1/food-nutritions/", method="GET") == settings.REQUEST_DEADLINE_DEFAULT_SECONDS
+    ## 단건 삭제는 일괄 삭제 경로의 접두사지만 정확히 일치하지 않으므로 기본 예산 유지
+    assert deadline.resolve_request_budget("/api/v1/food-nutritions/123", method="DELETE") == settings.REQUEST_DEADLINE_DEFAULT_SECONDS
+
+
+def test_resolve_request_budget_exact_routes_do_not_match_sub_paths(monkeypatch):
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_DEFAULT_SECONDS", 10.0)
+    monkeypatch.setattr(settings, "REQUEST_DEADLINE_ROUTE_SECONDS", {"/api/items/": 8.0, "/api/items/$": 2.0, "DELETE /api/items/$": 0.0})
+
+    assert deadline.resolve_request_budget("/api/items/", method="GET") == 2.0
+    assert deadline.resolve_request_budget("/api/items/", method="DELETE") is None
+    assert deadline.resolve_request_budget("/api/items/7", method="DELETE") == 8.0
+    assert deadline.resolve_request_budget("/api/items", method="DELETE") == 10.0
+
+
+def test_deadline_scope_keeps_shorter_outer_deadline():
+    assert deadline.remaining_time() is None
+    with deadline.deadline_scope(0.5):
+        outer_remaining = deadline.remaining_time()
+        with deadline.deadline_scope(30):
+            assert deadline.remaining_time() <= outer_remaining
+        with deadline.deadline_scope(None):
+            assert deadline.remaining_time() is not None
+    assert deadline.remaining_time() is None
+
+
+def test_check_deadline_raises_after_budget_is_spent():
+    with deadline.deadline_scope(0.01):
+        deadline.check_deadline()
+        time.sleep(0.02)
+        assert deadline.deadline_expired()
+        with pytest.raises(deadline.DeadlineExceededError):
+            deadline.check_deadline()
@@ -0,0 +1,64 @@
+import pytest
+
+from app.core.nutrition_calculator import (
+    NUTRIENT_FIELDS,
+    NORMALIZED_NUTRIENT_FIELDS,
+    NutritionCalculationError,
+    calculate_meals,
+    compute_normalized_nutrients
+)
+
+
+def _food(id, food_cd, serving_size, **nutrients):
+    return {"id": id, "food_cd": food_cd, "food_name": f"식품{id}", "serving_size": serving_size,
+            **{field: nutrients.get(field) for field in NUTRIENT_FIELDS}}
+
+
+def test_calculate_meals_scales_by_serving_size_and_sums_per_meal():
+    foods = [
+        _food(1, "A", 100.0, calorie=200.0, protein=10.0, sugars=-1.0),
+        _food(2, "B", 50.0, calorie=100.0, protein=None, sugars=2.0),
+    ]
+    meals = [
+        {"name": "아침", "items": [{"food_index": 0, "grams": 150.0}, {"food_index": 1, "grams": 25.0}]},
+        {"name": "점심", "items": [{"food_index": 1, "grams": 100.0}]},
+    ]
+
+    breakfast, lunch = calculate_meals(foods, meals)
+
+    assert breakfast["items"][0]["nutrients"]["calorie"] == 300.0
+    assert breakfast["items"][0]["nutrients"]["sugars"] == 0.0
+    assert breakfast["items"][0]["less_than_1g"] == ["sugars"]
+    assert breakfast["items"][1]["nutrients"]["protein"] is None
+    assert breakfast["total"]["calorie"] == 350.0
+    assert breakfast["total"]["protein"] == 15.0
+    assert breakfast["total"]["sugars"] == 1.0
+    assert breakfast["total"]["salt"] is None
+    assert breakfast["less_than_1g"] == ["sugars"]
+
+    assert lunch["total"]["calorie"] == 200.0
+    assert lunch["total"]["protein"] is None
+    assert lunch["less_than_1g"] == []
+
+
+def test_calculate_meals_rejects_food_without_serving_size():
+    foods = [_food(1, "NO_SERVING", None, calorie=100.0)]
+    with pytest.raises(NutritionCalculationError):
+        calculate_meals(foods, [{"name": None, "items": [{"food_index": 0, "grams": 10.0}]}])
+
+
+def test_compute_normalized_nutrients_per_100g_and_per_100kcal():
+    normalized = compute_normalized_nutrients({"serving_size": 250.0, "calorie": 300.0, "salt": 600.0, "sugars": -1.0, "protein": None})
+
+    assert set(normalized) == set(NORMALIZED_NUTRIENT_FIELDS)
+    assert "calorie_per_100kcal" not in normalized
+    assert normalized["calorie_per_100g"] == 120.0
+    assert normalized["salt_per_100g"] == 240.0
+    assert normalized["salt_per_100kcal"] == 200.0
+    assert normalized["sugars_per_100g"] == 0.0
+    assert normalized["protein_per_100g"] is None
+
+
+def test_compute_normalized_nutrients_without_valid_base_is_none():
+    assert compute_normalized_nutrients({"serving_size": None, "calorie": 0.0, "salt": 10.0})["salt_per_100g"] is None
+    assert compute_normalized_nutrients({"serving_size": 0.0, "calorie": 0.0, "salt": 10.0})["salt_per_100kcal"] is None
@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight("test")
+    executions = []
+    release = threading.Event()
+
+    def slow_lookup(value):
+        executions.append(value)
+        release.wait(timeout=5)
+        return {"value": value}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(single_flight.do("same-key", slow_lookup, 1)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    while single_flight.stats()["requests_total"] < 5:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert executions == [1]
+    assert results == [{"value": 1}] * 5
+    stats = single_flight.stats()
+    assert stats["executions_total"] == 1
+    assert stats["coalesced_total"] == 4
+    assert stats["in_flight_keys"] == 0
+
+
+def test_single_flight_propagates_errors_and_does_not_cache():
+    single_flight = SingleFlight("test")
+
+    def failing_lookup():
+        raise ValueError("backend error")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", failing_lookup)
+
+    assert single_flight.do("key", lambda: "recovered") == "recovered"
+    assert single_flight.stats()["executions_total"] == 2
+
+
+def test_single_flight_follower_waits_only_until_its_own_deadline():
+    from app.core.deadline import DeadlineExceededError, deadline_scope
+
+    single_flight = SingleFlight("test")
+    leader_started = threading.Event()
+    release = threading.Event()
+
+    def slow_lookup():
+        leader_started.set()
+        release.wait(timeout=5)
+        return "slow"
+
+    leader = threading.Thread(target=lambda: single_flight.do("key", slow_lookup))
+    leader.start()
+    leader_started.wait(timeout=5)
+
+    started = time.monotonic()
+    with deadline_scope(0.05):
+        with pytest.raises(DeadlineExceededError):
+            single_flight.do("key", slow_lookup)
+    assert time.monotonic() - started < 1.0
+
+    release.set()
+    leader.join()
+
+
+def test_single_flight_follower_retries_after_leader_deadline_error():
+    from app.core.deadline import DeadlineExceededError
+
+    single_flight = SingleFlight("test")
+    leader_started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def lookup():
+        calls.append(threading.current_thread().name)
+        if len(calls) == 1:
+            leader_started.set()
+            release.wait(timeout=5)
+            raise DeadlineExceededError()
+        return "fresh"
+
+    leader_errors = []
+
+    def run_leader():
+        try:
+            single_flight.do("key", lookup)
+        except DeadlineExceededError as e:
+            leader_errors.append(e)
+
+    leader = threading.Thread(target=run_leader)
+    leader.start()
+    leader_started.wait(timeout=5)
+
+    results = []
+    follower = threading.Thread(target=lambda: results.append(single_flight.do("key", lookup)))
+    follower.start()
+    while single_flight.stats()["coalesced_total"] < 1:
+        time.sleep(0.01)
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert len(leader_errors) == 1
+    assert results == ["fresh"]
+    assert len(calls) == 2
+    assert single_flight.stats()["requests_total"] == 2
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from app.core import tracing
+from app.core.config import settings
+from app.search.es_client import _es_operation_name
+
+
+@pytest.fixture
+def always_sample(monkeypatch):
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 1.0)
+    tracing.trace_ring_buffer.clear()
+    yield
+    tracing.trace_ring_buffer.clear()
+
+
+def test_spans_are_nested_under_current_span_and_exported(always_sample):
+    @tracing.traced(kind="repository")
+    def load_rows():
+        with tracing.start_span("es search", kind="elasticsearch"):
+            pass
+        return 3
+
+    with tracing.start_trace("GET /items") as root:
+        assert load_rows() == 3
+        trace_id = tracing.current_trace_id()
+
+    trace = tracing.trace_ring_buffer.get(trace_id)
+    assert trace["name"] == "GET /items"
+    assert trace["span_count"] == 3
+    spans = {span["name"]: span for span in trace["spans"]}
+    assert spans["load_rows"]["parent_id"] == root.span_id
+    assert spans["load_rows"]["kind"] == "repository"
+    assert spans["es search"]["parent_id"] == spans["load_rows"]["span_id"]
+    assert all(span["duration_ms"] is not None for span in trace["spans"])
+    assert tracing.current_trace_id() is None
+
+
+def test_span_records_error_and_reraises(always_sample):
+    with pytest.raises(ValueError):
+        with tracing.start_trace("GET /fail"):
+            with tracing.start_span("step"):
+                raise ValueError("boom")
+
+    trace = tracing.trace_ring_buffer.traces(limit=1)[0]
+    assert trace["status"] == "error"
+    assert trace["spans"][1]["attributes"]["error"] == "ValueError: boom"
+
+
+def test_unsampled_requests_record_nothing(always_sample, monkeypatch):
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 0.0)
+
+    with tracing.start_trace("GET /items") as root:
+        assert root is None
+        with tracing.start_span("step") as span:
+            assert span is None
+
+    assert tracing.trace_ring_buffer.traces() == []
+
+
+def test_trace_span_limit_and_jsonl_exporter(always_sample, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "TRACING_MAX_SPANS_PER_TRACE", 3)
+    exporter = tracing.JsonlFileExporter(str(tmp_path / "traces" / "traces.jsonl"))
+    tracing.add_trace_exporter(exporter)
+    try:
+        with tracing.start_trace("POST /bulk"):
+            for _ in range(5):
+                tracing.end_span(tracing.begin_span("sql INSERT", kind="sql"))
+    finally:
+        tracing.remove_trace_exporter(exporter)
+
+    lines = (tmp_path / "traces" / "traces.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    exported = json.loads(lines[0])
+    assert exported["span_count"] == 3
+    assert exported["dropped_spans"] == 3
+
+
+@pytest.mark.parametrize("method,url,expected", [
+    ("HEAD", "/", "ping"),
+    ("POST", "/food_nutritions/_search", "search"),
+    ("PUT", "/food_nutritions/_doc/1", "index"),
+    ("DELETE", "/food_nutritions/_doc/1", "delete"),
+    ("POST", "/_bulk", "bulk"),
+    ("PUT", "/food_nutritions", "put_index"),
+])
+def test_es_operation_name(method, url, expected):
+    assert _es_operation_name(method, url) == expected
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import create_engine, exc as sa_exc, text
+from sqlalchemy.orm import Session
+
+from app.db import session as db_session
+from app.db.pool_metrics import InstrumentedQueuePool, get_pool_stats
+from app.models.food_nutrition import FoodNutrition as FoodNutritionModel
+
+
+def test_instrumented_pool_reports_checkouts_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.05,
+    )
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        stats = get_pool_stats(engine)
+        assert stats["checked_out"] == 1
+        with pytest.raises(sa_exc.TimeoutError):
+            engine.connect()
+
+    stats = get_pool_stats(engine)
+    assert stats["pool_class"] == "InstrumentedQueuePool"
+    assert stats["checked_out"] == 0
+    assert stats["checkouts_total"] == 1
+    assert stats["checkout_timeouts_total"] == 1
+    assert stats["overflow_in_use"] == 0
+
+
+def test_engine_options_apply_pool_settings_only_to_file_databases():
+    file_options = db_session._engine_options("sqlite:///./db_files/test.db")
+    assert file_options["poolclass"] is InstrumentedQueuePool
+    assert file_options["pool_size"] == db_session.settings.DB_POOL_SIZE
+
+    memory_options = db_session._engine_options("sqlite:///:memory:")
+    assert "poolclass" not in memory_options
+    assert memory_options["connect_args"] == {"check_same_thread": False, "timeout": db_session.settings.DB_BUSY_TIMEOUT_SECONDS}
+
+
+def test_read_only_session_rejects_writes():
+    read_db: Session = db_session.ReadOnlySessionLocal(bind=create_engine("sqlite:///:memory:"))
+    read_db.add(FoodNutritionModel(food_cd="RO001", food_name="조회 전용"))
+    with pytest.raises(RuntimeError):
+        read_db.flush()
+    read_db.close()
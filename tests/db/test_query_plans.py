@@ -0,0 +1,146 @@
+import os
+from typing import List, Tuple
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.nutrition_calculator import compute_normalized_nutrients
+from app.models.food_nutrition import FoodNutrition as FoodNutritionModel
+from app.repositories import food_nutrition_repository as repository
+from scripts.load_data import _fetch_existing_hashes
+
+ALEMBIC_SCRIPT_LOCATION = os.path.join(os.path.dirname(__file__), "..", "..", "alembic")
+
+
+@pytest.fixture(scope="module")
+def migrated_engine(tmp_path_factory):
+    ## 실제 alembic 마이그레이션으로 만든 스키마에 데이터를 넣고 ANALYZE한 뒤 쿼리 플랜을 확인
+    database_url = f"sqlite:///{tmp_path_factory.mktemp('query_plans') / 'plans.db'}"
+    original_url = settings.DATABASE_URL
+    settings.DATABASE_URL = database_url
+    try:
+        config = Config()
+        config.set_main_option("script_location", ALEMBIC_SCRIPT_LOCATION)
+        command.upgrade(config, "head")
+    finally:
+        settings.DATABASE_URL = original_url
+
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO food_nutritions (food_cd, food_name, research_year, maker_name, content_hash, salt_per_100g) "
+                "VALUES (:food_cd, :food_name, :research_year, :maker_name, 'hash', :salt_per_100g)"
+            ),
+            [
+                {
+                    "food_cd": f"D{i:06d}", "food_name": f"식품 {i}", "research_year": str(2018 + i % 6), "maker_name": f"제조사 {i % 150}",
+                    "salt_per_100g": float(i % 900) if i % 10 else None,
+                }
+                for i in range(3000)
+            ],
+        )
+        conn.execute(text("ANALYZE"))
+    yield engine
+    engine.dispose()
+
+
+def _query_plans(engine, run) -> List[Tuple[str, List[str]]]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with Session(engine) as db:
+            run(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    plans = []
+    with engine.connect() as conn:
+        cursor = conn.connection.dbapi_connection.cursor()
+        for statement, parameters in statements:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plans.append((statement, [row[-1] for row in cursor.fetchall()]))
+    return plans
+
+
+def test_migration_matches_model_indexes(migrated_engine):
+    migrated = {index["name"] for index in inspect(migrated_engine).get_indexes("food_nutritions")}
+    declared = {index.name for index in FoodNutritionModel.__table__.indexes}
+    assert declared <= migrated
+    with migrated_engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM sqlite_stat1 WHERE tbl = 'food_nutritions'")).scalar() > 0
+
+
+@pytest.mark.parametrize("run,expected_index", [
+    (lambda db: repository.get_food_nutrition_rows(db, research_year="2019", maker_name="제조사 3"), "ix_food_nutritions_research_year_maker_name"),
+    (lambda db: repository.get_food_nutrition_rows(db, research_year="2019"), "ix_food_nutritions_research_year"),
+    (lambda db: repository.get_food_nutrition_rows(db, maker_name="제조사 3"), "ix_food_nutritions_maker_name"),
+    (lambda db: repository.get_food_nutrition_rows(db, food_cd="D000003"), "ix_food_nutritions_food_cd"),
+    (lambda db: repository.count_food_nutritions(db, research_year="2019", maker_name="제조사 3"), "COVERING INDEX ix_food_nutritions_research_year_maker_name"),
+    (lambda db: repository.count_food_nutritions(db, research_year="2019"), "COVERING INDEX ix_food_nutritions_research_year"),
+    (lambda db: repository.get_food_nutrition_columns(db, 3, ["id", "food_name"]), "INTEGER PRIMARY KEY"),
+    (lambda db: repository.get_food_nutritions_by_ids_or_food_cds(db, ["id", "food_cd"], ids=[1, 2], food_cds=["D000005"]), "MULTI-INDEX OR"),
+    (lambda db: _fetch_existing_hashes(db, ["D000001", "D000002"]), "COVERING INDEX ix_food_nutritions_food_cd_content_hash"),
+    (lambda db: repository.get_food_nutrition_rows(db, sort=("salt_per_100g", False)), "ix_food_nutritions_salt_per_100g"),
+    (lambda db: repository.get_food_nutrition_rows(db, sort=("salt_per_100g", True)), "ix_food_nutritions_salt_per_100g"),
+    (lambda db: repository.get_food_nutrition_rows(db, sort=("salt_per_100g", False), ranges=(("salt_per_100g", None, 120.0),)), "ix_food_nutritions_salt_per_100g"),
+    (lambda db: repository.count_food_nutritions(db, ranges=(("salt_per_100g", 10.0, 20.0),)), "COVERING INDEX ix_food_nutritions_salt_per_100g"),
+    (lambda db: repository.get_food_nutrition_rows(db, sort=("protein_per_100kcal", True)), "ix_food_nutritions_protein_per_100kcal"),
+    (lambda db: repository.count_food_nutritions(db, ranges=(("sugars_per_100kcal", None, 5.0),)), "COVERING INDEX ix_food_nutritions_sugars_per_100kcal"),
+], ids=[
+    "list_by_year_and_maker", "list_by_year", "list_by_maker", "list_by_food_cd",
+    "count_by_year_and_maker", "count_by_year", "read_by_id", "calculate_lookup", "loader_change_detection",
+    "sort_by_salt_per_100g", "sort_by_salt_per_100g_desc", "sort_with_range_on_salt_per_100g", "count_range_on_salt_per_100g",
+    "sort_by_protein_per_100kcal_desc", "count_range_on_sugars_per_100kcal",
+])
+def test_hot_queries_use_indexes(migrated_engine, run, expected_index):
+    plans = _query_plans(migrated_engine, run)
+    assert plans
+    for statement, plan in plans:
+        plan_text = "\n".join(plan)
+        assert not any(line.startswith("SCAN") for line in plan), f"{statement}\n{plan_text}"
+        assert "USE TEMP B-TREE" not in plan_text, f"{statement}\n{plan_text}"
+        assert expected_index in plan_text, f"{statement}\n{plan_text}"
+
+
+def test_normalized_nutrient_backfill_matches_repository(tmp_path):
+    ## 정규화 컬럼 추가 이전 스키마에 넣은 행이 백필 후 repository 계산과 같은 값을 가져야 함
+    database_url = f"sqlite:///{tmp_path / 'backfill.db'}"
+    original_url = settings.DATABASE_URL
+    settings.DATABASE_URL = database_url
+    try:
+        config = Config()
+        config.set_main_option("script_location", ALEMBIC_SCRIPT_LOCATION)
+        command.upgrade(config, "c4f7a2d9e1b3")
+        rows = [
+            {"food_cd": "B1", "serving_size": 250.0, "calorie": 310.0, "salt": 730.0, "sugars": -1.0, "protein": None},
+            {"food_cd": "B2", "serving_size": None, "calorie": 120.0, "salt": 80.0, "sugars": 3.0, "protein": 2.5},
+            {"food_cd": "B3", "serving_size": 30.0, "calorie": 0.0, "salt": 15.0, "sugars": 0.0, "protein": 1.0},
+        ]
+        engine = create_engine(database_url)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO food_nutritions (food_cd, food_name, serving_size, calorie, salt, sugars, protein) "
+                    "VALUES (:food_cd, :food_cd, :serving_size, :calorie, :salt, :sugars, :protein)"
+                ),
+                rows,
+            )
+        command.upgrade(config, "head")
+    finally:
+        settings.DATABASE_URL = original_url
+
+    with Session(engine) as db:
+        for row in rows:
+            stored = repository.get_food_nutrition_by_food_cd(db, row["food_cd"])
+            expected = compute_normalized_nutrients(row)
+            assert {field: getattr(stored, field) for field in expected} == expected
+    engine.dispose()
@@ -0,0 +1,32 @@
+import logging
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, text
+
+from app.db.slow_query_log import install_slow_query_log
+
+
+def test_slow_sql_query_is_logged_with_query_plan(caplog):
+    engine = create_engine("sqlite:///:memory:")
+    install_slow_query_log(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, code TEXT)"))
+        with patch("app.db.slow_query_log.settings.SQL_SLOW_QUERY_THRESHOLD_MS", 0.0), \
+             caplog.at_level(logging.WARNING, logger="app.slow_query"):
+            conn.execute(text("SELECT * FROM items WHERE id = :id"), {"id": 1})
+
+    slow_logs = [record.getMessage() for record in caplog.records if record.name == "app.slow_query"]
+    assert any("SELECT * FROM items" in message and "query_plan=" in message for message in slow_logs)
+
+
+def test_fast_sql_query_is_not_logged(caplog):
+    engine = create_engine("sqlite:///:memory:")
+    install_slow_query_log(engine)
+
+    with patch("app.db.slow_query_log.settings.SQL_SLOW_QUERY_THRESHOLD_MS", 60_000.0), \
+         caplog.at_level(logging.WARNING, logger="app.slow_query"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    assert not [record for record in caplog.records if record.name == "app.slow_query"]
@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.deadline import DeadlineExceededError, deadline_scope
+from app.db.sql_deadline import install_sql_deadline
+
+## 끝나지 않는 재귀 CTE (progress handler로만 중단 가능)
+ENDLESS_QUERY = "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n) SELECT count(*) FROM n"
+
+
+def test_running_statement_is_interrupted_when_deadline_passes():
+    engine = create_engine("sqlite:///:memory:")
+    install_sql_deadline(engine)
+
+    with engine.connect() as conn:
+        with deadline_scope(0.05):
+            with pytest.raises(DeadlineExceededError):
+                conn.execute(text(ENDLESS_QUERY))
+        ## deadline 밖에서는 같은 커넥션을 계속 사용할 수 있음
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_busy_timeout_follows_remaining_budget():
+    engine = create_engine("sqlite:///:memory:")
+    install_sql_deadline(engine)
+
+    with engine.connect() as conn:
+        with deadline_scope(0.5):
+            busy_timeout_ms = conn.execute(text("PRAGMA busy_timeout")).scalar()
+        assert 0 < busy_timeout_ms <= 500
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_statement_is_not_started_after_deadline():
+    engine = create_engine("sqlite:///:memory:")
+    install_sql_deadline(engine)
+
+    with engine.connect() as conn:
+        with deadline_scope(1e-9):
+            with pytest.raises(DeadlineExceededError):
+                conn.execute(text("SELECT 1"))
@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core import tracing
+from app.core.config import settings
+from app.db.sql_tracing import install_sql_tracing
+
+
+def test_sql_statements_are_recorded_as_spans(monkeypatch):
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACING_SAMPLE_RATE", 1.0)
+    engine = create_engine("sqlite:///:memory:")
+    install_sql_tracing(engine)
+
+    with tracing.start_trace("GET /items"):
+        trace_id = tracing.current_trace_id()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+
+    sql_spans = [span for span in tracing.trace_ring_buffer.get(trace_id)["spans"] if span["kind"] == "sql"]
+    assert [span["name"] for span in sql_spans] == ["sql SELECT", "sql SELECT"]
+    assert sql_spans[0]["status"] == "ok"
+    assert sql_spans[0]["attributes"]["statement"] == "SELECT 1"
+    assert sql_spans[1]["status"] == "error"
+    assert "missing_table" in sql_spans[1]["attributes"]["error"]
+
+
+def test_sql_tracing_is_noop_without_active_trace():
+    engine = create_engine("sqlite:///:memory:")
+    install_sql_tracing(engine)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
@@ -11,6 +11,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.search.es_utils import FOOD_NUTRITIONS_INDEX_NAME
+from app.core.config import settings
 
 
 SQLALCHEMY_DATABASE_URL_TEST = "sqlite:///:memory:"
@@ -55,7 +56,21 @@ def test_get_food_nutritions(db_session: Session):
     all_foods = food_nutrition_repository.get_food_nutritions(db=db_session)
     assert len(all_foods) >= 2
 
+def test_get_food_nutrition_rows_returns_plain_rows_without_orm_objects(db_session: Session):
+    food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="ROW_R_001", food_name="행 Repo 1", research_year="2020"))
+    food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="ROW_R_002", food_name="행 Repo 2", research_year="2021"))
+    db_session.expunge_all()
 
+    rows = food_nutrition_repository.get_food_nutrition_rows(db=db_session)
+    assert [row.food_cd for row in rows] == ["ROW_R_001", "ROW_R_002"]
+    assert tuple(rows[0]._fields) == food_nutrition_repository.FOOD_NUTRITION_FIELDS
+    assert len(db_session.identity_map) == 0
+
+    filtered = food_nutrition_repository.get_food_nutrition_rows(db=db_session, research_year="2021", fields=("food_cd", "food_name"))
+    assert [tuple(row) for row in filtered] == [("ROW_R_002", "행 Repo 2")]
+
+
+@patch('app.repositories.food_nutrition_repository.is_es_ready', new=lambda: True)
 @patch('app.repositories.food_nutrition_repository.get_es_client')
 def test_create_food_nutrition_with_es_sync(mock_get_es_client: MagicMock, db_session: Session):
     mock_es_instance = MagicMock()
@@ -85,6 +100,7 @@ def test_create_food_nutrition_with_es_sync(mock_get_es_client: MagicMock, db_se
         refresh="wait_for"
     )
 
+@patch('app.repositories.food_nutrition_repository.is_es_ready', new=lambda: True)
 @patch('app.repositories.food_nutrition_repository.get_es_client')
 def test_update_food_nutrition_with_es_sync(mock_get_es_client: MagicMock, db_session: Session):
     mock_es_instance = MagicMock()
@@ -118,6 +134,7 @@ def test_update_food_nutrition_with_es_sync(mock_get_es_client: MagicMock, db_se
         refresh="wait_for"
     )
 
+@patch('app.repositories.food_nutrition_repository.is_es_ready', new=lambda: True)
 @patch('app.repositories.food_nutrition_repository.get_es_client')
 def test_delete_food_nutrition_with_es_sync(mock_get_es_client: MagicMock, db_session: Session):
     mock_es_instance = MagicMock()
@@ -145,6 +162,7 @@ def test_delete_food_nutrition_with_es_sync(mock_get_es_client: MagicMock, db_se
         refresh="wait_for"
     )
 
+@patch('app.repositories.food_nutrition_repository.is_es_ready', new=lambda: True)
 @patch('app.repositories.food_nutrition_repository.get_es_client')
 def test_create_food_nutrition_es_ping_fails(mock_get_es_client: MagicMock, db_session: Session):
     mock_es_instance = MagicMock()
@@ -160,3 +178,233 @@ def test_create_food_nutrition_es_ping_fails(mock_get_es_client: MagicMock, db_s
     mock_get_es_client.assert_called_once()
     mock_es_instance.ping.assert_called_once()
     mock_es_instance.index.assert_not_called()
+
+@patch('app.repositories.food_nutrition_repository.is_es_ready', new=lambda: False)
+@patch('app.repositories.food_nutrition_repository.get_es_client')
+def test_writes_skip_es_sync_until_es_is_ready(mock_get_es_client: MagicMock, db_session: Session):
+    ## 부트스트랩 전에는 클라이언트 생성/ping(최대 ES_TIMEOUT)을 시도하지 않고 SQLite 쓰기만 수행
+    created = food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="ES_NOTREADY", food_name="준비 전"))
+    food_nutrition_repository.update_food_nutrition(db=db_session, food_nutrition_id=created.id, food_nutrition_update=FoodNutritionUpdate(calorie=1.0))
+    result = food_nutrition_repository.bulk_update_food_nutritions(db=db_session, updates={"calorie": 2.0}, food_cd="ES_NOTREADY")
+    assert food_nutrition_repository.delete_food_nutrition(db=db_session, food_nutrition_id=created.id) is not None
+
+    assert result["affected"] == 1 and result["es_synced"] is False
+    mock_get_es_client.assert_not_called()
+
+@patch('app.repositories.food_nutrition_repository.is_es_ready', new=lambda: True)
+@patch('app.repositories.food_nutrition_repository.get_es_client')
+def test_bulk_update_food_nutritions_by_filter(mock_get_es_client: MagicMock, db_session: Session):
+    mock_es = MagicMock()
+    mock_es.update_by_query.return_value = {"updated": 2, "failures": []}
+    mock_get_es_client.return_value = mock_es
+    for i, maker_name in enumerate(["옛제조사", "옛제조사", "다른제조사"]):
+        db_session.add(FoodNutritionModel(food_cd=f"BULK_U_{i}", food_name=f"일괄 {i}", maker_name=maker_name, ref_name="옛출처"))
+    db_session.commit()
+
+    result = food_nutrition_repository.bulk_update_food_nutritions(
+        db=db_session, updates={"ref_name": "새출처", "calorie": 10.0}, maker_name="옛제조사"
+    )
+
+    assert result == {"affected": 2, "es_affected": 2, "es_synced": True, "es_error": None}
+    db_session.expire_all()
+    rows = {row.food_cd: row for row in db_session.query(FoodNutritionModel).all()}
+    assert rows["BULK_U_0"].ref_name == "새출처" and rows["BULK_U_0"].calorie == 10.0
+    assert rows["BULK_U_2"].ref_name == "옛출처"
+    ## 같은 UPDATE 문에서 다시 계산한 해시가 행 단위 계산 결과와 같아야 함
+    for food_cd in ("BULK_U_0", "BULK_U_1"):
+        assert rows[food_cd].content_hash == food_nutrition_repository._content_hash_for_model(rows[food_cd])
+
+    _, kwargs = mock_es.update_by_query.call_args
+    assert kwargs["wait_for_completion"] is True
+    assert kwargs["request_timeout"] == settings.ES_BULK_BY_QUERY_TIMEOUT_SECONDS
+    assert kwargs["body"]["query"] == {"bool": {"filter": [{"term": {"maker_name.keyword": "옛제조사"}}]}}
+    script_params = kwargs["body"]["script"]["params"]
+    assert script_params["updates"] == {"ref_name": "새출처", "calorie": 10.0}
+    ## calorie가 바뀌면 calorie_per_100g와 100kcal당 값들만 ES 스크립트에서 다시 계산
+    assert script_params["normalized"]["calorie_per_100g"] == ["calorie", "serving_size"]
+    assert script_params["normalized"]["salt_per_100kcal"] == ["salt", "calorie"]
+    assert "salt_per_100g" not in script_params["normalized"]
+
+@patch('app.repositories.food_nutrition_repository.is_es_ready', new=lambda: True)
+@patch('app.repositories.food_nutrition_repository.get_es_client')
+def test_bulk_delete_food_nutritions_by_filter(mock_get_es_client: MagicMock, db_session: Session):
+    mock_es = MagicMock()
+    mock_es.delete_by_query.side_effect = ConnectionError("es down")
+    mock_get_es_client.return_value = mock_es
+    for i, research_year in enumerate(["2019", "2019", "2020"]):
+        db_session.add(FoodNutritionModel(food_cd=f"BULK_D_{i}", food_name=f"삭제 {i}", research_year=research_year, maker_name="단종"))
+    db_session.commit()
+
+    with pytest.raises(ValueError):
+        food_nutrition_repository.bulk_delete_food_nutritions(db=db_session)
+
+    result = food_nutrition_repository.bulk_delete_food_nutritions(db=db_session, research_year="2019", maker_name="단종")
+
+    assert result["affected"] == 2
+    assert result["es_synced"] is False
+    assert "es down" in result["es_error"]
+    assert [row.food_cd for row in db_session.query(FoodNutritionModel).all()] == ["BULK_D_2"]
+
+def test_upsert_food_nutrition_by_food_cd_is_single_statement(db_session: Session):
+    from sqlalchemy import event
+    from app.schemas.food_nutrition import FoodNutritionUpsert
+
+    statements = []
+    record = lambda conn, cursor, statement, parameters, context, executemany: statements.append(statement)
+    event.listen(engine_test, "before_cursor_execute", record)
+    try:
+        created = food_nutrition_repository.upsert_food_nutrition_by_food_cd(
+            db=db_session, food_cd="UPSERT001", food_nutrition=FoodNutritionUpsert(food_name="업서트 전", calorie=10.0), sync_to_es=False
+        )
+        updated = food_nutrition_repository.upsert_food_nutrition_by_food_cd(
+            db=db_session, food_cd="UPSERT001", food_nutrition=FoodNutritionUpsert(food_name="업서트 후"), sync_to_es=False
+        )
+    finally:
+        event.remove(engine_test, "before_cursor_execute", record)
+
+    ## food_nutritions에는 upsert 한 문장, 같은 트랜잭션에서 변경 피드 기록 한 문장
+    food_statements = [statement for statement in statements if "food_nutrition_changes" not in statement]
+    assert len(food_statements) == 2
+    assert all("ON CONFLICT" in statement and "RETURNING" in statement for statement in food_statements)
+    assert len(statements) - len(food_statements) == 2
+    assert updated.id == created.id
+    assert updated.food_name == "업서트 후"
+    assert updated.calorie is None
+    assert updated.content_hash == food_nutrition_repository.compute_content_hash({"food_cd": "UPSERT001", "food_name": "업서트 후"})
+
+def test_create_and_update_raise_duplicate_food_cd_error(db_session: Session):
+    food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="DUP001", food_name="중복1"), sync_to_es=False)
+    second = food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="DUP002", food_name="중복2"), sync_to_es=False)
+
+    with pytest.raises(food_nutrition_repository.DuplicateFoodCdError):
+        food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="DUP001", food_name="중복3"), sync_to_es=False)
+    with pytest.raises(food_nutrition_repository.DuplicateFoodCdError):
+        food_nutrition_repository.update_food_nutrition(db=db_session, food_nutrition_id=second.id, food_nutrition_update=FoodNutritionUpdate(food_cd="DUP001"), sync_to_es=False)
+
+    updated = food_nutrition_repository.update_food_nutrition(db=db_session, food_nutrition_id=second.id, food_nutrition_update=FoodNutritionUpdate(calorie=5.0), sync_to_es=False)
+    assert updated.food_cd == "DUP002" and updated.calorie == 5.0
+    assert updated.content_hash == food_nutrition_repository.compute_content_hash({"food_cd": "DUP002", "food_name": "중복2", "calorie": 5.0})
+    assert food_nutrition_repository.update_food_nutrition(db=db_session, food_nutrition_id=999, food_nutrition_update=FoodNutritionUpdate(calorie=1.0), sync_to_es=False) is None
+
+def test_writes_are_recorded_in_change_feed_in_order(db_session: Session):
+    from app.schemas.food_nutrition import FoodNutritionUpsert
+
+    first = food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="CHG001", food_name="변경1", research_year="2020"), sync_to_es=False)
+    second = food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="CHG002", food_name="변경2", research_year="2020"), sync_to_es=False)
+    food_nutrition_repository.update_food_nutrition(db=db_session, food_nutrition_id=first.id, food_nutrition_update=FoodNutritionUpdate(calorie=1.0), sync_to_es=False)
+    food_nutrition_repository.upsert_food_nutrition_by_food_cd(db=db_session, food_cd="CHG003", food_nutrition=FoodNutritionUpsert(food_name="변경3"), sync_to_es=False)
+    food_nutrition_repository.delete_food_nutrition(db=db_session, food_nutrition_id=second.id, sync_to_es=False)
+    food_nutrition_repository.bulk_update_food_nutritions(db=db_session, updates={"research_year": "2021"}, research_year="2020", sync_to_es=False)
+
+    feed = food_nutrition_repository.get_food_nutrition_changes(db=db_session, since=0, limit=100)
+    ## CHG002의 upsert들은 이후 삭제되었으므로 건너뛰고 tombstone만 남음
+    assert [(change["operation"], change["food_cd"]) for change in feed["changes"]] == [
+        ("upsert", "CHG001"), ("upsert", "CHG001"), ("upsert", "CHG003"), ("delete", "CHG002"), ("upsert", "CHG001"),
+    ]
+    assert [change["seq"] for change in feed["changes"]] == sorted(change["seq"] for change in feed["changes"])
+    assert feed["changes"][-1]["data"]["research_year"] == "2021"
+    assert feed["changes"][3]["data"] is None and feed["changes"][3]["id"] == second.id
+    assert feed["has_more"] is False
+
+    ## 작은 페이지로 next_since를 따라가도 같은 변경 목록을 얻음 (건너뛴 upsert도 next_since는 진행)
+    paged_changes, since, has_more = [], 0, True
+    while has_more:
+        page = food_nutrition_repository.get_food_nutrition_changes(db=db_session, since=since, limit=2)
+        paged_changes.extend(page["changes"])
+        since, has_more = page["next_since"], page["has_more"]
+    assert paged_changes == feed["changes"]
+    assert since == feed["next_since"]
+    rest = food_nutrition_repository.get_food_nutrition_changes(db=db_session, since=feed["next_since"], limit=100)
+    assert rest == {"changes": [], "next_since": feed["next_since"], "has_more": False}
+
+def test_failed_write_is_not_recorded_in_change_feed(db_session: Session):
+    food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="CHG_DUP", food_name="중복"), sync_to_es=False)
+    with pytest.raises(food_nutrition_repository.DuplicateFoodCdError):
+        food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="CHG_DUP", food_name="중복2"), sync_to_es=False)
+
+    feed = food_nutrition_repository.get_food_nutrition_changes(db=db_session)
+    assert len(feed["changes"]) == 1
+
+def test_food_cd_change_records_tombstone_for_previous_code(db_session: Session):
+    created = food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="CHG_OLD", food_name="코드변경"), sync_to_es=False)
+    food_nutrition_repository.create_food_nutrition(db=db_session, food_nutrition=FoodNutritionCreate(food_cd="CHG_TAKEN", food_name="기존"), sync_to_es=False)
+    ## 같은 코드로 "수정"하면 tombstone을 남기지 않고, 중복으로 실패한 수정은 tombstone도 함께 롤백됨
+    food_nutrition_repository.update_food_nutrition(db=db_session, food_nutrition_id=created.id, food_nutrition_update=FoodNutritionUpdate(food_cd="CHG_OLD"), sync_to_es=False)
+    with pytest.raises(food_nutrition_repository.DuplicateFoodCdError):
+        food_nutrition_repository.update_food_nutrition(db=db_session, food_nutrition_id=created.id, food_nutrition_update=FoodNutritionUpdate(food_cd="CHG_TAKEN"), sync_to_es=False)
+    since = food_nutrition_repository.get_food_nutrition_changes(db=db_session)["next_since"]
+
+    food_nutrition_repository.update_food_nutrition(db=db_session, food_nutrition_id=created.id, food_nutrition_update=FoodNutritionUpdate(food_cd="CHG_NEW"), sync_to_es=False)
+
+    feed = food_nutrition_repository.get_food_nutrition_changes(db=db_session)
+    assert [(change["operation"], change["food_cd"]) for change in feed["changes"]] == [
+        ("upsert", "CHG_TAKEN"), ("delete", "CHG_OLD"), ("upsert", "CHG_NEW"),
+    ]
+    changes = food_nutrition_repository.get_food_nutrition_changes(db=db_session, since=since)["changes"]
+    assert [(change["operation"], change["id"], change["food_cd"]) for change in changes] == [
+        ("delete", created.id, "CHG_OLD"), ("upsert", created.id, "CHG_NEW"),
+    ]
+    assert changes[1]["data"]["food_cd"] == "CHG_NEW"
+
+def test_normalized_nutrients_are_kept_in_sync_on_writes(db_session: Session):
+    from app.core.nutrition_calculator import compute_normalized_nutrients, NORMALIZED_NUTRIENT_FIELDS
+    from app.schemas.food_nutrition import FoodNutritionUpsert
+
+    def assert_normalized(row):
+        expected = compute_normalized_nutrients({field: getattr(row, field) for field in food_nutrition_repository.CONTENT_HASH_FIELDS})
+        assert {field: getattr(row, field) for field in NORMALIZED_NUTRIENT_FIELDS} == expected
+
+    created = food_nutrition_repository.create_food_nutrition(
+        db=db_session,
+        food_nutrition=FoodNutritionCreate(food_cd="NORM001", food_name="정규화", serving_size=250.0, calorie=300.0, salt=600.0, sugars=-1.0),
+        sync_to_es=False
+    )
+    assert created.salt_per_100g == 240.0
+    assert created.salt_per_100kcal == 200.0
+    assert created.sugars_per_100g == 0.0
+    assert created.protein_per_100g is None
+    assert_normalized(created)
+
+    ## 기준값(serving_size)만 바꿔도 100g당 값은 다시 계산되고, 100kcal당 값은 그대로
+    updated = food_nutrition_repository.update_food_nutrition(
+        db=db_session, food_nutrition_id=created.id, food_nutrition_update=FoodNutritionUpdate(serving_size=120.0), sync_to_es=False
+    )
+    assert updated.salt_per_100g == 500.0
+    assert updated.salt_per_100kcal == 200.0
+    assert_normalized(updated)
+
+    updated = food_nutrition_repository.update_food_nutrition(
+        db=db_session, food_nutrition_id=created.id, food_nutrition_update=FoodNutritionUpdate(calorie=None), sync_to_es=False
+    )
+    assert updated.calorie_per_100g is None and updated.salt_per_100kcal is None
+    assert_normalized(updated)
+
+    upserted = food_nutrition_repository.upsert_food_nutrition_by_food_cd(
+        db=db_session, food_cd="NORM001", food_nutrition=FoodNutritionUpsert(food_name="정규화", serving_size=50.0, protein=7.5), sync_to_es=False
+    )
+    assert upserted.protein_per_100g == 15.0 and upserted.salt_per_100g is None
+    assert_normalized(upserted)
+
+    food_nutrition_repository.bulk_update_food_nutritions(db=db_session, updates={"serving_size": 25.0}, food_cd="NORM001", sync_to_es=False)
+    db_session.expire_all()
+    bulk_updated = food_nutrition_repository.get_food_nutrition_by_food_cd(db_session, "NORM001")
+    assert bulk_updated.protein_per_100g == 30.0
+    assert_normalized(bulk_updated)
+
+def test_get_food_nutrition_rows_sorts_and_filters_by_normalized_nutrients(db_session: Session):
+    for food_cd, serving_size, salt in [("S1", 100.0, 300.0), ("S2", 50.0, 100.0), ("S3", 200.0, 100.0), ("S4", None, 10.0), ("S5", 10.0, 20.0)]:
+        food_nutrition_repository.create_food_nutrition(
+            db=db_session, food_nutrition=FoodNutritionCreate(food_cd=food_cd, food_name=food_cd, serving_size=serving_size, salt=salt), sync_to_es=False
+        )
+
+    ## salt_per_100g: S1=300, S2=200, S3=50, S4=None(제외), S5=200 (같은 값은 id 순)
+    rows = food_nutrition_repository.get_food_nutrition_rows(db_session, fields=["food_cd"], sort=("salt_per_100g", False))
+    assert [row.food_cd for row in rows] == ["S3", "S2", "S5", "S1"]
+    rows = food_nutrition_repository.get_food_nutrition_rows(db_session, fields=["food_cd"], sort=("salt_per_100g", True))
+    assert [row.food_cd for row in rows] == ["S1", "S5", "S2", "S3"]
+
+    ranges = (("salt_per_100g", 100.0, 250.0),)
+    rows = food_nutrition_repository.get_food_nutrition_rows(db_session, fields=["food_cd"], ranges=ranges)
+    assert [row.food_cd for row in rows] == ["S2", "S5"]
+    assert food_nutrition_repository.count_food_nutritions(db_session, ranges=ranges) == 2
+    assert food_nutrition_repository.count_food_nutritions(db_session, sort=("salt_per_100g", False)) == 4
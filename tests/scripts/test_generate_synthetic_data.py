@@ -0,0 +1,50 @@
+import pandas as pd
+
+from scripts import generate_synthetic_data, load_data
+
+
+def _sample_clean_df():
+    source = pd.DataFrame({
+        "식품코드": [f"R{i:03d}" for i in range(20)],
+        "식품명": ["김치찌개", "무말랭이 김치", "된장찌개", "두부 조림"] * 5,
+        "식품대분류": ["찌개류", "김치류", "찌개류", None] * 5,
+        "식품상세분류": ["찌개", None, "찌개", "조림"] * 5,
+        "연도": [2019, 2020] * 10,
+        "지역 / 제조사": ["삼삼한밥상", "종가집"] * 10,
+        "1회제공량": [100, 200] * 10,
+        "에너지(㎉)": [float(i * 10) for i in range(20)],
+        "단백질(g)": ["1g 미만", "2.5", "-", "3.0"] * 5,
+    })
+    return load_data.transform_source_dataframe(source)[0]
+
+
+def test_generate_synthetic_dataframe_round_trips_through_loader_transform():
+    profile = generate_synthetic_data.build_column_profile(_sample_clean_df())
+
+    synthetic = generate_synthetic_data.generate_synthetic_dataframe(profile, 200, seed=7)
+    clean_df, report = load_data.transform_source_dataframe(synthetic)
+
+    assert report["valid_rows"] == 200
+    assert report["invalid_numeric"] == {}
+    assert clean_df["food_cd"].is_unique
+    assert clean_df["calorie"].between(0.0, 190.0).all()
+    assert set(clean_df["group_name"].dropna()) <= {"찌개류 - 찌개", "김치류", "조림"}
+    assert set(clean_df["research_year"]) <= {"2019", "2020"}
+    assert clean_df["protein"].eq(load_data.LESS_THAN_1G_VALUE).any()
+    ## 원본 20행 대비 10배 -> 제조사 고유값도 늘어남
+    assert clean_df["maker_name"].nunique() > 2
+
+    again = generate_synthetic_data.generate_synthetic_dataframe(profile, 200, seed=7)
+    pd.testing.assert_frame_equal(synthetic, again)
+
+
+def test_write_source_dataframe_is_readable_by_loader(tmp_path):
+    profile = generate_synthetic_data.build_column_profile(_sample_clean_df())
+    synthetic = generate_synthetic_data.generate_synthetic_dataframe(profile, 50, seed=1)
+    output_path = tmp_path / "synthetic.parquet"
+
+    generate_synthetic_data.write_source_dataframe(synthetic, str(output_path))
+    clean_df, report = load_data.transform_source_dataframe(load_data.read_source_dataframe(str(output_path)))
+
+    assert report["valid_rows"] == 50
+    assert clean_df["food_cd"].tolist() == synthetic["식품코드"].tolist()
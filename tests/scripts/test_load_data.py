@@ -0,0 +1,105 @@
+import pandas as pd
+from unittest.mock import patch
+
+from scripts import load_data
+from app.repositories import food_nutrition_repository
+
+
+def _write_sample_excel(path):
+    pd.DataFrame({
+        "식품코드": ["S001", "S002"],
+        "식품명": ["샘플1", "샘플2"],
+        "단백질(g)": [1.5, "1g 미만"],
+    }).to_excel(path, index=False)
+
+
+def test_read_source_dataframe_reuses_snapshot(tmp_path):
+    source_path = tmp_path / "sample.xlsx"
+    snapshot_dir = tmp_path / "snapshots"
+    _write_sample_excel(source_path)
+
+    first = load_data.read_source_dataframe(str(source_path), snapshot_dir=str(snapshot_dir))
+    assert len(list(snapshot_dir.glob("sample.*.parquet"))) == 1
+
+    with patch("scripts.load_data.pd.read_excel") as mock_read_excel:
+        second = load_data.read_source_dataframe(str(source_path), snapshot_dir=str(snapshot_dir))
+        mock_read_excel.assert_not_called()
+
+    assert second["식품코드"].tolist() == first["식품코드"].tolist()
+    assert second["단백질(g)"].tolist() == ["1.5", "1g 미만"]
+
+
+def test_read_source_dataframe_accepts_csv(tmp_path):
+    source_path = tmp_path / "sample.csv"
+    pd.DataFrame({"식품코드": ["C001"], "식품명": ["CSV 식품"], "지방(g)": ["-"]}).to_csv(source_path, index=False)
+
+    df = load_data.read_source_dataframe(str(source_path))
+
+    assert df["식품코드"].tolist() == ["C001"]
+    assert pd.isna(df["지방(g)"].iloc[0])
+
+
+def test_transform_source_dataframe_cleans_columns_and_reports():
+    df = pd.DataFrame({
+        "식품코드": ["T001", "T002", "T002", None],
+        "식품명": ["정제1", "정제2", "정제2 중복", "코드없음"],
+        "식품대분류": ["구이류", None, None, None],
+        "식품상세분류": ["육류구이", "소분류", None, None],
+        "연도": [2019, 2020, 2020, 2021],
+        "1회제공량": [100, 200, 200, 300],
+        "단백질(g)": ["33.5", "1g 미만", "1.0", "2.0"],
+        "총당류(g)": ["-", "abc", "1.0", "2.0"],
+    })
+
+    cleaned, report = load_data.transform_source_dataframe(df)
+
+    assert cleaned["food_cd"].tolist() == ["T001", "T002"]
+    assert cleaned["group_name"].tolist() == ["구이류 - 육류구이", "소분류"]
+    assert cleaned["research_year"].tolist() == ["2019", "2020"]
+    assert cleaned["protein"].tolist() == [33.5, -1.0]
+    assert cleaned["sugars"].isna().all()
+    assert cleaned["calorie"].isna().all()
+    assert report["less_than_1g"] == {"단백질(g)": 1}
+    assert report["invalid_numeric"] == {"총당류(g)": 1}
+    assert report["missing_required_rows"] == 1
+    assert report["duplicate_food_cd_rows"] == 1
+
+
+def test_compute_content_hashes_matches_repository_hash():
+    df = pd.DataFrame({
+        "식품코드": ["H001", "H002"],
+        "식품명": ["해시1", "해시2"],
+        "연도": [2019, 2020],
+        "1회제공량": [100, 250],
+        "단백질(g)": ["33.5", "1g 미만"],
+    })
+    cleaned, _ = load_data.transform_source_dataframe(df)
+
+    hashes = load_data.compute_content_hashes(cleaned)
+
+    for record, content_hash in zip(load_data._dataframe_to_records(cleaned), hashes):
+        assert food_nutrition_repository.compute_content_hash(record) == content_hash
+
+    changed = cleaned.copy()
+    changed.loc[0, "protein"] = 34.0
+    changed_hashes = load_data.compute_content_hashes(changed)
+    assert changed_hashes.iloc[0] != hashes.iloc[0]
+    assert changed_hashes.iloc[1] == hashes.iloc[1]
+
+
+def test_compute_normalized_nutrient_columns_matches_repository():
+    from app.core.nutrition_calculator import compute_normalized_nutrients
+
+    df = pd.DataFrame({
+        "식품코드": ["N001", "N002", "N003"],
+        "식품명": ["정규화1", "정규화2", "정규화3"],
+        "1회제공량": [250, None, 30],
+        "에너지(㎉)": [300, 120, 0],
+        "단백질(g)": ["33.5", "1g 미만", "1g 미만"],
+    })
+    cleaned, _ = load_data.transform_source_dataframe(df)
+
+    normalized = load_data.compute_normalized_nutrient_columns(cleaned)
+
+    for record, normalized_record in zip(load_data._dataframe_to_records(cleaned), load_data._dataframe_to_records(normalized)):
+        assert normalized_record == compute_normalized_nutrients(record)
@@ -0,0 +1,190 @@
+import asyncio
+from unittest.mock import patch
+
+from app.search import es_client
+
+
+def test_bootstrap_es_with_retry_backs_off_until_ready(monkeypatch):
+    monkeypatch.setattr(es_client, "_es_ready", False)
+    monkeypatch.setattr(es_client, "_es_bootstrap_attempts", 0)
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    with patch.object(es_client, "_bootstrap_es_once", side_effect=[ConnectionError("down"), False, True]), \
+         patch.object(es_client.asyncio, "sleep", fake_sleep):
+        asyncio.run(es_client.bootstrap_es_with_retry(initial_backoff=1.0, max_backoff=1.5))
+
+    assert es_client.is_es_ready() is True
+    assert sleeps == [1.0, 1.5]
+    assert es_client.get_es_bootstrap_status()["attempts"] == 3
+
+
+def test_concurrency_limiter_rejects_when_queue_full():
+    limiter = es_client.ESConcurrencyLimiter(max_concurrency=1, max_queue=0, queue_timeout=0.01, retry_after=3)
+
+    with limiter.acquire():
+        assert limiter.stats()["in_flight"] == 1
+        try:
+            with limiter.acquire():
+                pass
+            assert False, "대기열이 가득 찬 경우 ESOverloadedError가 발생해야 합니다."
+        except es_client.ESOverloadedError as e:
+            assert e.retry_after == 3
+
+    stats = limiter.stats()
+    assert stats["in_flight"] == 0
+    assert stats["admitted_total"] == 1
+    assert stats["rejected_queue_full_total"] == 1
+
+
+def test_concurrency_limiter_rejects_after_queue_timeout():
+    limiter = es_client.ESConcurrencyLimiter(max_concurrency=1, max_queue=1, queue_timeout=0.01, retry_after=1)
+
+    with limiter.acquire():
+        try:
+            with limiter.acquire():
+                pass
+            assert False, "대기 시간이 초과된 경우 ESOverloadedError가 발생해야 합니다."
+        except es_client.ESOverloadedError:
+            pass
+
+    stats = limiter.stats()
+    assert stats["queue_depth"] == 0
+    assert stats["rejected_timeout_total"] == 1
+
+
+def test_execute_es_search_logs_slow_query_with_body(caplog):
+    import logging
+    from unittest.mock import MagicMock
+
+    mock_es = MagicMock()
+    mock_es.search.return_value = {"took": 5000, "hits": {"hits": []}}
+    query_body = {"query": {"match": {"food_name": "김치"}}}
+
+    with caplog.at_level(logging.WARNING, logger="app.slow_query"):
+        response = es_client.execute_es_search(mock_es, query_body)
+
+    assert response["took"] == 5000
+    slow_logs = [record.getMessage() for record in caplog.records if record.name == "app.slow_query"]
+    assert len(slow_logs) == 1
+    assert "김치" in slow_logs[0]
+
+
+def test_build_query_uses_precomputed_fields_for_chosung_and_fuzzy_modes():
+    chosung_query = es_client.build_food_nutritions_query(food_name="ㄱㅊ ㅉㄱ", mode=es_client.SEARCH_MODE_CHOSUNG)
+    should = chosung_query["query"]["bool"]["must"][0]["bool"]["should"]
+    assert should == [
+        {"term": {"food_name_chosung": {"value": "ㄱㅊㅉㄱ", "boost": 2.0}}},
+        {"term": {"food_name_chosung.ngram": "ㄱㅊㅉㄱ"}},
+    ]
+
+    fuzzy_query = es_client.build_food_nutritions_query(food_name="김치찌게", mode=es_client.SEARCH_MODE_FUZZY)
+    match = fuzzy_query["query"]["bool"]["must"][0]["match"]["food_name_jamo"]
+    assert match["query"] == "ㄱㅣㅁㅊㅣㅉㅣㄱㅔ"
+
+    standard_query = es_client.build_food_nutritions_query(food_name="김치")
+    assert standard_query["query"]["bool"]["must"][0] == {"match": {"food_name": "김치"}}
+    ## 검색 전용 필드는 결과 _source에서 제외
+    assert standard_query["_source"] == {"excludes": ["food_name_chosung", "food_name_jamo"]}
+
+
+def test_es_request_params_follow_request_deadline():
+    import pytest
+    from app.core.deadline import DeadlineExceededError, deadline_scope
+
+    assert es_client._apply_deadline_to_params("search", None) is None
+    with deadline_scope(2.0):
+        search_params = es_client._apply_deadline_to_params("search", {"filter_path": "hits"})
+        index_params = es_client._apply_deadline_to_params("index", {"request_timeout": 1.0})
+    assert 0 < search_params["request_timeout"] <= 2.0
+    assert search_params["timeout"].endswith("ms") and int(search_params["timeout"][:-2]) <= 2000
+    assert search_params["filter_path"] == "hits"
+    assert index_params == {"request_timeout": 1.0}
+
+    limiter = es_client.ESConcurrencyLimiter(max_concurrency=1, max_queue=1, queue_timeout=5.0, retry_after=1)
+    with deadline_scope(1e-9):
+        with pytest.raises(DeadlineExceededError):
+            es_client._apply_deadline_to_params("search", None)
+        with pytest.raises(DeadlineExceededError):
+            with limiter.acquire():
+                pass
+
+
+def _mock_existing_index(mappings_body):
+    from unittest.mock import MagicMock
+
+    mock_es = MagicMock()
+    mock_es.indices.exists.return_value = True
+    mock_es.indices.get_mapping.return_value = {"food_nutritions_idx_v1": {"mappings": mappings_body["mappings"]}}
+    mock_es.indices.get_settings.return_value = {
+        "food_nutritions_idx_v1": {"settings": {"index": {"analysis": mappings_body["settings"]["analysis"]}}}
+    }
+    return mock_es
+
+
+def test_create_index_if_not_exists_keeps_matching_existing_index():
+    from app.search.es_utils import FOOD_NUTRITIONS_MAPPINGS, create_index_if_not_exists
+
+    mock_es = _mock_existing_index(FOOD_NUTRITIONS_MAPPINGS)
+
+    assert create_index_if_not_exists(mock_es, "food_nutritions_idx", FOOD_NUTRITIONS_MAPPINGS) is True
+    mock_es.indices.create.assert_not_called()
+    mock_es.indices.put_mapping.assert_not_called()
+
+
+def test_create_index_if_not_exists_rejects_outdated_index_without_changing_it(monkeypatch):
+    import copy
+    import pytest
+    from app.search.es_utils import FOOD_NUTRITIONS_MAPPINGS, IndexMappingMismatchError, create_index_if_not_exists
+
+    outdated = copy.deepcopy(FOOD_NUTRITIONS_MAPPINGS)
+    del outdated["mappings"]["properties"]["salt_per_100g"]
+    del outdated["settings"]["analysis"]["analyzer"]["jamo_trigram_analyzer"]
+    mock_es = _mock_existing_index(outdated)
+
+    with pytest.raises(IndexMappingMismatchError) as exc_info:
+        create_index_if_not_exists(mock_es, "food_nutritions_idx", FOOD_NUTRITIONS_MAPPINGS)
+    assert "salt_per_100g" in str(exc_info.value)
+    assert "jamo_trigram_analyzer" in str(exc_info.value)
+    mock_es.indices.put_mapping.assert_not_called()
+
+    ## 재시도로 해결되지 않으므로 부트스트랩은 한 번만 시도하고 원인을 last_error로 남김
+    monkeypatch.setattr(es_client, "_es_ready", False)
+    monkeypatch.setattr(es_client, "_es_bootstrap_attempts", 0)
+    monkeypatch.setattr(es_client, "_es_last_error", None)
+    with patch.object(es_client, "_bootstrap_es_once", side_effect=exc_info.value):
+        asyncio.run(es_client.bootstrap_es_with_retry(initial_backoff=0.0, max_backoff=0.0))
+
+    status = es_client.get_es_bootstrap_status()
+    assert status["ready"] is False
+    assert status["attempts"] == 1
+    assert "salt_per_100g" in status["last_error"]
+
+
+def test_get_es_client_ping_failure_error_is_printable(monkeypatch):
+    from unittest.mock import MagicMock
+    import pytest
+
+    monkeypatch.setattr(es_client, "_es_client", None)
+    mock_es = MagicMock()
+    mock_es.ping.return_value = False
+    with patch.object(es_client, "Elasticsearch", return_value=mock_es):
+        with pytest.raises(es_client.ConnectionError) as exc_info:
+            es_client.get_es_client()
+
+    assert "Elasticsearch 서버에 연결할 수 없습니다." in str(exc_info.value)
+
+
+def test_msearch_keeps_results_aligned_when_responses_are_missing():
+    from unittest.mock import MagicMock
+
+    mock_es = MagicMock()
+    mock_es.msearch.return_value = {"responses": [{"hits": {"hits": [{"_source": {"id": 1}}]}}]}
+
+    results = es_client.msearch_food_nutritions_in_es(mock_es, [{"food_name": "사과"}, {"food_name": "배"}, {"food_name": "감"}])
+
+    assert len(results) == 3
+    assert results[0]["results"] == [{"id": 1}] and results[0]["error"] is None
+    assert results[1] == results[2] == {"results": [], "error": "검색 결과를 받지 못했습니다."}
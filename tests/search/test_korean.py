@@ -0,0 +1,18 @@
+from app.search.korean import extract_chosung, decompose_jamo
+
+
+def test_extract_chosung_removes_spaces_and_keeps_typed_chosung():
+    assert extract_chosung("김치찌개") == "ㄱㅊㅉㄱ"
+    assert extract_chosung("무말랭이 김치") == "ㅁㅁㄹㅇㄱㅊ"
+    assert extract_chosung("ㄱㅊ ㅉㄱ") == "ㄱㅊㅉㄱ"
+    assert extract_chosung("ABC우유2") == "abcㅇㅇ2"
+    assert extract_chosung(None) is None
+
+
+def test_decompose_jamo_splits_syllables_and_keeps_word_boundaries():
+    assert decompose_jamo("김치") == "ㄱㅣㅁㅊㅣ"
+    assert decompose_jamo("닭 갈비") == "ㄷㅏㄺ ㄱㅏㄹㅂㅣ"
+    ## 자모 하나의 오타는 분해 문자열에서 한 글자 차이로만 나타남
+    original, typo = decompose_jamo("김치찌개"), decompose_jamo("김치찌게")
+    assert len(original) == len(typo)
+    assert sum(a != b for a, b in zip(original, typo)) == 1
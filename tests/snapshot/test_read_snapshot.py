@@ -0,0 +1,95 @@
+import pytest
+
+from app.schemas.food_nutrition import FOOD_NUTRITION_FIELDS
+from app.snapshot import FoodNutritionReadSnapshot, SnapshotFormatError, write_read_snapshot
+from app.snapshot import read_snapshot
+
+
+def _row(id, food_cd, food_name, research_year="2023", maker_name=None, calorie=None):
+    row = {field: None for field in FOOD_NUTRITION_FIELDS}
+    row.update(id=id, food_cd=food_cd, food_name=food_name, research_year=research_year, maker_name=maker_name, calorie=calorie)
+    return row
+
+
+SAMPLE_ROWS = [
+    _row(1, "D003", "김치찌개", maker_name="서울", calorie=120.5),
+    _row(4, "D001", "돼지고기 김치찌개", maker_name="부산", calorie=210.0),
+    _row(7, "D002", "Apple Pie", research_year="2022", maker_name="서울"),
+    _row(9, "D004", None, research_year=None),
+]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "foods.fnsnap"
+    write_read_snapshot(SAMPLE_ROWS, str(path), source="test")
+    opened = FoodNutritionReadSnapshot(str(path))
+    yield opened
+    opened.close()
+
+
+def test_rows_round_trip_with_nulls(snapshot):
+    assert snapshot.info()["row_count"] == 4
+    assert snapshot.info()["source"] == "test"
+    assert snapshot.rows(range(4)) == SAMPLE_ROWS
+    assert snapshot.rows([2], ("id", "food_name", "calorie")) == [{"id": 7, "food_name": "Apple Pie", "calorie": None}]
+
+
+def test_lookup_by_id_and_food_cd(snapshot):
+    assert snapshot.position_for_id(4) == 1
+    assert snapshot.position_for_id(5) is None
+    assert snapshot.position_for_id(100) is None
+    assert snapshot.position_for_food_cd("D001") == 1
+    assert snapshot.position_for_food_cd("D004") == 3
+    assert snapshot.position_for_food_cd("D999") is None
+
+
+def test_find_positions_by_name_and_exact_filters(snapshot):
+    assert snapshot.find_positions() is None
+    assert snapshot.find_positions(food_name="김치").tolist() == [0, 1]
+    assert snapshot.find_positions(food_name="돼지 찌개").tolist() == [1]
+    assert snapshot.find_positions(food_name="apple").tolist() == [2]
+    assert snapshot.find_positions(food_name="김치", maker_name="서울").tolist() == [0]
+    assert snapshot.find_positions(research_year="2022").tolist() == [2]
+    assert snapshot.find_positions(maker_name="대구").tolist() == []
+    assert snapshot.find_positions(food_cd="D001", food_name="돼지").tolist() == [1]
+    assert snapshot.find_positions(food_cd="D001", food_name="apple").tolist() == []
+
+
+def test_page_returns_slice_and_total(snapshot):
+    positions, total = snapshot.page(skip=1, limit=2)
+    assert positions.tolist() == [1, 2]
+    assert total == 4
+    positions, total = snapshot.page(skip=1, limit=10, food_name="김치")
+    assert positions.tolist() == [1]
+    assert total == 2
+
+
+def test_empty_snapshot(tmp_path):
+    path = tmp_path / "empty.fnsnap"
+    write_read_snapshot([], str(path))
+    opened = FoodNutritionReadSnapshot(str(path))
+    try:
+        assert opened.page(limit=10)[1] == 0
+        assert opened.find_positions(food_name="김치").tolist() == []
+        assert opened.position_for_food_cd("D001") is None
+    finally:
+        opened.close()
+
+
+def test_rejects_unsorted_rows(tmp_path):
+    with pytest.raises(ValueError):
+        write_read_snapshot([SAMPLE_ROWS[1], SAMPLE_ROWS[0]], str(tmp_path / "bad.fnsnap"))
+
+
+def test_rejects_bad_magic_and_version(tmp_path, monkeypatch):
+    not_snapshot = tmp_path / "not_snapshot.fnsnap"
+    not_snapshot.write_bytes(b"x" * 64)
+    with pytest.raises(SnapshotFormatError):
+        FoodNutritionReadSnapshot(str(not_snapshot))
+
+    old_version = tmp_path / "old.fnsnap"
+    write_read_snapshot(SAMPLE_ROWS, str(old_version))
+    monkeypatch.setattr(read_snapshot, "SNAPSHOT_FORMAT_VERSION", read_snapshot.SNAPSHOT_FORMAT_VERSION + 1)
+    with pytest.raises(SnapshotFormatError):
+        FoodNutritionReadSnapshot(str(old_version))